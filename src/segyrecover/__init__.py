@@ -1,3 +1,7 @@
-"""SEGYRecover package."""
+"""SEGYRecover package.
+
+Heavy dependencies (OpenCV, SciPy, seisio) are imported inside the functions
+that use them, so they stay off the application's startup path.
+"""
 
 __version__ = "1.1.0"
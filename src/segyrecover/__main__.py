@@ -6,6 +6,7 @@ from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QFont
 
 from .ui.main_window import SegyRecover
+from .utils.window_utils import window_geometry
 
 if sys.platform.startswith("win"): # Ensure dark mode is disabled on Windows
     if "-platform" not in sys.argv:
@@ -33,16 +34,7 @@ def main():
     window = SegyRecover()
     window.setWindowTitle('SEGYRecover')
     
-    screen = QApplication.primaryScreen().geometry()
-    screen_width = min(screen.width(), 1920)
-    screen_height = min(screen.height(), 1080)    
-    window_width = int(screen_width * 0.9)
-    window_height = int(screen_height * 0.85)
-    pos_x = (screen_width - window_width) // 2
-    pos_y = (screen_height - window_height) // 2
-
-    
-    window.setGeometry(pos_x, pos_y, window_width, window_height)
+    window.setGeometry(*window_geometry(0.9, 0.85))
     
     window.show()
     
@@ -2,7 +2,6 @@
 
 import os
 import numpy as np
-from scipy.interpolate import Akima1DInterpolator
 from ..utils.console_utils import (
     section_header, success_message, error_message, 
     warning_message, info_message, progress_message
@@ -10,6 +9,9 @@ from ..utils.console_utils import (
 class AmplitudeExtractor:
     """Handles amplitude extraction and processing from seismic images"""
     
+    # Image rows counted per pass (and per progress update) when extracting
+    EXTRACT_ROW_CHUNK = 256
+    
     def __init__(self, progress_bar, console, work_dir):
         self.progress = progress_bar
         self.console = console
@@ -22,26 +24,33 @@ class AmplitudeExtractor:
         self.progress.start("Extracting amplitude...", image.shape[0])
 
         try:
-            black_pixel_mask = (image == 0)
-            amplitude_list = []
-
-            # Count black pixels between each pair of baselines
-            for row in range(image.shape[0]):
-                row_mask = black_pixel_mask[row]
-                row_counts = [
-                    np.sum(row_mask[baselines[i]:baselines[i + 1]]) * 100 
-                    for i in range(len(baselines) - 1)
-                ]
-                row_counts.append(np.sum(row_mask[baselines[-1]:]) * 100)
-                amplitude_list.append(row_counts)
+            n_rows, n_cols = image.shape
+            
+            # Segment bounds: [baseline i, baseline i+1) and the last baseline to
+            # the right edge, clamped like the slices they replace
+            bounds = np.clip(np.asarray(baselines, dtype=np.int64), 0, n_cols)
+            starts = bounds
+            stops = np.append(bounds[1:], n_cols)
+            
+            amplitude = np.empty((n_rows, len(bounds)), dtype=float)
+            cumulative = np.zeros((min(self.EXTRACT_ROW_CHUNK, n_rows), n_cols + 1), dtype=np.int32)
+
+            # Count black pixels between each pair of baselines for a block of
+            # rows at once, as differences of a running count along each row
+            for start in range(0, n_rows, self.EXTRACT_ROW_CHUNK):
+                stop = min(start + self.EXTRACT_ROW_CHUNK, n_rows)
+                block = cumulative[:stop - start]
+                np.cumsum(image[start:stop] == 0, axis=1, dtype=np.int32, out=block[:, 1:])
+                counts = block[:, stops] - block[:, starts]
+                # A baseline left of its predecessor makes an empty slice
+                np.maximum(counts, 0, out=counts)
+                amplitude[start:stop] = counts * 100
                 
-                self.progress.update(row)
+                self.progress.update(stop - 1)
 
                 if self.progress.wasCanceled():
                     return None
 
-            amplitude = np.array(amplitude_list, dtype=float)
-
             #self._save_array(amplitude, "raw_amplitude")
 
 
@@ -123,6 +132,8 @@ class AmplitudeExtractor:
 
     def _handle_clipping(self, amplitude):
         """Handle clipped values using Akima interpolation"""
+        from scipy.interpolate import Akima1DInterpolator
+        
         info_message(self.console, "Interpolating clipped values...")
         self.progress.start("Handling clipping...", amplitude.shape[1])
 
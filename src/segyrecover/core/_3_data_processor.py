@@ -2,13 +2,16 @@
 
 import os
 import numpy as np
-from scipy.interpolate import interp1d
 from ..utils.console_utils import (
     section_header, success_message, error_message, 
     warning_message, info_message, progress_message
 )
 class DataProcessor:
     """Handles data resampling and filtering"""
+    
+    # Traces interpolated per vectorized pass in resample_data
+    RESAMPLE_CHUNK = 256
+    
     def __init__(self, progress_bar, console, work_dir):
         self.progress = progress_bar
         self.console = console
@@ -21,17 +24,25 @@ class DataProcessor:
         self.progress.start("Resampling traces...", data.shape[1])
 
         try:
-            resampled = np.zeros((len(new_times), data.shape[1]))
+            old_times = np.asarray(old_times, dtype=np.float64)
+            new_times = np.asarray(new_times, dtype=np.float64)
+            n_traces = data.shape[1]
+            resampled = np.zeros((len(new_times), n_traces))
             
-            for i in range(data.shape[1]):
-                resample_func = interp1d(
-                    old_times, 
-                    data[:, i], 
-                    bounds_error=False, 
-                    fill_value=0
-                )
-                resampled[:, i] = resample_func(new_times)
-                self.progress.update(i)
+            # Every trace shares the same time axes, so the interpolation
+            # indices and weights are computed once. Samples outside the old
+            # axis stay zero, as with interp1d(bounds_error=False, fill_value=0).
+            inside = np.flatnonzero((new_times >= old_times[0]) & (new_times <= old_times[-1]))
+            t = new_times[inside]
+            i0 = np.clip(np.searchsorted(old_times, t, side='right') - 1, 0, len(old_times) - 2)
+            w = ((t - old_times[i0]) / (old_times[i0 + 1] - old_times[i0]))[:, None]
+            
+            for start in range(0, n_traces, self.RESAMPLE_CHUNK):
+                stop = min(start + self.RESAMPLE_CHUNK, n_traces)
+                block = data[:, start:stop]
+                lower = block[i0]
+                resampled[inside, start:stop] = lower + w * (block[i0 + 1] - lower)
+                self.progress.update(stop)
                 
                 if self.progress.wasCanceled():
                     error_message(self.console, "Resampling canceled by user.")
@@ -189,9 +200,9 @@ class DataProcessor:
                 file_path = os.path.join(save_dir, f"{name}.npy")
                 np.save(file_path, array)
                 
-                self.console.append(f"Saved {name} to {file_path}\n")
+                self.console.appendPlainText(f"Saved {name} to {file_path}\n")
             except Exception as e:
-                self.console.append(f"Error saving array {name}: {str(e)}\n")
+                self.console.appendPlainText(f"Error saving array {name}: {str(e)}\n")
 
     def _parse_tvf_intervals(self, params):
         """Parse TVF intervals from params dict, return sorted list of dicts with T1,T2,F1,F2,F3,F4."""
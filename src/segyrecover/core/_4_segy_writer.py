@@ -2,11 +2,10 @@
 
 import os
 import numpy as np
-from scipy.interpolate import interp1d
-import seisio
 from PySide6.QtWidgets import QDialog
 
 from ..ui._4_2_coords_dialogs import CoordinateAssignmentDialog
+from ..utils.cache_utils import load_geometry
 from ..utils.console_utils import (
     section_header, success_message, error_message, 
     warning_message, info_message, progress_message
@@ -18,6 +17,9 @@ class SegyFileWriter:
         self.progress = progress_bar
         self.console = console
         self.work_dir = work_dir   
+        
+        # Size in bytes of the last SEGY file written
+        self.file_size = None
          
     def assign_coordinates(self, base_name, trace):
         """Assign coordinates to trace using geometry file"""
@@ -30,19 +32,16 @@ class SegyFileWriter:
             if not os.path.exists(geometry_file):
                 raise FileNotFoundError("Geometry file not found")
 
-            # Read geometry data
-            cdp, x, y = [], [], []
-            with open(geometry_file, 'r') as file:
-                for line in file:
-                    parts = line.strip().split()
-                    cdp.append(int(parts[0]))
-                    x.append(float(parts[1]))
-                    y.append(float(parts[2]))
+            # Read geometry data, reusing the parse cached when the image was loaded
+            cdp_labels, x, y = load_geometry(self.work_dir, geometry_file, self.console)
+            cdp_values = cdp_labels.astype(np.int64)
+            cdp, x, y = cdp_values.tolist(), x.tolist(), y.tolist()
+            cdp_bounds = int(cdp_values.min()), int(cdp_values.max())
             self.progress.update(1)
 
             # Get coordinate input from user
             info_message(self.console, "Requesting coordinate input from user...")
-            coords = self._get_coordinate_input(cdp, x, y)
+            coords = self._get_coordinate_input(cdp, x, y, cdp_bounds)
             if coords is None:
                 error_message(self.console, "Coordinate assignment canceled or invalid input.")
                 return None
@@ -64,10 +63,10 @@ class SegyFileWriter:
             error_message(self.console, f"Error assigning coordinates: {str(e)}")            
             return None
             
-    def _get_coordinate_input(self, cdp, x, y):
+    def _get_coordinate_input(self, cdp, x, y, cdp_bounds=None):
         """Get user input for coordinate assignment"""
         
-        dialog = CoordinateAssignmentDialog(cdp, x, y)
+        dialog = CoordinateAssignmentDialog(cdp, x, y, cdp_bounds=cdp_bounds)
         
         if dialog.exec() == QDialog.Accepted:
             coords = dialog.get_coordinates()
@@ -106,6 +105,7 @@ class SegyFileWriter:
         baseline_params = np.linspace(0, total_distance, n_trace)
         
         # Interpolate X and Y coordinates
+        from scipy.interpolate import interp1d
         f_x = interp1d(distances, geom_x, kind='linear', bounds_error=False, fill_value='extrapolate')
         f_y = interp1d(distances, geom_y, kind='linear', bounds_error=False, fill_value='extrapolate')
         
@@ -116,8 +116,9 @@ class SegyFileWriter:
 
     def write_segy(self, data, trace, image_path, DT, F1, F2, F3, F4):
         """Create and write SEGY file"""
-        self.console.append("Creating SEGY file...\n")
+        self.console.appendPlainText("Creating SEGY file...\n")
         self.progress.start("Creating SEGY file...", 5)
+        self.file_size = None
 
         try:
             # Get dimensions and paths
@@ -145,6 +146,7 @@ class SegyFileWriter:
             trace_distances = np.sqrt((trace_diffs[:, 0])**2 + (trace_diffs[:, 1])**2)
             trace_spacing = np.mean(trace_distances)            # Create SEGY file
             info_message(self.console, "Creating SEGY container")
+            import seisio
             out = seisio.output( 
                 segy_path, 
                 ns=ns, 
@@ -233,8 +235,9 @@ class SegyFileWriter:
             out.finalize()
             self.progress.update(5)
             
+            self.file_size = os.stat(segy_path).st_size
             success_message(self.console, f"SEGY file created: {segy_path}")
-            info_message(self.console, f"File size: {os.path.getsize(segy_path) / (1024*1024):.2f} MB")
+            info_message(self.console, f"File size: {self.file_size / (1024*1024):.2f} MB")
             info_message(self.console, f"SEGY Textual Header:<br>" + "<br>".join(txt_header[:10]))
 
             return True
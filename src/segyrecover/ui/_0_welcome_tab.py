@@ -155,9 +155,11 @@ class WelcomeTab(QWidget):
     def _show_help(self):
         """Show the help dialog."""
         help_dialog = HelpDialog(self)
+        help_dialog.setAttribute(Qt.WA_DeleteOnClose)
         help_dialog.exec()
     
     def _show_about(self):
         """Show the about dialog."""
         about_dialog = AboutDialog(self)
+        about_dialog.setAttribute(Qt.WA_DeleteOnClose)
         about_dialog.exec()
@@ -2,19 +2,24 @@
 
 import os
 import numpy as np
-import cv2
-from scipy.ndimage import zoom
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, QThread, QTimer, Signal
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
-    QFrame, QSplitter, QFileDialog, QMessageBox, QGroupBox, QStyle
+    QFrame, QSplitter, QFileDialog, QMessageBox, QGroupBox, QStyle,
+    QStackedWidget, QSizePolicy
 )
-from PySide6.QtGui import QIcon
+from PySide6.QtGui import QIcon, QImage, QPixmap
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qtagg import NavigationToolbar2QT as NavigationToolbar
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.font_manager import FontProperties
 
 from ..utils.console_utils import section_header, info_message, error_message, success_message
+from ..utils.cache_utils import cache_path, load_geometry
+from ..utils.plot_utils import select_label_indices
+
+# Font shared by all CDP labels on the location plot
+_CDP_LABEL_FONT = FontProperties(size=8)
 
 class SimpleNavigationToolbar(NavigationToolbar):
     """Simplified navigation toolbar with only Home, Pan and Zoom tools."""
@@ -29,6 +34,99 @@ class SimpleNavigationToolbar(NavigationToolbar):
         self.setToolButtonStyle(Qt.ToolButtonTextBesideIcon)
 
 
+class PlotSnapshotLabel(QLabel):
+    """Static snapshot of a plot, rescaled to fit; clicking it requests the live plot."""
+    clicked = Signal()
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._snapshot = None
+        self.setAlignment(Qt.AlignCenter)
+        self.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
+        self.setCursor(Qt.PointingHandCursor)
+        self.setToolTip("Click to pan and zoom the plot")
+    
+    def set_snapshot(self, pixmap):
+        """Show pixmap, scaled to the label while keeping its aspect ratio."""
+        self._snapshot = pixmap
+        self._update_scaled()
+    
+    def _update_scaled(self):
+        if self._snapshot is None:
+            return
+        ratio = self._snapshot.devicePixelRatio()
+        scaled = self._snapshot.scaled(self.size() * ratio, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        scaled.setDevicePixelRatio(ratio)
+        self.setPixmap(scaled)
+    
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._update_scaled()
+    
+    def mousePressEvent(self, event):
+        self.clicked.emit()
+
+
+class ImageLoadWorker(QThread):
+    """Worker thread that decodes an image and builds its display preview."""
+    finished = Signal(object, object)  # image_array, display_image
+    error = Signal(str)
+    
+    def __init__(self, file_path, cache_path, use_cache):
+        super().__init__()
+        self.file_path = file_path
+        self.cache_path = cache_path
+        self.use_cache = use_cache
+        self.cache_error = None
+    
+    def run(self):
+        import cv2
+        try:
+            img_array = self._read_image()
+            if img_array is None:
+                self.error.emit("Could not load image")
+                return
+            
+            # Quarter-resolution preview; INTER_AREA averages pixels when shrinking
+            height, width = img_array.shape
+            display_img = cv2.resize(img_array, (max(1, width // 4), max(1, height // 4)),
+                                     interpolation=cv2.INTER_AREA)
+            self.finished.emit(img_array, display_img)
+        except Exception as e:
+            self.error.emit(f"Error loading image: {str(e)}")
+    
+    def _read_image(self):
+        """Read the image as grayscale, reusing the decoded array cached in CACHE."""
+        if self.use_cache:
+            # Map the cached array read-only so pages are read on demand and
+            # stay shared with the OS page cache instead of copied into memory
+            try:
+                return np.load(self.cache_path, mmap_mode='r')
+            except Exception:
+                pass
+        
+        import cv2
+        img_array = cv2.imread(self.file_path, cv2.IMREAD_GRAYSCALE)
+        if img_array is not None:
+            # Written to a temporary file and renamed into place, so an array
+            # still mapped from an older cache file is never truncated; a failed
+            # write only costs the speed-up and is reported by the tab
+            tmp_path = self.cache_path + ".tmp"
+            try:
+                os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+                with open(tmp_path, "wb") as f:
+                    np.save(f, img_array)
+                os.replace(tmp_path, self.cache_path)
+            except Exception as e:
+                self.cache_error = str(e)
+                # The replace fails on Windows while the old file is mapped
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+        return img_array
+
+
 class LoadImageTab(QWidget):
     """Tab for loading and displaying seismic images."""
     
@@ -43,15 +141,20 @@ class LoadImageTab(QWidget):
         self.work_dir = work_dir
         self.image_path = None
         self.img_array = None
+        self.worker = None
         
         # Create image canvases
-        self.image_figure = plt.figure()
+        # Plain Figures owned by their canvases, kept out of pyplot's global registry
+        self.image_figure = Figure()
         self.image_canvas = FigureCanvas(self.image_figure)
         self.image_canvas.setObjectName("image_canvas")
         self.image_ax = self.image_figure.add_subplot(111)
         
+        # Preview artist, created for the first image and updated in place after
+        self._image_artist = None
+        
         # Create location figure with constrained layout to avoid overflow
-        self.location_figure = plt.figure(constrained_layout=True)
+        self.location_figure = Figure(constrained_layout=True)
         self.location_canvas = FigureCanvas(self.location_figure)
         self.location_canvas.setObjectName("location_canvas")
         self.location_ax = self.location_figure.add_subplot(111)
@@ -59,6 +162,11 @@ class LoadImageTab(QWidget):
         self.location_ax.set_ylabel('UTM Y')
         self.location_ax.grid(True)
         
+        # The location plot does not change once drawn, so it is shown as a
+        # snapshot pixmap until the user wants to pan or zoom
+        self._freeze_location_pending = False
+        self.location_canvas.mpl_connect('draw_event', self._on_location_drawn)
+        
         self._setup_ui()
     
     def _setup_ui(self):
@@ -106,10 +214,16 @@ class LoadImageTab(QWidget):
         location_layout.setContentsMargins(15, 15, 15, 15)
         location_layout.setSpacing(10)
         
-        location_layout.addWidget(self.location_canvas)
-        location_toolbar = SimpleNavigationToolbar(self.location_canvas, self)
-        location_toolbar.setObjectName("location_toolbar")
-        location_layout.addWidget(location_toolbar)
+        self.location_snapshot = PlotSnapshotLabel()
+        self.location_snapshot.clicked.connect(self._show_live_location_plot)
+        self.location_stack = QStackedWidget()
+        self.location_stack.addWidget(self.location_canvas)
+        self.location_stack.addWidget(self.location_snapshot)
+        location_layout.addWidget(self.location_stack)
+        
+        self.location_toolbar = SimpleNavigationToolbar(self.location_canvas, self)
+        self.location_toolbar.setObjectName("location_toolbar")
+        location_layout.addWidget(self.location_toolbar)
         
         # Add panels to splitter
         splitter.addWidget(image_container)
@@ -148,36 +262,59 @@ class LoadImageTab(QWidget):
         layout.addWidget(button_container)
     
     def load_image(self):
-        """Open file dialog to select and load an image."""
+        """Open file dialog to select an image; loading continues in _load_image_file."""
         # Start in the IMAGES folder of the script directory
         images_dir = os.path.join(self.work_dir, "IMAGES")
         
-        file_path, _ = QFileDialog.getOpenFileName(
+        # Qt's own dialog opened with open() keeps the event loop running, so
+        # slow (e.g. network) folders do not freeze the application
+        dialog = QFileDialog(
             self,
             "Select Seismic Image File",
             images_dir,
             "Image Files (*.tif *.jpg *.png);;All Files (*.*)"
         )
-        
-        if not file_path:
-            return False
+        dialog.setFileMode(QFileDialog.ExistingFile)
+        dialog.setOption(QFileDialog.DontUseNativeDialog, True)
+        dialog.setAttribute(Qt.WA_DeleteOnClose)
+        dialog.fileSelected.connect(self._load_image_file)
+        dialog.open()
+    
+    def _load_image_file(self, file_path):
+        """Start decoding the selected image in a worker thread."""
+        if not file_path or self.worker is not None:
+            return
             
         section_header(self.console, "IMAGE LOADING")
         info_message(self.console, f"Loading image: {file_path}")
         
+        # Keep the interface responsive while large scans are decoded
+        self.load_button.setEnabled(False)
+        self.load_button.setText("Loading...")
+        
+        cache_path, is_fresh = self._cache_path(file_path, ".npy")
+        self.worker = ImageLoadWorker(file_path, cache_path, is_fresh)
+        self.worker.setParent(self)  # Set parent to tab for proper cleanup
+        self.worker.finished.connect(self._image_loaded)
+        self.worker.error.connect(self._image_load_failed)
+        self.worker.start()
+    
+    def _image_loaded(self, img_array, display_img):
+        """Show the decoded image and load its geometry data."""
+        if self._is_stale_worker():
+            return
+        file_path = self.worker.file_path
+        cache_error = self.worker.cache_error
+        self._cleanup_worker()
+        if cache_error:
+            info_message(self.console, f"Could not write cache file: {cache_error}")
+        
         try:
-            # Load image directly in this tab
-            img_array = cv2.imread(file_path, cv2.IMREAD_GRAYSCALE)
-            if img_array is None:
-                error_message(self.console, "Could not load image")
-                QMessageBox.warning(self, "Error", "Could not load image.")
-                return False
-
             self.image_path = file_path
             self.img_array = img_array
             
             # Display image with reduced resolution
-            self._display_image()
+            self._display_image(display_img)
             
             # Load and display geometry data
             base_name = os.path.splitext(os.path.basename(file_path))[0]
@@ -192,30 +329,64 @@ class LoadImageTab(QWidget):
             # Emit signal with loaded image information
             self.imageLoaded.emit(self.image_path, self.img_array)
             
-            return True
-            
         except Exception as e:
             error_message(self.console, f"Error loading image: {str(e)}")
-            return False
     
-    def _display_image(self):
-        """Display image at reduced resolution."""
-        # Clear previous content
-        self.image_ax.clear()
-        
-        # Create downsampled version for better performance
-        display_img = zoom(self.img_array, 0.25, order=1, prefilter=True)
+    def _image_load_failed(self, message):
+        """Report an image that could not be decoded."""
+        if self._is_stale_worker():
+            return
+        self._cleanup_worker()
+        error_message(self.console, message)
+        QMessageBox.warning(self, "Error", "Could not load image.")
+    
+    def _is_stale_worker(self):
+        """Return whether the signal comes from a worker that reset() let go.
         
-        # Display the image
-        self.image_ax.imshow(display_img, cmap='gray')
+        A decode cannot be interrupted, so reset() only forgets the worker;
+        its result is dropped here and the worker released.
+        """
+        worker = self.sender()
+        if worker is self.worker:
+            return False
+        if worker is not None:
+            worker.wait()
+            worker.deleteLater()
+        return True
+    
+    def _cleanup_worker(self):
+        """Release the finished worker and re-enable loading."""
+        if self.worker is not None:
+            self.worker.wait()
+            self.worker.deleteLater()
+            self.worker = None
+        self.load_button.setText("Load Image")
+        self.load_button.setEnabled(True)
+    
+    def _display_image(self, display_img):
+        """Display the reduced-resolution preview image."""
+        if self._image_artist is None:
+            # Clear the placeholder and create the image artist
+            self.image_ax.clear()
+            # The scan is decoded as uint8, so fixed 0-255 limits (as in the ROI
+            # and digitization views) spare matplotlib a min/max pass per image
+            self._image_artist = self.image_ax.imshow(display_img, cmap='gray', vmin=0, vmax=255)
+            self.image_ax.axis('off')
+        else:
+            # Swap the pixels into the existing artist
+            height, width = display_img.shape[:2]
+            self._image_artist.set_data(display_img)
+            self._image_artist.set_extent((-0.5, width - 0.5, height - 0.5, -0.5))
+            self.image_ax.set_xlim(-0.5, width - 0.5)
+            self.image_ax.set_ylim(height - 0.5, -0.5)
         self.image_ax.set_title("Seismic Image")
-        self.image_ax.axis('off')
         self.image_figure.tight_layout()
-        self.image_canvas.draw()
+        self.image_canvas.draw_idle()
     
     def _load_geometry_data(self, base_name):
         """Load and display geometry data."""
         # Clear previous coordinate display
+        self._show_live_location_plot()
         self.location_ax.clear()
         self.location_ax.set_xlabel('UTM X')
         self.location_ax.set_ylabel('UTM Y')
@@ -226,40 +397,31 @@ class LoadImageTab(QWidget):
         
         if not os.path.exists(geometry_file):
             error_message(self.console, "Geometry file not found.")
-            self.location_canvas.draw()
+            self.location_canvas.draw_idle()
             return False
             
         try:
-            cdp, x, y = [], [], []
-            with open(geometry_file, 'r') as file:
-                for line in file:
-                    parts = line.strip().split()
-                    cdp.append(parts[0])
-                    x.append(float(parts[1]))
-                    y.append(float(parts[2]))
+            cdp, x, y = self._read_geometry(geometry_file)
                     
             # Plot coordinates
             self.location_ax.plot(x, y, marker='o', markersize=2, color='red', linestyle='-')
             
             # Add labels with threshold to avoid overcrowding
             threshold = 1000
-            annotated_positions = []
-            for i, txt in enumerate(cdp):
-                position = (x[i], y[i])
-                if all(np.linalg.norm(np.array(position) - np.array(p)) > threshold 
-                      for p in annotated_positions):
-                    self.location_ax.annotate(txt, position)
-                    annotated_positions.append(position)
+            for i in select_label_indices(x, y, threshold):
+                self.location_ax.annotate(cdp[i], (x[i], y[i]), fontproperties=_CDP_LABEL_FONT)
                     
             self.location_ax.set_title(f"COORDINATES \"{base_name}\"")
             self.location_ax.set_aspect('equal', adjustable='datalim')
             
-            # Rotate x-axis labels to prevent overlap
-            plt.setp(self.location_ax.get_xticklabels(), rotation=45, ha='right')
+            # Rotate x-axis labels to prevent overlap; as a tick parameter this
+            # also applies to ticks created later when panning or zooming
+            self.location_ax.tick_params(axis='x', labelrotation=45)
             
-            # Use constrained_layout to avoid overflow issues
-            self.location_figure.set_constrained_layout(True)
-            self.location_canvas.draw()
+            # The figure was created with constrained_layout, so the layout is
+            # solved during this single deferred draw, which is then frozen
+            self._freeze_location_pending = True
+            self.location_canvas.draw_idle()
             
             success_message(self.console, "Geometry data loaded successfully")
             return True
@@ -268,14 +430,54 @@ class LoadImageTab(QWidget):
             error_message(self.console, f"Error loading geometry: {str(e)}")
             return False
 
+    def _on_location_drawn(self, event):
+        """Capture the first render of newly loaded geometry as a snapshot."""
+        if not self._freeze_location_pending:
+            return
+        self._freeze_location_pending = False
+        
+        buffer = np.asarray(self.location_canvas.buffer_rgba())
+        height, width = buffer.shape[:2]
+        image = QImage(buffer.data, width, height, width * 4, QImage.Format_RGBA8888).copy()
+        image.setDevicePixelRatio(self.location_canvas.devicePixelRatioF())
+        self.location_snapshot.set_snapshot(QPixmap.fromImage(image))
+        
+        # Swap widgets once matplotlib has finished painting this frame
+        QTimer.singleShot(0, self._show_frozen_location_plot)
+    
+    def _show_frozen_location_plot(self):
+        """Replace the live location canvas with its snapshot."""
+        self.location_stack.setCurrentWidget(self.location_snapshot)
+        self.location_toolbar.setVisible(False)
+    
+    def _show_live_location_plot(self):
+        """Bring back the interactive location canvas and its toolbar."""
+        self._freeze_location_pending = False
+        self.location_stack.setCurrentWidget(self.location_canvas)
+        self.location_toolbar.setVisible(True)
+
+    def _cache_path(self, source_path, extension):
+        """Return the cache file for source_path and whether it is newer than the source."""
+        return cache_path(self.work_dir, source_path, extension)
+
+    def _read_geometry(self, geometry_file):
+        """Parse a geometry file into CDP labels and X/Y lists, cached in CACHE."""
+        cdp, x, y = load_geometry(self.work_dir, geometry_file, self.console)
+        return cdp.tolist(), x.tolist(), y.tolist()
+
     def reset(self):
         """Reset the tab to its initial state."""
+        # Forget a running decode; its result is ignored when it arrives
+        self.worker = None
+        self._cleanup_worker()
+        
         # Clear the image path and array
         self.image_path = None
         self.img_array = None
         
-        # Clear image display
+        # Clear image display; the next image gets a new artist
         self.image_ax.clear()
+        self._image_artist = None
         self.image_ax.set_title("No Image Loaded")
         self.image_ax.text(0.5, 0.5, "Click 'Load Image' to begin", 
                            ha='center', va='center', transform=self.image_ax.transAxes)
@@ -284,6 +486,7 @@ class LoadImageTab(QWidget):
         self.image_canvas.draw()
         
         # Clear location display
+        self._show_live_location_plot()
         self.location_ax.clear()
         self.location_ax.set_xlabel('UTM X')
         self.location_ax.set_ylabel('UTM Y')
@@ -291,9 +494,7 @@ class LoadImageTab(QWidget):
         self.location_ax.set_title("COORDINATES")
         self.location_ax.text(0.5, 0.5, "No geometry data available", 
                               ha='center', va='center', transform=self.location_ax.transAxes)
-        self.location_figure.set_constrained_layout(True)
-        self.location_figure.set_constrained_layout(True)
-        self.location_canvas.draw()
+        self.location_canvas.draw_idle()
         
         # Disable next button
         self.next_button.setEnabled(False)# Disable next button
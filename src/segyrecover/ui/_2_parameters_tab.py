@@ -11,6 +11,125 @@ from PySide6.QtGui import QIntValidator, QFont, QPixmap, QPainter, QPen, QColor,
 from PySide6.QtCore import QPointF
 
 from ..utils.console_utils import section_header, error_message, success_message, info_message
+from ..utils.window_utils import hidpi_pixmap
+
+# Parsed .par files keyed by path, stored with the (mtime, size) they were
+# read or written at so unchanged files are not parsed again
+_PARAM_CACHE = {}
+
+def _cached_parameters(parameters_path, st=None):
+    """Return the cached values for an unchanged .par file, or None."""
+    entry = _PARAM_CACHE.get(parameters_path)
+    if entry is None:
+        return None
+    if st is None:
+        try:
+            st = os.stat(parameters_path)
+        except OSError:
+            return None
+    mtime, size, values = entry
+    return values if (st.st_mtime, st.st_size) == (mtime, size) else None
+
+def _read_parameters(parameters_path):
+    """Read a .par file as a dict of stripped strings, reusing the cache."""
+    st = os.stat(parameters_path)
+    values = _cached_parameters(parameters_path, st)
+    if values is None:
+        with open(parameters_path, "r") as f:
+            text = f.read()
+        values = {k: v.strip() for k, sep, v in (line.partition('\t') for line in text.splitlines()) if sep}
+        _PARAM_CACHE[parameters_path] = (st.st_mtime, st.st_size, values)
+    return values
+
+# Diagram pixmaps shared by every parameters tab, keyed by point id and "freq".
+# Built once a QApplication exists, since QPixmap needs one.
+_ICONS = {}
+
+def _ensure_icons(point_configs):
+    """Paint the point and frequency band diagrams on first use."""
+    if _ICONS:
+        return
+    for point_id, _, dot_rel_pos, _ in point_configs:
+        _ICONS[point_id] = _paint_point_icon(point_id, dot_rel_pos)
+    _ICONS["freq"] = _paint_freq_band_icon()
+
+def _paint_point_icon(point_id, dot_rel_pos):
+    """Paint the corner diagram for a ROI point."""
+    pixmap = hidpi_pixmap(60, 40)
+    pixmap.fill(Qt.transparent)
+    
+    painter = QPainter(pixmap)
+    painter.setPen(QPen(QColor(200, 200, 200), 1))
+    painter.setBrush(QColor(245, 245, 245))
+    painter.drawRect(5, 5, 50, 30)
+    
+    # Only the round corner dot needs antialiasing
+    corner_x = 5 if dot_rel_pos[0] == 0 else 55
+    corner_y = 5 if dot_rel_pos[1] == 0 else 35
+    painter.setPen(QPen(QColor(231, 76, 60), 1))
+    painter.setBrush(QColor(231, 76, 60))
+    painter.setRenderHint(QPainter.Antialiasing, True)
+    painter.drawEllipse(corner_x - 3, corner_y - 3, 6, 6)
+    painter.setRenderHint(QPainter.Antialiasing, False)
+    painter.setPen(QColor(50, 50, 50))
+    painter.drawText(corner_x + (5 if dot_rel_pos[0] == 0 else -12), corner_y + (12 if dot_rel_pos[1] == 0 else -5), point_id)
+    painter.end()
+    
+    return pixmap
+
+def _paint_freq_band_icon():
+    """Paint the frequency band diagram."""
+    pixmap = hidpi_pixmap(160, 120)  # Increased size for better spacing
+    pixmap.fill(Qt.transparent)
+    
+    painter = QPainter(pixmap)
+    
+    # Draw axes
+    painter.setPen(QPen(QColor(100, 100, 100), 1.5))
+    painter.drawLine(20, 80, 120, 80)  # X-axis
+    painter.drawLine(20, 20, 20, 60)  # Y-axis
+    
+    # Draw labels
+    painter.setPen(QColor(80, 80, 80))
+    painter.setFont(QFont("Arial", 8))
+    painter.drawText(60, 105, "Frequency")  
+    painter.save()
+    painter.translate(10, 60)
+    painter.rotate(-90)
+    painter.drawText(20, 0, "Amplitude")          
+    painter.restore()
+    
+    # Draw filter shape
+    painter.setPen(QPen(QColor(231, 76, 60), 2)) 
+    painter.setBrush(QColor(231, 76, 60, 60))  
+    
+    # Create frequency filter shape
+    points = [
+        QPointF(20, 80),     # Start at origin
+        QPointF(30, 80),     # F1: Low cut-off (no amplitude)
+        QPointF(50, 40),     # F2: Low pass (full amplitude)
+        QPointF(90, 40),     # F3: High pass (full amplitude)
+        QPointF(120, 80),    # F4: High cut-off (no amplitude)
+        QPointF(20, 80)      # Back to origin
+    ]
+    
+    # The slanted filter edges are the only shapes that need antialiasing
+    painter.setRenderHint(QPainter.Antialiasing, True)
+    painter.drawPolygon(QPolygonF(points))
+    painter.setRenderHint(QPainter.Antialiasing, False)
+    
+    # Draw frequency markers
+    markers = [
+        (30, "F1"), (50, "F2"), (90, "F3"), (120, "F4")
+    ]
+    
+    painter.setPen(QColor(231, 76, 60))
+    for x, label in markers:
+        painter.drawLine(x, 80, x, 75)  
+        painter.drawText(x - 7, 90, label) 
+
+    painter.end()
+    return pixmap
 
 class ParametersTab(QWidget):
     """Tab for configuring processing parameters."""
@@ -28,61 +147,64 @@ class ParametersTab(QWidget):
         self.image_path = None
         self.param_widgets = {}  # Central registry of parameter widgets
         
+        # Every parameter is an integer, so one validator serves all inputs
+        self._int_validator = QIntValidator(self)
+        
         # Define all parameters with their metadata
         self.PARAMETERS = {
             # Point parameters
-            "Trace_P1": {"group": "Points", "default": 1, "validator": QIntValidator()},
-            "TWT_P1": {"group": "Points", "default": "", "validator": QIntValidator()},
-            "Trace_P2": {"group": "Points", "default": "", "validator": QIntValidator()},
-            "TWT_P2": {"group": "Points", "default": "", "validator": QIntValidator()},
-            "Trace_P3": {"group": "Points", "default": "", "validator": QIntValidator()},
-            "TWT_P3": {"group": "Points", "default": "", "validator": QIntValidator()},
+            "Trace_P1": {"group": "Points", "default": 1},
+            "TWT_P1": {"group": "Points", "default": ""},
+            "Trace_P2": {"group": "Points", "default": ""},
+            "TWT_P2": {"group": "Points", "default": ""},
+            "Trace_P3": {"group": "Points", "default": ""},
+            "TWT_P3": {"group": "Points", "default": ""},
             
             # Acquisition parameters
-            "DT": {"group": "Acquisition", "default": "", "validator": QIntValidator(), 
+            "DT": {"group": "Acquisition", "default": "", 
                   "label": "Sample Rate (ms)", "tooltip": "Time interval between samples in milliseconds"},
             
             # Frequency parameters
-            "F1": {"group": "Frequency", "default": 10, "validator": QIntValidator(), "tooltip": "Low cut-off"},
-            "F2": {"group": "Frequency", "default": 12, "validator": QIntValidator(), "tooltip": "Low pass"},
-            "F3": {"group": "Frequency", "default": 50, "validator": QIntValidator(), "tooltip": "High pass"},
-            "F4": {"group": "Frequency", "default": 60, "validator": QIntValidator(), "tooltip": "High cut-off"},
+            "F1": {"group": "Frequency", "default": 10, "tooltip": "Low cut-off"},
+            "F2": {"group": "Frequency", "default": 12, "tooltip": "Low pass"},
+            "F3": {"group": "Frequency", "default": 50, "tooltip": "High pass"},
+            "F4": {"group": "Frequency", "default": 60, "tooltip": "High cut-off"},
             
             # Detection parameters
-            "TLT": {"group": "Detection", "default": 1, "validator": QIntValidator(), 
+            "TLT": {"group": "Detection", "default": 1, 
                    "label": "Traceline Thickness", "tooltip": "Thickness of vertical trace lines"},
-            "HLT": {"group": "Detection", "default": 5, "validator": QIntValidator(), 
+            "HLT": {"group": "Detection", "default": 5, 
                    "label": "Timeline Thickness", "tooltip": "Thickness of horizontal time lines"},
-            "HE": {"group": "Detection", "default": 100, "validator": QIntValidator(), 
+            "HE": {"group": "Detection", "default": 100, 
                   "label": "Horizontal Erode", "tooltip": "Erosion size for horizontal features"},
-            "BDB": {"group": "Detection", "default": 20, "validator": QIntValidator(), 
+            "BDB": {"group": "Detection", "default": 20, 
                    "label": "Baseline Detection Beginning", "tooltip": "Start of baseline detection range (pixels from top)"},
-            "BDE": {"group": "Detection", "default": 500, "validator": QIntValidator(), 
+            "BDE": {"group": "Detection", "default": 500, 
                    "label": "Baseline Detection End", "tooltip": "End of baseline detection range (pixels from top)"},
-            "BFT": {"group": "Detection", "default": 80, "validator": QIntValidator(), 
+            "BFT": {"group": "Detection", "default": 80, 
                    "label": "Baseline Filter Threshold", "tooltip": "Threshold value (0-100) for baseline filtering"},
                    
             # TVBP parameters - explicitly define all interval fields
-            "TVF_1_T1": {"group": "TVBP", "default": 0, "validator": QIntValidator(), "interval": 1, "field": "T1"},
-            "TVF_1_T2": {"group": "TVBP", "default": 1000, "validator": QIntValidator(), "interval": 1, "field": "T2"},
-            "TVF_1_F1": {"group": "TVBP", "default": 10, "validator": QIntValidator(), "interval": 1, "field": "F1"},
-            "TVF_1_F2": {"group": "TVBP", "default": 12, "validator": QIntValidator(), "interval": 1, "field": "F2"},
-            "TVF_1_F3": {"group": "TVBP", "default": 50, "validator": QIntValidator(), "interval": 1, "field": "F3"},
-            "TVF_1_F4": {"group": "TVBP", "default": 60, "validator": QIntValidator(), "interval": 1, "field": "F4"},
-            
-            "TVF_2_T1": {"group": "TVBP", "default": 1000, "validator": QIntValidator(), "interval": 2, "field": "T1"},
-            "TVF_2_T2": {"group": "TVBP", "default": 2000, "validator": QIntValidator(), "interval": 2, "field": "T2"},
-            "TVF_2_F1": {"group": "TVBP", "default": 10, "validator": QIntValidator(), "interval": 2, "field": "F1"},
-            "TVF_2_F2": {"group": "TVBP", "default": 12, "validator": QIntValidator(), "interval": 2, "field": "F2"},
-            "TVF_2_F3": {"group": "TVBP", "default": 50, "validator": QIntValidator(), "interval": 2, "field": "F3"},
-            "TVF_2_F4": {"group": "TVBP", "default": 60, "validator": QIntValidator(), "interval": 2, "field": "F4"},
-            
-            "TVF_3_T1": {"group": "TVBP", "default": 2000, "validator": QIntValidator(), "interval": 3, "field": "T1"},
-            "TVF_3_T2": {"group": "TVBP", "default": 4000, "validator": QIntValidator(), "interval": 3, "field": "T2"},
-            "TVF_3_F1": {"group": "TVBP", "default": 10, "validator": QIntValidator(), "interval": 3, "field": "F1"},
-            "TVF_3_F2": {"group": "TVBP", "default": 12, "validator": QIntValidator(), "interval": 3, "field": "F2"},
-            "TVF_3_F3": {"group": "TVBP", "default": 50, "validator": QIntValidator(), "interval": 3, "field": "F3"},
-            "TVF_3_F4": {"group": "TVBP", "default": 60, "validator": QIntValidator(), "interval": 3, "field": "F4"}
+            "TVF_1_T1": {"group": "TVBP", "default": 0, "interval": 1, "field": "T1"},
+            "TVF_1_T2": {"group": "TVBP", "default": 1000, "interval": 1, "field": "T2"},
+            "TVF_1_F1": {"group": "TVBP", "default": 10, "interval": 1, "field": "F1"},
+            "TVF_1_F2": {"group": "TVBP", "default": 12, "interval": 1, "field": "F2"},
+            "TVF_1_F3": {"group": "TVBP", "default": 50, "interval": 1, "field": "F3"},
+            "TVF_1_F4": {"group": "TVBP", "default": 60, "interval": 1, "field": "F4"},
+            
+            "TVF_2_T1": {"group": "TVBP", "default": 1000, "interval": 2, "field": "T1"},
+            "TVF_2_T2": {"group": "TVBP", "default": 2000, "interval": 2, "field": "T2"},
+            "TVF_2_F1": {"group": "TVBP", "default": 10, "interval": 2, "field": "F1"},
+            "TVF_2_F2": {"group": "TVBP", "default": 12, "interval": 2, "field": "F2"},
+            "TVF_2_F3": {"group": "TVBP", "default": 50, "interval": 2, "field": "F3"},
+            "TVF_2_F4": {"group": "TVBP", "default": 60, "interval": 2, "field": "F4"},
+            
+            "TVF_3_T1": {"group": "TVBP", "default": 2000, "interval": 3, "field": "T1"},
+            "TVF_3_T2": {"group": "TVBP", "default": 4000, "interval": 3, "field": "T2"},
+            "TVF_3_F1": {"group": "TVBP", "default": 10, "interval": 3, "field": "F1"},
+            "TVF_3_F2": {"group": "TVBP", "default": 12, "interval": 3, "field": "F2"},
+            "TVF_3_F3": {"group": "TVBP", "default": 50, "interval": 3, "field": "F3"},
+            "TVF_3_F4": {"group": "TVBP", "default": 60, "interval": 3, "field": "F4"}
         }
         
         # Define visual information for point inputs
@@ -106,6 +228,7 @@ class ParametersTab(QWidget):
         self.tvf_intervals = []
         
         # Setup UI
+        _ensure_icons(self.POINT_CONFIGS)
         self._setup_ui()
         
     def _create_parameter_input(self, param_id, width=60):
@@ -114,7 +237,7 @@ class ParametersTab(QWidget):
         
         input_field = QLineEdit(self)
         input_field.setFixedWidth(width)
-        input_field.setValidator(param_info.get("validator", QIntValidator()))
+        input_field.setValidator(param_info.get("validator", self._int_validator))
         input_field.setAlignment(Qt.AlignCenter)
         input_field.setObjectName(f"input_{param_id}")
         input_field.setToolTip(param_info.get("tooltip", ""))
@@ -239,25 +362,7 @@ class ParametersTab(QWidget):
             
             # Create diagram
             icon = QLabel(self)
-            pixmap = QPixmap(60, 40)
-            pixmap.fill(Qt.transparent)
-            
-            painter = QPainter(pixmap)
-            painter.setRenderHint(QPainter.Antialiasing)
-            painter.setPen(QPen(QColor(200, 200, 200), 1))
-            painter.setBrush(QColor(245, 245, 245))
-            painter.drawRect(5, 5, 50, 30)
-            
-            corner_x = 5 if dot_rel_pos[0] == 0 else 55
-            corner_y = 5 if dot_rel_pos[1] == 0 else 35
-            painter.setPen(QPen(QColor(231, 76, 60), 1))
-            painter.setBrush(QColor(231, 76, 60))
-            painter.drawEllipse(corner_x - 3, corner_y - 3, 6, 6)
-            painter.setPen(QColor(50, 50, 50))
-            painter.drawText(corner_x + (5 if dot_rel_pos[0] == 0 else -12), corner_y + (12 if dot_rel_pos[1] == 0 else -5), point_id)
-            painter.end()
-            
-            icon.setPixmap(pixmap)
+            icon.setPixmap(_ICONS[point_id])
             icon.setFixedSize(60, 40)
             icon.setAlignment(Qt.AlignCenter)
             horizontal_layout.addWidget(icon)
@@ -385,55 +490,7 @@ class ParametersTab(QWidget):
     def _create_freq_band_icon(self):
         """Create frequency band diagram."""
         icon = QLabel(self)
-        pixmap = QPixmap(160, 120)  # Increased size for better spacing
-        pixmap.fill(Qt.transparent)
-        
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        # Draw axes
-        painter.setPen(QPen(QColor(100, 100, 100), 1.5))
-        painter.drawLine(20, 80, 120, 80)  # X-axis
-        painter.drawLine(20, 20, 20, 60)  # Y-axis
-        
-        # Draw labels
-        painter.setPen(QColor(80, 80, 80))
-        painter.setFont(QFont("Arial", 8))
-        painter.drawText(60, 105, "Frequency")  
-        painter.save()
-        painter.translate(10, 60)
-        painter.rotate(-90)
-        painter.drawText(20, 0, "Amplitude")          
-        painter.restore()
-        
-        # Draw filter shape
-        painter.setPen(QPen(QColor(231, 76, 60), 2)) 
-        painter.setBrush(QColor(231, 76, 60, 60))  
-        
-        # Create frequency filter shape
-        points = [
-            QPointF(20, 80),     # Start at origin
-            QPointF(30, 80),     # F1: Low cut-off (no amplitude)
-            QPointF(50, 40),     # F2: Low pass (full amplitude)
-            QPointF(90, 40),     # F3: High pass (full amplitude)
-            QPointF(120, 80),    # F4: High cut-off (no amplitude)
-            QPointF(20, 80)      # Back to origin
-        ]
-        
-        painter.drawPolygon(QPolygonF(points))
-        
-        # Draw frequency markers
-        markers = [
-            (30, "F1"), (50, "F2"), (90, "F3"), (120, "F4")
-        ]
-        
-        painter.setPen(QColor(231, 76, 60))
-        for x, label in markers:
-            painter.drawLine(x, 80, x, 75)  
-            painter.drawText(x - 7, 90, label) 
-
-        painter.end()
-        icon.setPixmap(pixmap)
+        icon.setPixmap(_ICONS["freq"])
         icon.setFixedSize(140, 100)  
         return icon
     
@@ -569,7 +626,7 @@ class ParametersTab(QWidget):
         
         # Create Start time field (t1)
         t1 = QLineEdit(self)
-        t1.setValidator(QIntValidator())
+        t1.setValidator(self._int_validator)
         t1.setAlignment(Qt.AlignCenter)
         t1.setFixedWidth(60)
         self.tvf_grid.addWidget(t1, row, 0)
@@ -577,7 +634,7 @@ class ParametersTab(QWidget):
         
         # Create End time field (t2)
         t2 = QLineEdit(self)
-        t2.setValidator(QIntValidator())
+        t2.setValidator(self._int_validator)
         t2.setAlignment(Qt.AlignCenter)
         t2.setFixedWidth(60)
         self.tvf_grid.addWidget(t2, row, 1)
@@ -586,7 +643,7 @@ class ParametersTab(QWidget):
         # Create F1-F4 fields
         for i in range(4):
             f = QLineEdit(self)
-            f.setValidator(QIntValidator())
+            f.setValidator(self._int_validator)
             f.setAlignment(Qt.AlignCenter)
             f.setFixedWidth(60)
             self.tvf_grid.addWidget(f, row, i + 2)
@@ -631,33 +688,30 @@ class ParametersTab(QWidget):
             if param_id in self.param_widgets:
                 self.param_widgets[param_id].setText(str(param_info.get("default", "")))
     
+    # Basic parameter checks as (check, message); a message is reported when
+    # its check returns False. Built once for the class.
+    _VALIDATIONS = (
+        (lambda pv: pv["DT"] > 0, "Sample rate must be > 0"),
+        (lambda pv: pv["F4"] > pv["F3"], "F4 must be > F3"),
+        (lambda pv: pv["F3"] > pv["F2"], "F3 must be > F2"),
+        (lambda pv: pv["F2"] > pv["F1"], "F2 must be > F1"),
+        (lambda pv: pv["F1"] > 0, "F1 must be > 0"),
+        (lambda pv: pv["TWT_P3"] > pv["TWT_P1"], "TWT_P3 must be > TWT_P1"),
+        (lambda pv: pv["BDB"] < pv["BDE"], "BDB must be < BDE"),
+        (lambda pv: pv["BDB"] >= 0, "BDB must be >= 0"),
+        (lambda pv: 0 <= pv["BFT"] <= 100, "BFT must be between 0 and 100"),
+        (lambda pv: pv["TLT"] > 0, "Timeline thickness must be > 0"),
+        (lambda pv: pv["HLT"] > 0, "Horizontal line thickness must be > 0"),
+        (lambda pv: pv["HE"] > 0, "Horizontal erosion must be > 0"),
+        (lambda pv: pv["Trace_P1"] >= 0, "Trace_P1 must be >= 0"),
+        (lambda pv: pv["Trace_P2"] >= 0, "Trace_P2 must be >= 0"),
+        (lambda pv: pv["Trace_P3"] >= 0, "Trace_P3 must be >= 0"),
+    )
+
     def _validate_parameters(self, param_values):
         """Validate parameter values and return a list of validation errors."""
-        errors = []
-        
         # Basic parameter validations
-        validations = [
-            (param_values["DT"] > 0, "Sample rate must be > 0"),
-            (param_values["F4"] > param_values["F3"], "F4 must be > F3"),
-            (param_values["F3"] > param_values["F2"], "F3 must be > F2"),
-            (param_values["F2"] > param_values["F1"], "F2 must be > F1"),
-            (param_values["F1"] > 0, "F1 must be > 0"),
-            (param_values["TWT_P3"] > param_values["TWT_P1"], "TWT_P3 must be > TWT_P1"),
-            (param_values["BDB"] < param_values["BDE"], "BDB must be < BDE"),
-            (param_values["BDB"] >= 0, "BDB must be >= 0"),
-            (param_values["BFT"] >= 0 and param_values["BFT"] <= 100, "BFT must be between 0 and 100"),
-            (param_values["TLT"] > 0, "Timeline thickness must be > 0"),
-            (param_values["HLT"] > 0, "Horizontal line thickness must be > 0"),
-            (param_values["HE"] > 0, "Horizontal erosion must be > 0"),
-            (param_values["Trace_P1"] >= 0, "Trace_P1 must be >= 0"),
-            (param_values["Trace_P2"] >= 0, "Trace_P2 must be >= 0"),
-            (param_values["Trace_P3"] >= 0, "Trace_P3 must be >= 0")
-        ]
-        
-        # Check each validation
-        for condition, message in validations:
-            if not condition:
-                errors.append(message)
+        errors = [message for check, message in self._VALIDATIONS if not check(param_values)]
                 
         # TVBP-specific validations if enabled
         tvf_enabled = "TVF_ENABLED" in param_values and param_values["TVF_ENABLED"] == 1
@@ -685,9 +739,9 @@ class ParametersTab(QWidget):
                 if t2 <= t1:
                     errors.append(f"TVBP interval {i}: End time must be > Start time")
                 
-                # Validate frequency order
-                f_values = [param_values[f"TVF_{i}_F{j}"] for j in range(1, 5)]
-                if not all(f_values[j] > f_values[j-1] for j in range(1, 4)) or f_values[0] <= 0:
+                # Validate frequency order with one chained comparison
+                f1, f2, f3, f4 = (param_values[f"TVF_{i}_F{j}"] for j in range(1, 5))
+                if not 0 < f1 < f2 < f3 < f4:
                     errors.append(f"TVBP interval {i}: Frequencies must be in order F4 > F3 > F2 > F1 > 0")
         
         return errors
@@ -716,9 +770,7 @@ class ParametersTab(QWidget):
         # Try to load parameters from file
         if os.path.exists(parameters_path):
             try:
-                with open(parameters_path, "r") as f:
-                    file_params = dict(line.split('\t') for line in f if '\t' in line)
-                    params.update({k: v.strip() for k, v in file_params.items()})
+                params.update(_read_parameters(parameters_path))
                 
                 # TVF support
                 tvf_enabled = params.get("TVF_ENABLED", "0") == "1"
@@ -805,36 +857,36 @@ class ParametersTab(QWidget):
         parameters_path = os.path.join(parameters_dir, f"{base_name}.par")
 
         try:
-            # Collect all parameter values
+            # Collect all parameter values in one pass over the registered
+            # fields; TVF fields are skipped unless TVF is enabled
+            tvf_enabled = self.tvf_enable_checkbox.isChecked()
             param_values = {}
-            
-            # Get values from all registered parameter widgets
             for param_id, widget in self.param_widgets.items():
+                text = widget.text()
+                if not tvf_enabled and param_id.startswith("TVF_"):
+                    continue
                 try:
-                    param_values[param_id] = int(widget.text()) if widget.text() else 0
-                except ValueError:
-                    raise ValueError(f"Invalid value for {param_id}")
+                    param_values[param_id] = int(text) if text else 0
+                except ValueError as e:
+                    raise ValueError(f"Invalid value for {param_id}") from e
             
-            # Handle TVF enabled flag
-            tvf_enabled = self.tvf_enable_checkbox.isChecked()
             if tvf_enabled:
                 param_values["TVF_ENABLED"] = 1
-            else:
-                # If TVF is disabled, remove TVF parameters from output
-                for param_id in list(param_values.keys()):
-                    if param_id.startswith("TVF_"):
-                        del param_values[param_id]
 
             # Validate all parameters
             errors = self._validate_parameters(param_values)
             if errors:
                 raise ValueError("\n".join(errors))
 
-            # Save parameters
+            # Save parameters, skipping the write when the file already
+            # holds these values
             os.makedirs(parameters_dir, exist_ok=True)
-            with open(parameters_path, "w") as f:
-                for param, value in param_values.items():
-                    f.write(f"{param}\t{value}\n")
+            saved_values = {param: str(value) for param, value in param_values.items()}
+            if _cached_parameters(parameters_path) != saved_values:
+                with open(parameters_path, "w") as f:
+                    f.write("".join(f"{param}\t{value}\n" for param, value in saved_values.items()))
+                st = os.stat(parameters_path)
+                _PARAM_CACHE[parameters_path] = (st.st_mtime, st.st_size, saved_values)
 
             # Update our saved parameters
             self.parameters = param_values
@@ -870,27 +922,30 @@ class ParametersTab(QWidget):
             "Detection Settings": ["TLT", "HLT", "HE", "BDB", "BDE", "BFT"]
         }
 
+        # Build the whole summary and append it to the console in one call
+        lines = []
         for category, params in param_categories.items():
-            self.console.insertHtml(f'<br><b>{category}:</b><br>')
+            lines.append(f'<br><b>{category}:</b>')
             for param in params:
                 if param in param_values:
                     value = param_values[param]
-                    self.console.insertHtml(f'&nbsp;&nbsp;&bull; <b>{param}:</b> {value}<br>')
+                    lines.append(f'&nbsp;&nbsp;&bull; <b>{param}:</b> {value}')
 
         # TVF output
         tvf_enabled = "TVF_ENABLED" in param_values and param_values["TVF_ENABLED"] == 1
         if tvf_enabled:
-            self.console.insertHtml("<br><b>Time-Variant Bandpass Intervals:</b><br>")
+            lines.append("<br><b>Time-Variant Bandpass Intervals:</b>")
             for idx in range(1, 4):
                 if all(f"TVF_{idx}_{field}" in param_values for field in ["T1", "T2", "F1", "F2", "F3", "F4"]):
-                    self.console.insertHtml(
+                    lines.append(
                         f'&nbsp;&nbsp;&bull; <b>Interval {idx}:</b> '
                         f'{param_values[f"TVF_{idx}_T1"]}–{param_values[f"TVF_{idx}_T2"]} ms, '
                         f'F1={param_values[f"TVF_{idx}_F1"]}, '
                         f'F2={param_values[f"TVF_{idx}_F2"]}, '
                         f'F3={param_values[f"TVF_{idx}_F3"]}, '
-                        f'F4={param_values[f"TVF_{idx}_F4"]}<br>'
+                        f'F4={param_values[f"TVF_{idx}_F4"]}'
                     )
+        self.console.appendHtml("<br>".join(lines))
 
         # Create the parameters path for the success message
         parameters_dir = os.path.join(self.work_dir, "PARAMETERS")
@@ -899,23 +954,23 @@ class ParametersTab(QWidget):
     
     def get_parameters(self):
         """Return all parameters as a dictionary."""
-        params = {}
-        
-        # Get values from all registered parameter widgets
-        for param_id, widget in self.param_widgets.items():
-            try:
-                params[param_id] = int(widget.text() or 0)
-            except ValueError:
-                params[param_id] = 0
-        
-        # Handle TVF enabled flag
+        # TVF parameters are only included when TVF is enabled
         tvf_enabled = self.tvf_enable_checkbox.isChecked()
+        params = {
+            param_id: self._text_to_int(widget.text())
+            for param_id, widget in self.param_widgets.items()
+            if tvf_enabled or not param_id.startswith("TVF_")
+        }
+        
         if tvf_enabled:
             params["TVF_ENABLED"] = 1
-        else:
-            # If TVF is disabled, remove TVF parameters from output
-            for param_id in list(params.keys()):
-                if param_id.startswith("TVF_"):
-                    del params[param_id]
         
-        return params
\ No newline at end of file
+        return params
+    
+    @staticmethod
+    def _text_to_int(text):
+        """Convert an input field's text to int, treating empty or partial input as 0."""
+        try:
+            return int(text or 0)
+        except ValueError:
+            return 0
\ No newline at end of file
@@ -2,10 +2,21 @@
 
 import os
 import numpy as np
-import cv2
 import math
-from scipy.ndimage import zoom
 from ..utils.console_utils import info_message, error_message, success_message
+from ..utils.image_utils import to_uint8
+
+def _scale_points(points, scale, shape=None):
+    """Scale an (N, 2) array of x, y points and round them to integer pixels.
+    
+    With an image ``shape`` the points are clipped to it in the same pass,
+    so any number of points costs three array operations.
+    """
+    scaled = np.rint(np.asarray(points, dtype=np.float64).reshape(-1, 2) * scale).astype(np.int64)
+    if shape is not None:
+        height, width = shape[:2]
+        np.clip(scaled, 0, (width - 1, height - 1), out=scaled)
+    return scaled
 
 class ROIProcessor:
     """Handles ROI processing, transformations, and file operations."""
@@ -20,16 +31,34 @@ class ROIProcessor:
         self.rectified_image = None
         self.binary_rectified_image = None
         self.downsample_factor = 1
+        self.display_scale = 1.0
+        
+        # Destination buffer reused by the perspective warp while the ROI is refined
+        self._warp_buffer = None
         
         # Maximum image dimension for display (pixels)
         self.MAX_DISPLAY_DIMENSION = 2000
+        
+        # Highest downsampling factor, for quality
+        self.MAX_DOWNSAMPLE_FACTOR = 4
+        
+        # Display rows averaged per pass when downsampling
+        self.DOWNSAMPLE_ROW_CHUNK = 1024
     
     def set_image(self, image_path, img_array):
-        """Set the image to process."""
+        """Set the image to process.
+        
+        Returning to the ROI step with the same image keeps the existing
+        display image and warp buffer; only the selection state is reset.
+        """
+        same_image = img_array is self.img_array and image_path == self.image_path
         self.image_path = image_path
         self.img_array = img_array
-        self.downsample_factor = self._calculate_adaptive_downsample_factor()
-        self.display_image = self._downsample_image(self.img_array, self.downsample_factor)
+        if not same_image:
+            self.downsample_factor = self._calculate_adaptive_downsample_factor()
+            self.display_scale = 1.0 / self.downsample_factor
+            self.display_image = to_uint8(self._downsample_image(self.img_array, self.downsample_factor))
+            self._warp_buffer = None
         self.points = []
         self.rectified_image = None
         self.binary_rectified_image = None
@@ -43,62 +72,86 @@ class ROIProcessor:
         height, width = self.img_array.shape
         max_dim = max(height, width)
         
-        # No downsampling needed for small images
-        if max_dim <= self.MAX_DISPLAY_DIMENSION:
-            return 1
-            
         # Calculate factor to make the largest dimension fit within MAX_DISPLAY_DIMENSION
         factor = max(1, math.ceil(max_dim / self.MAX_DISPLAY_DIMENSION))
         
-        # Cap the factor at 4 for quality
-        return min(factor, 4)
+        # Cap the factor for quality
+        return min(factor, self.MAX_DOWNSAMPLE_FACTOR)
+    
+    # Image types cv2.resize handles; anything else (or a failed resize) is
+    # averaged with NumPy
+    _CV2_RESIZE_DTYPES = frozenset(map(np.dtype, (np.uint8, np.uint16, np.int16, np.float32, np.float64)))
     
     def _downsample_image(self, image, factor):
-        """Downsample image using a high-quality method."""
+        """Downsample image by averaging factor x factor pixel blocks."""
         if factor <= 1:
             return image
             
         try:
-            # Use zoom for better quality downsampling
-            scale_factor = 1.0 / factor
-            return zoom(image, scale_factor, order=1, prefilter=True)
+            f = int(factor)
+            height, width = image.shape
+            out_height, out_width = height // f, width // f
+            
+            if image.dtype in self._CV2_RESIZE_DTYPES:
+                # INTER_AREA with an integer factor is exactly the f x f block
+                # mean, computed by OpenCV's SIMD resize in one pass
+                import cv2
+                try:
+                    return cv2.resize(image[:out_height * f, :out_width * f], (out_width, out_height),
+                                      interpolation=cv2.INTER_AREA)
+                except cv2.error:
+                    # OpenCV reports allocation and layout failures as cv2.error;
+                    # fall back to the row-chunked NumPy average below
+                    pass
+            
+            result = np.empty((out_height, out_width), dtype=image.dtype)
+            round_result = np.issubdtype(image.dtype, np.integer)
+            
+            # Average in blocks of display rows to cap the temporary float buffer
+            for start in range(0, out_height, self.DOWNSAMPLE_ROW_CHUNK):
+                stop = min(start + self.DOWNSAMPLE_ROW_CHUNK, out_height)
+                block = image[start * f:stop * f, :out_width * f].reshape(stop - start, f, out_width, f)
+                mean = block.mean(axis=(1, 3), dtype=np.float32)
+                if round_result:
+                    np.rint(mean, out=mean)
+                result[start:stop] = mean
+            return result
         except MemoryError:
-            # Fallback to simpler method if memory error occurs
-            return image[::factor, ::factor]
+            # Fallback to simpler method if memory error occurs; cropped to the
+            # same whole blocks so the display keeps the block mean's shape
+            return image[:out_height * f:f, :out_width * f:f]
     
     def display_to_original(self, x, y):
         """Convert coordinates from display to original image space."""
         if x is None or y is None:
             return None, None
-            
-        # Scale coordinates
-        orig_x = round(x * self.downsample_factor)
-        orig_y = round(y * self.downsample_factor)
         
-        # Ensure coordinates are within bounds
-        if self.img_array is not None:
-            height, width = self.img_array.shape
-            orig_x = max(0, min(orig_x, width - 1))
-            orig_y = max(0, min(orig_y, height - 1))
-        
-        return orig_x, orig_y
+        orig_x, orig_y = self.display_to_original_array((x, y))[0]
+        return int(orig_x), int(orig_y)
     
     def original_to_display(self, x, y):
         """Convert coordinates from original to display space."""
         if x is None or y is None:
             return None, None
-            
-        # Scale coordinates
-        display_x = round(x / self.downsample_factor)
-        display_y = round(y / self.downsample_factor)
         
+        display_x, display_y = self.original_to_display_array((x, y))[0]
+        return int(display_x), int(display_y)
+    
+    def display_to_original_array(self, points):
+        """Convert an (N, 2) array of display coordinates to original image space."""
         # Ensure coordinates are within bounds
-        if self.display_image is not None:
-            height, width = self.display_image.shape
-            display_x = max(0, min(display_x, width - 1))
-            display_y = max(0, min(display_y, height - 1))
+        shape = self.img_array.shape if self.img_array is not None else None
+        return _scale_points(points, self.downsample_factor, shape)
+    
+    def original_to_display_array(self, points, clip=True):
+        """Convert an (N, 2) array of original coordinates to display space.
         
-        return display_x, display_y
+        Drawing callers can pass ``clip=False``: matplotlib clips artists to
+        the axes itself, so the bounds check is only needed for pixel access.
+        """
+        # Ensure coordinates are within bounds
+        shape = self.display_image.shape if clip and self.display_image is not None else None
+        return _scale_points(points, self.display_scale, shape)
     
     def calculate_fourth_point(self):
         """Calculate the fourth point based on the first three points."""
@@ -112,30 +165,46 @@ class ROIProcessor:
             return p4
         return None
     
-    def process_roi(self):
-        """Process the selected ROI and generate rectified image."""
+    def process_roi(self, save_points=True):
+        """Process the selected ROI and generate rectified image.
+        
+        ``save_points`` can be disabled when the points were just loaded
+        from the ROI file, so the file is not rewritten unchanged.
+        """
         if len(self.points) != 4 or self.img_array is None:
             error_message(self.console, "ROI selection failed: Invalid ROI or missing image.")
             return False
 
+        import cv2
+        
         try:
             info_message(self.console, "Calculating perspective transformation...")
             
             # Apply perspective transform using original coordinates
-            pts1 = np.float32(self.points)
-            width = int(np.linalg.norm(np.array(self.points[0]) - np.array(self.points[1])))
-            height = int(np.linalg.norm(np.array(self.points[0]) - np.array(self.points[2])))
+            pts1 = np.asarray(self.points, dtype=np.float32)
+            p0, p1, p2 = self.points[:3]
+            width = int(math.hypot(p0[0] - p1[0], p0[1] - p1[1]))
+            height = int(math.hypot(p0[0] - p2[0], p0[1] - p2[1]))
             pts2 = np.float32([[0, 0], [width, 0], [0, height], [width, height]])
             matrix = cv2.getPerspectiveTransform(pts1, pts2)
-            self.rectified_image = cv2.warpPerspective(self.img_array, matrix, (width, height))
-        
-                
+            
+            # Warp into a reused buffer, only growing it when the ROI gets larger
+            buffer = self._warp_buffer
+            if buffer is None or buffer.shape[0] < height or buffer.shape[1] < width:
+                buffer_shape = (height, width) if buffer is None else (
+                    max(height, buffer.shape[0]), max(width, buffer.shape[1]))
+                buffer = self._warp_buffer = np.empty(buffer_shape, dtype=self.img_array.dtype)
+            self.rectified_image = cv2.warpPerspective(
+                self.img_array, matrix, (width, height),
+                dst=buffer[:height, :width], flags=cv2.INTER_LINEAR
+            )
+            
             # Convert to binary image with explicit handling
             ret, self.binary_rectified_image = cv2.threshold(self.rectified_image, 128, 255, cv2.THRESH_BINARY)
 
             # Save ROI points
-            roi_path = self._get_roi_path()
-            self.save_roi_points(roi_path)
+            if save_points:
+                self.save_roi_points(self._get_roi_path())
             
             success_message(self.console, "Seismic section cropped and rectified.")
             return True
@@ -180,9 +249,9 @@ class ROIProcessor:
             
         try:
             os.makedirs(os.path.dirname(roi_path), exist_ok=True)
+            # Build the whole payload and write it in a single call
             with open(roi_path, "w") as f:
-                for point in self.points:
-                    f.write(f"{point[0]} {point[1]}\n")
+                f.write("".join(f"{x} {y}\n" for x, y in self.points))
             success_message(self.console, f"ROI points saved to: {os.path.basename(roi_path)}")
             return True
         except Exception as e:
@@ -1,7 +1,7 @@
 """ROI Selection tab for SEGYRecover application."""
 
 import os
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QTimer
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
     QGroupBox, QSplitter, QMessageBox, QDialog, QTabWidget
@@ -9,10 +9,11 @@ from PySide6.QtWidgets import (
 from PySide6.QtGui import QIcon
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qtagg import NavigationToolbar2QT as NavigationToolbar
-import matplotlib.pyplot as plt
 from matplotlib.figure import Figure
 
-from ..utils.console_utils import info_message, error_message, success_message, section_header
+from ..utils.console_utils import (
+    info_message, error_message, success_message, warning_message, section_header
+)
 from ._3_1_roi_selection_logic import ROIProcessor
 
 class SimpleNavigationToolbar(NavigationToolbar):
@@ -56,18 +57,56 @@ class ROISelectionTab(QWidget):
         self.line_width = 2
         self.annotation_offset = 10
         
-        # Create image canvases
-        self.figure = Figure(constrained_layout=True)
+        # Artist styles shared by every point/edge drawn on the ROI overlay.
+        # Overlay artists are animated so they are blitted over the cached image.
+        self._point_kw = dict(color='red', marker='o', linestyle='', markersize=self.marker_size, animated=True)
+        self._annotation_kw = dict(
+            xytext=(self.annotation_offset, self.annotation_offset),
+            textcoords='offset points', animated=True
+        )
+        self._edge_kw = dict(color='blue', linestyle='-', linewidth=self.line_width, animated=True)
+        
+        # Rendered image backdrop, captured after each full canvas draw
+        self._background = None
+        
+        # Point confirmation dialog, built on the first click and reused after,
+        # and the (index, name, x, y) of the point it is asking about
+        self._confirm_box = None
+        self._pending_point = None
+        
+        # Create image canvases. The images only change when a new one is
+        # loaded, so fixed margins replace a layout solve on every full draw
+        self.figure = Figure()
+        self.figure.subplots_adjust(left=0.08, right=0.98, bottom=0.06, top=0.94)
         self.canvas = FigureCanvas(self.figure)
         self.canvas.setObjectName("roi_original_canvas")
         self.canvas.mpl_connect('button_press_event', self.on_click)
+        self.canvas.mpl_connect('draw_event', self._on_canvas_draw)
         self.ax = self.figure.add_subplot(111)
         
-        self.rectified_figure = Figure(constrained_layout=True)
+        # Persistent artists: the image backdrop (created on the first image),
+        # one Line2D for all markers, one for the ROI outline and one label per corner
+        self._image_artist = None
+        
+        # Grayscale display image the backdrop artist currently holds
+        self._image_source = None
+        self._points_line, = self.ax.plot([], [], **self._point_kw)
+        self._edges_line, = self.ax.plot([], [], **self._edge_kw)
+        self._overlay_artists = [self._points_line, self._edges_line]
+        self._point_texts = [
+            self.ax.annotate(str(i + 1), (0, 0), visible=False, **self._annotation_kw)
+            for i in range(4)
+        ]
+        
+        self.rectified_figure = Figure()
+        self.rectified_figure.subplots_adjust(left=0.08, right=0.98, bottom=0.06, top=0.94)
         self.rectified_canvas = FigureCanvas(self.rectified_figure)
         self.rectified_canvas.setObjectName("roi_rectified_canvas")
         self.rectified_ax = self.rectified_figure.add_subplot(111)
         
+        # Rectified image artist, created on the first ROI and updated in place
+        self._rectified_artist = None
+        
         self._setup_ui()
     
     def _setup_ui(self):
@@ -234,26 +273,19 @@ class ROISelectionTab(QWidget):
         """Update the tab with the loaded image and prepare for ROI selection."""
 
         section_header(self.console, "ROI SELECTION")
+        
+        # Let the tab paint first; downsampling and rendering run on the next event loop pass
+        self.status_label.setText("Loading image...")
+        QTimer.singleShot(0, lambda: self._show_image(image_path, img_array))
+    
+    def _show_image(self, image_path, img_array):
+        """Downsample and display the image, then offer an existing ROI."""
+        self.status_label.setText("")
         info_message(self.console, "Ready to select region of interest.")
 
         # Set the image in the processor
         self.roi_processor.set_image(image_path, img_array)
         
-        # Check if existing ROI file exists and offer to load it
-        if self.roi_processor.check_existing_roi():
-            reply = QMessageBox.question(
-                self,
-                "Existing ROI",
-                "An existing ROI file was found. Do you want to use it?",
-                QMessageBox.Yes | QMessageBox.No
-            )
-            
-            if reply == QMessageBox.Yes:
-                self.roi_processor.load_roi_points()
-                success_message(self.console, "Loaded existing ROI from file.")
-                self.process_roi()
-                return
-        
         # Reset state
         self.next_button.setEnabled(False)
         self.retry_selection_button.setEnabled(False)
@@ -267,17 +299,56 @@ class ROISelectionTab(QWidget):
             "1. Top-Left, 2. Top-Right, 3. Bottom-Left. The fourth point will be calculated automatically."
         )
         
-        # Clear and update image canvas
-        self.ax.clear()
-        self.ax.imshow(self.roi_processor.display_image, cmap='gray', aspect='equal')
-        self.ax.set_title("Original Image - Select Points")
-        self.canvas.draw()
+        # Show the new image, reusing the backdrop artist after the first image
+        # The 8-bit image is colormapped with fixed limits after resampling to
+        # screen size, so no data min/max scan runs
+        source = self.roi_processor.display_image
+        if self._image_artist is None:
+            self._image_artist = self.ax.imshow(source, cmap='gray', vmin=0, vmax=255, interpolation='nearest', aspect='equal')
+            self.ax.set_title("Original Image - Select Points")
+            # The limits follow the image; overlay updates never rescale the view
+            self.ax.set_autoscale_on(False)
+        else:
+            height, width = source.shape[:2]
+            # Coming back with the same image keeps the artist's data;
+            # only the view is reset
+            if source is not self._image_source:
+                self._image_artist.set_data(source)
+                self._image_artist.set_extent((-0.5, width - 0.5, height - 0.5, -0.5))
+            self.ax.set_xlim(-0.5, width - 0.5)
+            self.ax.set_ylim(height - 0.5, -0.5)
+            # Forget the previous image's pan/zoom history
+            self.toolbar.update()
+        self._image_source = source
+        self._background = None
+        self._clear_overlay()
         
         # Clear rectified image canvas
-        self.rectified_ax.clear()
-        self.rectified_ax.set_title("Rectified Image (select ROI first)")
-        self.rectified_canvas.draw()
+        self._clear_rectified_image()
+        
+        # Offer an existing ROI file once; accepting it completes the selection
+        if self.roi_processor.check_existing_roi() and self._prompt_use_existing_roi():
+            if len(self.roi_processor.load_roi_points()) == 4:
+                success_message(self.console, "Loaded existing ROI from file.")
+                self.update_display()
+                self.canvas.draw_idle()
+                self.process_roi(save_points=False)
+                return
+            
+            warning_message(self.console, "Existing ROI file is incomplete. Please select the points manually.")
+            self.roi_processor.clear_points()
         
+        self.canvas.draw_idle()
+    
+    def _prompt_use_existing_roi(self):
+        """Ask whether the ROI file found for the current image should be used."""
+        reply = QMessageBox.question(
+            self,
+            "Existing ROI",
+            "An existing ROI file was found. Do you want to use it?",
+            QMessageBox.Yes | QMessageBox.No
+        )
+        return reply == QMessageBox.Yes
             
     def activate_point_selection(self, point_idx):
         """Activate point selection mode for the specific point."""
@@ -419,120 +490,135 @@ class ROISelectionTab(QWidget):
         # Convert coordinates to original image space
         orig_x, orig_y = self.roi_processor.display_to_original(event.xdata, event.ydata)
         
-        # Create confirmation dialog
-        msg_box = QMessageBox()
-        msg_box.setIcon(QMessageBox.Question)
-        msg_box.setWindowTitle("Confirm Point")
+        # Ask for confirmation, reusing the dialog built on the first click.
+        # The box is opened window-modal without a nested event loop, so
+        # pending canvas draws still run; the answer arrives in a slot
         point_name = self.point_labels[self.active_point_index].split('(')[0].strip()
-        msg_box.setText(f"Confirm {point_name} point at coordinates:\nX: {orig_x}\nY: {orig_y}")
-        msg_box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
-        msg_box.setDefaultButton(QMessageBox.Yes)
-        
-        if msg_box.exec() == QMessageBox.Yes:
-            # If this point was already set, replace it
-            if self.active_point_index < len(self.roi_processor.points):
-                self.roi_processor.points[self.active_point_index] = (orig_x, orig_y)
-                # Redraw everything
-                self.update_display()
-            else:
-                # Add new point
-                self.roi_processor.points.append((orig_x, orig_y))
-                
-                # Draw the point
-                self.ax.plot(event.xdata, event.ydata, 'ro', markersize=self.marker_size)
-                
-                # Draw number next to point
-                point_num = self.active_point_index + 1
-                self.ax.annotate(str(point_num), 
-                        (event.xdata, event.ydata),
-                        xytext=(self.annotation_offset, self.annotation_offset),
-                        textcoords='offset points')
-            
-            # Exit selection mode
-            self.deactivate_point_selection()
-            
-            # Log the selection
-            info_message(self.console, f"Selected {point_name} point")
-            
-            # If we have all three points, calculate the fourth point
-            if len(self.roi_processor.points) == 3:
-                self.calculate_and_draw_fourth_point()
-                self.process_roi()
-            
-            self.canvas.draw()
+        confirm_box = self._point_confirm_box()
+        confirm_box.setText(f"Confirm {point_name} point at coordinates:\nX: {orig_x}\nY: {orig_y}")
+        self._pending_point = (self.active_point_index, point_name, orig_x, orig_y)
+        confirm_box.open()
+    
+    def _finish_point_confirmation(self, button):
+        """Store the point from the last click if it was confirmed."""
+        pending, self._pending_point = self._pending_point, None
+        if pending is None or self._confirm_box.standardButton(button) != QMessageBox.Yes:
+            return
+        point_index, point_name, orig_x, orig_y = pending
+        
+        # If this point was already set, replace it
+        if point_index < len(self.roi_processor.points):
+            self.roi_processor.points[point_index] = (orig_x, orig_y)
+        else:
+            self.roi_processor.points.append((orig_x, orig_y))
+        
+        # Exit selection mode
+        self.deactivate_point_selection()
+        
+        # Log the selection
+        info_message(self.console, f"Selected {point_name} point")
+        
+        # If we have all three points, calculate the fourth point
+        complete_roi = len(self.roi_processor.points) == 3
+        if complete_roi:
+            self.calculate_and_draw_fourth_point()
+        else:
+            self.update_display()
+        
+        # Single overlay refresh once the whole overlay for this click is built
+        self._refresh_overlay()
+        
+        if complete_roi:
+            self.process_roi()
+    
+    def _point_confirm_box(self):
+        """Return the point confirmation dialog, creating it on first use."""
+        if self._confirm_box is None:
+            self._confirm_box = QMessageBox(self)
+            self._confirm_box.setIcon(QMessageBox.Question)
+            self._confirm_box.setWindowTitle("Confirm Point")
+            self._confirm_box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+            self._confirm_box.setDefaultButton(QMessageBox.Yes)
+            self._confirm_box.buttonClicked.connect(self._finish_point_confirmation)
+        return self._confirm_box
     
     def calculate_and_draw_fourth_point(self):
         """Calculate and draw the fourth point of the quadrilateral."""
         if len(self.roi_processor.points) == 3:
             # Calculate the fourth point using the processor
-            p4 = self.roi_processor.calculate_fourth_point()
-            
-            # Convert to display coordinates
-            display_p4x, display_p4y = self.roi_processor.original_to_display(p4[0], p4[1])
-            
-            # Draw fourth point
-            self.ax.plot(display_p4x, display_p4y, 'ro', markersize=self.marker_size)
-            self.ax.annotate('4', (display_p4x, display_p4y), 
-               xytext=(self.annotation_offset, self.annotation_offset),
-               textcoords='offset points')
+            self.roi_processor.calculate_fourth_point()
             
-            # Draw lines connecting all points
-            display_points = [
-                self.roi_processor.original_to_display(p[0], p[1]) 
-                for p in self.roi_processor.points
-            ]
-            dp1, dp2, dp3, dp4 = display_points
-            
-            self.ax.plot([dp1[0], dp2[0]], [dp1[1], dp2[1]], 'b-', linewidth=self.line_width)
-            self.ax.plot([dp1[0], dp3[0]], [dp1[1], dp3[1]], 'b-', linewidth=self.line_width)
-            self.ax.plot([dp2[0], dp4[0]], [dp2[1], dp4[1]], 'b-', linewidth=self.line_width)
-            self.ax.plot([dp3[0], dp4[0]], [dp3[1], dp4[1]], 'b-', linewidth=self.line_width)
-            
-            self.canvas.draw()
+            # Draw all four points and the lines connecting them
+            self.update_display()
             
             info_message(self.console, "Fourth point calculated automatically")
     
     def update_display(self):
-        """Redraw the display with current points."""
-        self.ax.clear()
-        self.ax.imshow(self.roi_processor.display_image, cmap='gray', aspect='equal')
-        
-        # Draw all existing points
-        for i, point in enumerate(self.roi_processor.points):
-            display_x, display_y = self.roi_processor.original_to_display(point[0], point[1])
-            self.ax.plot(display_x, display_y, 'ro', markersize=self.marker_size)
-            self.ax.annotate(str(i+1), (display_x, display_y),
-                      xytext=(self.annotation_offset, self.annotation_offset),
-                      textcoords='offset points')
+        """Rebuild the point overlay; the caller redraws the canvas once."""
+        # Reset markers, edges and labels; the artists themselves are kept
+        self._clear_overlay()
         
-        # If we have all four points, draw the connecting lines
-        if len(self.roi_processor.points) == 4:
-            display_points = [
-                self.roi_processor.original_to_display(p[0], p[1]) 
-                for p in self.roi_processor.points
-            ]
-            dp1, dp2, dp3, dp4 = display_points
-            
-            self.ax.plot([dp1[0], dp2[0]], [dp1[1], dp2[1]], 'b-', linewidth=self.line_width)
-            self.ax.plot([dp1[0], dp3[0]], [dp1[1], dp3[1]], 'b-', linewidth=self.line_width)
-            self.ax.plot([dp2[0], dp4[0]], [dp2[1], dp4[1]], 'b-', linewidth=self.line_width)
-            self.ax.plot([dp3[0], dp4[0]], [dp3[1], dp4[1]], 'b-', linewidth=self.line_width)
+        # Draw all existing points as a single Line2D
+        # Points come from clamped clicks or the ROI file; drawing needs no bounds check
+        display_points = self.roi_processor.original_to_display_array(self.roi_processor.points, clip=False)
+        self._points_line.set_data(display_points[:, 0], display_points[:, 1])
+        for i, (display_x, display_y) in enumerate(display_points):
+            self._set_point_label(i, display_x, display_y)
         
-        self.canvas.draw()
+        # If we have all four points, draw the connecting lines
+        if len(display_points) == 4:
+            self._draw_roi_edges(display_points)
+    
+    def _draw_roi_edges(self, display_points):
+        """Draw the four edges of the ROI from a (4, 2) array of display points."""
+        # Trace the outline P1 -> P2 -> P4 -> P3 -> P1 as one polyline
+        outline = display_points[[0, 1, 3, 2, 0]]
+        self._edges_line.set_data(outline[:, 0], outline[:, 1])
+    
+    def _on_canvas_draw(self, event):
+        """Cache the rendered image and draw the overlay on top of it."""
+        self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._draw_overlay_artists()
+    
+    def _draw_overlay_artists(self):
+        """Render the animated point markers, edges and labels."""
+        for artist in self._overlay_artists:
+            self.ax.draw_artist(artist)
+        for text in self._point_texts:
+            self.ax.draw_artist(text)
+    
+    def _refresh_overlay(self):
+        """Repaint only the overlay over the cached image backdrop."""
+        if self._background is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._background)
+        self._draw_overlay_artists()
+        self.canvas.blit(self.ax.bbox)
     
-    def process_roi(self):
+    def _clear_overlay(self):
+        """Empty the point markers and edges and hide the point labels."""
+        for artist in self._overlay_artists:
+            artist.set_data([], [])
+        for text in self._point_texts:
+            text.set_visible(False)
+    
+    def _set_point_label(self, index, x, y):
+        """Move the label of point ``index`` to (x, y) and show it."""
+        text = self._point_texts[index]
+        text.xy = (x, y)
+        text.set_visible(True)
+    
+    def process_roi(self, save_points=True):
         """Process the selected ROI and generate rectified image."""
         if len(self.roi_processor.points) != 4:
             error_message(self.console, "Invalid ROI or missing image")
             return
         
         # Process the ROI using the processor
-        if self.roi_processor.process_roi():
+        if self.roi_processor.process_roi(save_points):
             # Display the rectified image
-            self.rectified_ax.clear()
-            self.rectified_ax.imshow(self.roi_processor.binary_rectified_image, cmap='gray', aspect='equal')
-            self.rectified_ax.set_title("Rectified Image")
-            self.rectified_canvas.draw()
+            self._show_rectified_image(self.roi_processor.binary_rectified_image)
             
             # Update UI state
             self.update_ui_state()
@@ -546,6 +632,31 @@ class ROISelectionTab(QWidget):
                 self.roi_processor.binary_rectified_image
             )
     
+    def _show_rectified_image(self, image):
+        """Show the rectified image, reusing its artist after the first ROI."""
+        height, width = image.shape
+        if self._rectified_artist is None:
+            # The binary image only holds 0 and 255: fixed limits skip the
+            # data min/max scan and nearest sampling skips resampling blends
+            self._rectified_artist = self.rectified_ax.imshow(
+                image, cmap='gray', vmin=0, vmax=255, interpolation='nearest', aspect='equal')
+            self.rectified_ax.set_autoscale_on(False)
+        else:
+            self._rectified_artist.set_data(image)
+            self._rectified_artist.set_extent((-0.5, width - 0.5, height - 0.5, -0.5))
+            self._rectified_artist.set_visible(True)
+        self.rectified_ax.set_xlim(-0.5, width - 0.5)
+        self.rectified_ax.set_ylim(height - 0.5, -0.5)
+        self.rectified_ax.set_title("Rectified Image")
+        self.rectified_canvas.draw_idle()
+    
+    def _clear_rectified_image(self):
+        """Hide the rectified image until a new ROI is processed."""
+        if self._rectified_artist is not None:
+            self._rectified_artist.set_visible(False)
+        self.rectified_ax.set_title("Rectified Image (select ROI first)")
+        self.rectified_canvas.draw_idle()
+    
     def retry_selection(self):
         """Clear all points and restart selection."""
         # Clear points in the processor
@@ -553,11 +664,10 @@ class ROISelectionTab(QWidget):
         
         # Reset the display
         self.update_display()
+        self._refresh_overlay()
         
         # Clear rectified image
-        self.rectified_ax.clear()
-        self.rectified_ax.set_title("Rectified Image (select ROI first)")
-        self.rectified_canvas.draw()
+        self._clear_rectified_image()
         
         # Update UI state
         self.next_button.setEnabled(False)
@@ -78,6 +78,15 @@ class DigitizationProcessor:
     
     def run_digitization(self, step_callback=None):
         """ Run the complete digitization process. """
+        return self.run_processing_steps(step_callback) and self.finish_digitization(step_callback)
+    
+    def run_processing_steps(self, step_callback=None):
+        """ Run steps 1-4 (timelines, baselines, amplitudes, resampling and filtering).
+        
+        These steps involve no dialogs, so they can run in a worker thread as
+        long as the console and progress bar given to the processor forward
+        their calls to the GUI thread.
+        """
 
         if not self._validate_inputs():
             return False
@@ -91,6 +100,8 @@ class DigitizationProcessor:
                 error_message(self.console, "Step 1 failed: Timeline removal unsuccessful.")
                 return False
             success_message(self.console, "Step 1 completed: Timelines removed successfully.")
+            if self._was_canceled():
+                return False
 
             # Step 2: Detect baselines
             info_message(self.console, "Starting Step 2: Detect baselines")
@@ -98,6 +109,8 @@ class DigitizationProcessor:
                 error_message(self.console, "Step 2 failed: Baseline detection unsuccessful.")
                 return False
             success_message(self.console, "Step 2 completed: Baselines detected successfully.")
+            if self._was_canceled():
+                return False
 
             # Step 3: Extract amplitudes
             info_message(self.console, "Starting Step 3: Extract amplitudes")
@@ -105,6 +118,8 @@ class DigitizationProcessor:
                 error_message(self.console, "Step 3 failed: Amplitude extraction unsuccessful.")
                 return False
             success_message(self.console, "Step 3 completed: Amplitudes extracted successfully.")
+            if self._was_canceled():
+                return False
 
             # Step 4: Process data
             info_message(self.console, "Starting Step 4: Resample and filter data")
@@ -112,7 +127,29 @@ class DigitizationProcessor:
                 error_message(self.console, "Step 4 failed: Data processing unsuccessful.")
                 return False
             success_message(self.console, "Step 4 completed: Data resampled and filtered successfully.")
-
+            
+            return True
+            
+        except Exception as e:
+            import traceback
+            error_message(self.console, f"Digitization failed: {str(e)}")
+            error_message(self.console, traceback.format_exc())
+            return False
+    
+    def _was_canceled(self):
+        """Return whether the run was canceled, reporting it once between steps."""
+        if self.progress.wasCanceled():
+            warning_message(self.console, "Digitization canceled.")
+            return True
+        return False
+    
+    def finish_digitization(self, step_callback=None):
+        """ Run step 5 (SEGY creation) and show the summary.
+        
+        Coordinates may be requested through a dialog, so this must run on
+        the GUI thread.
+        """
+        try:
             # Step 5: Create SEGY
             info_message(self.console, "Starting Step 5: Create SEGY file")
             if not self._create_segy(step_callback):
@@ -261,7 +298,7 @@ class DigitizationProcessor:
         base_name = os.path.splitext(os.path.basename(self.image_path))[0]
         self.segy_path = os.path.join(self.work_dir, "SEGY", f"{base_name}.segy")
         
-        self.segy_writer.write_segy(
+        if not self.segy_writer.write_segy(
             self.filtered_data,
             self.final_baselines,
             self.image_path,
@@ -270,7 +307,8 @@ class DigitizationProcessor:
             self.parameters["F2"],
             self.parameters["F3"],
             self.parameters["F4"]
-        )
+        ):
+            return False
         
         if step_callback:
             step_callback(4, {'segy_path': self.segy_path})
@@ -290,7 +328,7 @@ class DigitizationProcessor:
             "Time range": f"{self.parameters['TWT_P1']} - {self.parameters['TWT_P3']} ms",
             "Filter applied": f"{self.parameters['F1']}-{self.parameters['F2']}-{self.parameters['F3']}-{self.parameters['F4']} Hz",
             "Output file": self.segy_path,
-            "File size": f"{os.path.getsize(self.segy_path) / (1024*1024):.2f} MB"
+            "File size": f"{self.segy_writer.file_size / (1024*1024):.2f} MB"
         })
 
         success_message(self.console, "Digitization completed successfully!")
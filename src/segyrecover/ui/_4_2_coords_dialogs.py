@@ -1,67 +1,105 @@
 """Common dialog classes used across the application."""
 
-import os
-import math
-import numpy as np
-from PySide6.QtCore import Qt, QPointF
-from PySide6.QtGui import QPixmap, QPen, QPainter, QColor, QPolygonF
+from PySide6.QtCore import Qt, QLine, QPoint, QPointF
+from PySide6.QtGui import (QPen, QPainter, QColor, QPolygon, QPolygonF,
+    QPainterPath, QBrush, QFont, QFontMetrics, QTransform, QPixmapCache, QStaticText)
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
-    QGroupBox, QMessageBox, QApplication, QSplitter, QRadioButton, QWidget
+    QGroupBox, QSplitter, QRadioButton, QButtonGroup, QWidget,
+    QGraphicsView, QGraphicsScene, QGraphicsItem
 )
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.backends.backend_qtagg import NavigationToolbar2QT as NavigationToolbar
-from matplotlib.figure import Figure
-import matplotlib.pyplot as plt
 
-class SimpleNavigationToolbar(NavigationToolbar):
-    """Simplified navigation toolbar with only Home, Pan and Zoom tools."""
+from ..utils.window_utils import centered_geometry, hidpi_pixmap, device_pixel_ratio
+from ..utils.plot_utils import select_label_indices
+
+class LocationMapView(QGraphicsView):
+    """Lightweight map view: wheel to zoom, drag to pan, double-click to fit."""
     
-    # Define which tools to keep
-    toolitems = [t for t in NavigationToolbar.toolitems if t[0] in ('Home', 'Pan', 'Zoom', 'Save')]
+    ZOOM_STEP = 1.25
     
-    def __init__(self, canvas, parent):
-        super().__init__(canvas, parent)
-        
-        # Configure the toolbar to show text labels
-        self.setToolButtonStyle(Qt.ToolButtonTextBesideIcon)
+    def __init__(self, scene, parent=None):
+        super().__init__(scene, parent)
+        self.setDragMode(QGraphicsView.ScrollHandDrag)
+        self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
+        self.setToolTip("Wheel to zoom, drag to pan, double-click to reset the view")
+        
+        # Keep the whole line in view until the user zooms
+        self._fit_on_resize = True
+    
+    def fit_scene(self):
+        """Fit the scene in the view with UTM Y pointing up."""
+        self._fit_on_resize = True
+        self.setTransform(QTransform.fromScale(1, -1))
+        self.fitInView(self.sceneRect(), Qt.KeepAspectRatio)
+    
+    def wheelEvent(self, event):
+        self._fit_on_resize = False
+        factor = self.ZOOM_STEP if event.angleDelta().y() > 0 else 1 / self.ZOOM_STEP
+        self.scale(factor, factor)
+    
+    def mouseDoubleClickEvent(self, event):
+        self.fit_scene()
+    
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if self._fit_on_resize:
+            self.fit_scene()
 
 class CoordinateAssignmentDialog(QDialog):
     """Dialog for assigning coordinates to traces with geographic direction detection."""
     
-    def __init__(self, cdp_range, x_coords=None, y_coords=None, parent=None):
+    def __init__(self, cdp_range, x_coords=None, y_coords=None, parent=None, cdp_bounds=None):
         super().__init__(parent)
         self.setWindowTitle("Assign coordinates to traces")
-        self.resize(900, 600)  # Larger size to accommodate the location plot
-        
-        screen = QApplication.primaryScreen().geometry()
-        screen_width = min(screen.width(), 1920)
-        screen_height = min(screen.height(), 1080)
-
-        pos_x = (screen_width - 900) // 2
-        pos_y = (screen_height - 600) // 2
-        self.move(pos_x, pos_y)
+        # Larger size to accommodate the location plot, set in one geometry change
+        self.setGeometry(*centered_geometry(900, 600))
         
         self.cdp_range = cdp_range
-        self.min_cdp = min(cdp_range)
-        self.max_cdp = max(cdp_range)
+        # Callers holding the CDPs as an array can pass their (min, max) to
+        # skip scanning the list in Python
+        if cdp_bounds is None:
+            cdp_bounds = min(cdp_range), max(cdp_range)
+        self.min_cdp, self.max_cdp = cdp_bounds
+        
+        # (first, last) CDPs indexed by the direction ids
+        self._coord_pairs = ((self.min_cdp, self.max_cdp), (self.max_cdp, self.min_cdp))
         self.x_coords = x_coords
         self.y_coords = y_coords
         
+        # Labels of the five diagram ticks, low to high; both diagrams use them
+        self._sample_labels = tuple(str(cdp) for cdp in self._diagram_sample_points())
         
-        # Create location plot figure
-        self.location_figure = plt.figure(constrained_layout=True)
-        self.location_canvas = FigureCanvas(self.location_figure)
-        self.location_canvas.setMinimumHeight(250)
-        self.location_ax = self.location_figure.add_subplot(111)
+        # Widgets, plots and diagrams are built on first show
+        self._built = False
+    
+    def showEvent(self, event):
+        """Build the user interface the first time the dialog is shown."""
+        if not self._built:
+            self._build_ui()
+        super().showEvent(event)
+    
+    def done(self, result):
+        """Drop the location map items as soon as the dialog is closed."""
+        if self._built:
+            self.location_scene.clear()
+        super().done(result)
+    
+    def _build_ui(self):
+        """Create the location plot and the dialog widgets."""
+        self._built = True
+        
+        # Location map drawn with Qt graphics items; a static polyline does
+        # not need a matplotlib figure
+        self.location_scene = QGraphicsScene(self)
+        self.location_view = LocationMapView(self.location_scene)
+        self.location_view.setMinimumHeight(250)
         
         # Setup main layout
         self._setup_ui()
         
         # Display location plot if coordinates are available
-        if x_coords and y_coords:
+        if self.x_coords and self.y_coords:
             self._display_location_plot()
-            
    
     def _setup_ui(self):
         """Set up the dialog's user interface."""
@@ -87,9 +125,7 @@ class CoordinateAssignmentDialog(QDialog):
             location_layout.setContentsMargins(10, 10, 10, 10)
             location_layout.setSpacing(5)
             
-            location_layout.addWidget(self.location_canvas)
-            location_toolbar = SimpleNavigationToolbar(self.location_canvas, self)
-            location_layout.addWidget(location_toolbar)
+            location_layout.addWidget(self.location_view)
             
             splitter.addWidget(location_container)
         
@@ -97,6 +133,10 @@ class CoordinateAssignmentDialog(QDialog):
         visual_group = QGroupBox("CDP Direction")
         visual_layout = QVBoxLayout(visual_group)
         visual_layout.setSpacing(10)
+        
+        # The radios sit in separate containers, so exclusivity comes from a group
+        self.direction_group = QButtonGroup(self)
+        self.direction_group.setExclusive(True)
 
         # Direction 1: Maps to the geographic direction indicated by CDP increase
         direction1_text = "<b>First trace</b> → CDP {}<br><b>Last trace</b> → CDP {}".format(self.min_cdp, self.max_cdp)
@@ -105,6 +145,7 @@ class CoordinateAssignmentDialog(QDialog):
         self.direction1_radio = self._create_direction_option(
             direction1_text,
             direction1_tooltip,
+            self.LOW_TO_HIGH,
             True  
         )
         
@@ -114,7 +155,8 @@ class CoordinateAssignmentDialog(QDialog):
         
         self.direction2_radio = self._create_direction_option(
             direction2_text,
-            direction2_tooltip
+            direction2_tooltip,
+            self.HIGH_TO_LOW
         )
         
         
@@ -122,11 +164,12 @@ class CoordinateAssignmentDialog(QDialog):
         # Add visual representations
         visual_layout.addWidget(self.direction1_radio)
         visual_layout.addSpacing(10)
-        visual_layout.addWidget(self._create_direction_diagram(True))
+        increasing_diagram, decreasing_diagram = self._direction_diagrams()
+        visual_layout.addWidget(self._create_direction_diagram(increasing_diagram))
         
         visual_layout.addWidget(self.direction2_radio)
         visual_layout.addSpacing(10)
-        visual_layout.addWidget(self._create_direction_diagram(False))
+        visual_layout.addWidget(self._create_direction_diagram(decreasing_diagram))
         
         visual_group.setLayout(visual_layout)
         splitter.addWidget(visual_group)
@@ -146,67 +189,61 @@ class CoordinateAssignmentDialog(QDialog):
         layout.addLayout(button_layout)  
         
     def _display_location_plot(self):
-        """Display the location plot with CDP points and directions."""
-
-        self.location_ax.clear()
-        self.location_ax.set_xlabel('UTM X')
-        self.location_ax.set_ylabel('UTM Y')
-        self.location_ax.grid(True)
-        self.location_ax.set_title("CDP Coordinates Map")
+        """Display the location map with CDP points and the first/last CDP highlighted."""
+        scene = self.location_scene
+        scene.clear()
         
         try:
             # Convert CDP range to strings for annotation
             cdp_str = [str(cdp) for cdp in self.cdp_range]
+            points = [QPointF(x, y) for x, y in zip(self.x_coords, self.y_coords)]
             
-            # Plot coordinates
-            self.location_ax.plot(self.x_coords, self.y_coords, marker='o', markersize=2, 
-                                 color='red', linestyle='-')
-            
-            # Highlight the start and end points with larger markers
-            self.location_ax.plot([self.x_coords[0]], [self.y_coords[0]], marker='o', 
-                                 markersize=6, color='green')
-            self.location_ax.plot([self.x_coords[-1]], [self.y_coords[-1]], marker='o', 
-                                 markersize=6, color='blue')
+            # Profile line; cosmetic pens keep a constant on-screen width
+            line_pen = QPen(QColor("red"), 1)
+            line_pen.setCosmetic(True)
+            path = QPainterPath()
+            path.addPolygon(QPolygonF(points))
+            scene.addPath(path, line_pen)
             
-
-
+            # Point markers and labels are sized in screen pixels
+            self._add_marker(points[0], 6, QColor("green"))
+            self._add_marker(points[-1], 6, QColor("blue"))
+            for point in points[1:-1]:
+                self._add_marker(point, 2, QColor("red"))
             
-            # Add labels with threshold to avoid overcrowding
-            threshold = 1000
-            annotated_positions = []
+            # Always label first and last points (in bold), then a few intermediate ones
+            bold = QFont()
+            bold.setBold(True)
+            ends = (0, len(points) - 1)
+            for i in select_label_indices(self.x_coords, self.y_coords, threshold=1000, keep_ends=True):
+                self._add_label(cdp_str[i], points[i], bold if i in ends else None)
             
-            # Always annotate first and last points
-            self.location_ax.annotate(cdp_str[0], 
-                                     (self.x_coords[0], self.y_coords[0]),
-                                     xytext=(5, 5), textcoords='offset points',
-                                     fontweight='bold')
-            self.location_ax.annotate(cdp_str[-1], 
-                                     (self.x_coords[-1], self.y_coords[-1]),
-                                     xytext=(5, 5), textcoords='offset points',
-                                     fontweight='bold')
-            annotated_positions.append((self.x_coords[0], self.y_coords[0]))
-            annotated_positions.append((self.x_coords[-1], self.y_coords[-1]))
-            
-            # Add a few intermediate labels
-            for i in range(1, len(cdp_str)-1):
-                position = (self.x_coords[i], self.y_coords[i])
-                if all(np.linalg.norm(np.array(position) - np.array(p)) > threshold 
-                      for p in annotated_positions):
-                    self.location_ax.annotate(cdp_str[i], position)
-                    annotated_positions.append(position)
-            
-            # Adjust plot appearance
-            self.location_ax.set_aspect('equal', adjustable='datalim')
-            plt.setp(self.location_ax.get_xticklabels(), rotation=45, ha='right')
-            self.location_canvas.draw()
+            self.location_view.fit_scene()
             return True
 
         except Exception as e:
             print(f"Error displaying location plot: {str(e)}")
             return False
-            
-
-    def _create_direction_option(self, text, tooltip, selected=False):
+    
+    def _add_marker(self, point, size, color):
+        """Add a round marker of size pixels at point."""
+        marker = self.location_scene.addEllipse(-size / 2, -size / 2, size, size,
+                                                QPen(Qt.NoPen), QBrush(color))
+        marker.setFlag(QGraphicsItem.ItemIgnoresTransformations)
+        marker.setPos(point)
+    
+    def _add_label(self, text, point, font=None):
+        """Add a CDP label just above and to the right of point."""
+        label = self.location_scene.addSimpleText(text, font or QFont())
+        label.setFlag(QGraphicsItem.ItemIgnoresTransformations)
+        label.setPos(point)
+        label.setTransform(QTransform.fromTranslate(5, -label.boundingRect().height() - 5))
+    
+    # Button group ids of the two direction options
+    LOW_TO_HIGH = 0
+    HIGH_TO_LOW = 1
+    
+    def _create_direction_option(self, text, tooltip, direction_id, selected=False):
         """Create a radio button option with proper styling"""
         container = QWidget()
         layout = QHBoxLayout(container)
@@ -214,6 +251,7 @@ class CoordinateAssignmentDialog(QDialog):
         
         radio = QRadioButton()
         radio.setChecked(selected)
+        self.direction_group.addButton(radio, direction_id)
         
         label = QLabel(text)
         label.setTextFormat(Qt.RichText)  # Enable rich text interpretation
@@ -223,118 +261,148 @@ class CoordinateAssignmentDialog(QDialog):
         layout.addWidget(label)
         layout.addStretch()
         
-        # Make the buttons in a group mutually exclusive
-        radio.clicked.connect(lambda: self._handle_radio_click(container))
-        
-        # Store the radio button as an attribute of the container for access
-        container.radio = radio
         return container
     
-    def _handle_radio_click(self, clicked_container):
-        """Ensure only one radio button is checked"""
-        if clicked_container == self.direction1_radio:
-            self.direction2_radio.radio.setChecked(False)
-        else:
-            self.direction1_radio.radio.setChecked(False)
+    # Geometry shared by both direction diagrams
+    DIAGRAM_WIDTH = 400
+    DIAGRAM_HEIGHT = 120
+    DIAGRAM_RECT_START = 75
+    DIAGRAM_RECT_WIDTH = 250
     
-    def _create_direction_diagram(self, low_to_high):
-        """Create a visual diagram showing direction of coordinates"""
-        # Make taller diagram to accommodate more labels
-        diagram = QLabel()
-        pixmap = QPixmap(400, 120)  # Made taller to accommodate direction info
-        pixmap.fill(Qt.white)
-        
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        # Draw seismic section representation
-        painter.setPen(Qt.black)
-        painter.setBrush(Qt.lightGray)
-        # Reduced rectangle width from 360 to 250
-        rect_width = 250
-        rect_start = 75  # Adjusted start position to center the rectangle
-        painter.drawRect(rect_start, 20, rect_width, 40)
-        
-        # Draw direction arrow
-        painter.setPen(QPen(QColor(0, 120, 215), 2))
-        painter.setBrush(QColor(0, 120, 215))
-        
-        # Arrow line - adjusted for new rectangle dimensions
-        arrow_start = rect_start + 30
-        arrow_end = rect_start + rect_width - 30
-        painter.drawLine(arrow_start, 40, arrow_end, 40)
-        
-        # Arrow head
-        arrow_head = QPolygonF()
-        if low_to_high:
-            arrow_head.append(QPointF(arrow_end, 40))
-            arrow_head.append(QPointF(arrow_end - 10, 35))
-            arrow_head.append(QPointF(arrow_end - 10, 45))
-        else:
-            arrow_head.append(QPointF(arrow_start, 40))
-            arrow_head.append(QPointF(arrow_start + 10, 35))
-            arrow_head.append(QPointF(arrow_start + 10, 45))
-        painter.drawPolygon(arrow_head)
-        
-        # Calculate intermediate CDP points
+    # x positions of the five CDP ticks in the diagram
+    DIAGRAM_TICK_POSITIONS = (
+        DIAGRAM_RECT_START, 
+        DIAGRAM_RECT_START + DIAGRAM_RECT_WIDTH//4, 
+        DIAGRAM_RECT_START + DIAGRAM_RECT_WIDTH//2, 
+        DIAGRAM_RECT_START + 3*DIAGRAM_RECT_WIDTH//4, 
+        DIAGRAM_RECT_START + DIAGRAM_RECT_WIDTH
+    )
+    DIAGRAM_TICK_LINES = [QLine(pos, 60, pos, 65) for pos in DIAGRAM_TICK_POSITIONS]
+    
+    # "First Trace"/"Last Trace" headers, laid out once and reused by every diagram
+    _header_texts = None
+    
+    def _diagram_sample_points(self):
+        """Return the five CDPs labelled under the diagram ticks."""
         if len(self.cdp_range) >= 5:
             # Use actual CDP values from the range if available
             step = len(self.cdp_range) // 4
-            sample_points = [self.cdp_range[0], 
-                            self.cdp_range[step], 
-                            self.cdp_range[2*step],
-                            self.cdp_range[3*step],
-                            self.cdp_range[-1]]
-        else:
-            # Generate evenly spaced points
-            step = (self.max_cdp - self.min_cdp) / 4
-            sample_points = [
-                int(self.min_cdp + i * step) for i in range(5)
-            ]
-        
-        # Add Trace labels at top
-        painter.setPen(Qt.black)
-        painter.drawText(rect_start, 15, "First Trace")
-        painter.drawText(rect_start + rect_width - 55, 15, "Last Trace")
-        
-        # Draw tick marks and CDP labels - adjusted for new rectangle dimensions
-        tick_positions = [
-            rect_start, 
-            rect_start + rect_width/4, 
-            rect_start + rect_width/2, 
-            rect_start + 3*rect_width/4, 
-            rect_start + rect_width
-        ]
-        
-        # Add CDP labels at bottom
-        painter.setPen(Qt.black)
-        font = painter.font()
+            return [self.cdp_range[0], 
+                    self.cdp_range[step], 
+                    self.cdp_range[2*step],
+                    self.cdp_range[3*step],
+                    self.cdp_range[-1]]
+        # Generate evenly spaced points
+        step = (self.max_cdp - self.min_cdp) / 4
+        return [int(self.min_cdp + i * step) for i in range(5)]
+    
+    def _create_direction_diagram(self, pixmap):
+        """Create a label showing a direction diagram."""
+        diagram = QLabel()
+        diagram.setPixmap(pixmap)
+        return diagram
+    
+    def _direction_diagrams(self):
+        """Return the (increasing, decreasing) CDP direction diagrams.
+        
+        The diagrams only depend on the labelled CDPs, so reopening the dialog
+        for the same line reuses the pixmaps rendered the first time.
+        """
+        key = "cad:{}:{}".format(",".join(self._sample_labels), device_pixel_ratio())
+        increasing = QPixmapCache.find(key + ":up")
+        decreasing = QPixmapCache.find(key + ":down")
+        if increasing is None or decreasing is None:
+            increasing, decreasing = self._render_direction_diagrams()
+            QPixmapCache.insert(key + ":up", increasing)
+            QPixmapCache.insert(key + ":down", decreasing)
+        return increasing, decreasing
+    
+    def _render_direction_diagrams(self):
+        """Paint both diagrams stacked in one pixmap, in a single painter session."""
+        width, height = self.DIAGRAM_WIDTH, self.DIAGRAM_HEIGHT
+        rect_start = self.DIAGRAM_RECT_START
+        rect_width = self.DIAGRAM_RECT_WIDTH
+        arrow_start = rect_start + 30
+        arrow_end = rect_start + rect_width - 30
+        
+        atlas = hidpi_pixmap(width, 2 * height)
+        atlas.fill(Qt.white)
+        painter = QPainter(atlas)
+        
+        # Headers use the painter's default font; static text is placed by its
+        # top-left corner, so shift it up by the ascent to keep the baseline
+        if CoordinateAssignmentDialog._header_texts is None:
+            CoordinateAssignmentDialog._header_texts = (
+                (QPointF(rect_start, 15), QStaticText("First Trace")),
+                (QPointF(rect_start + rect_width - 55, 15), QStaticText("Last Trace")),
+            )
+        header_ascent = painter.fontMetrics().ascent()
+        
+        # Label font, set once for both halves
+        font = QFont(painter.font())
         font.setPointSize(8)
-        painter.setFont(font)
+        metrics = QFontMetrics(font)
+        labels = self._sample_labels
+        label_widths = [metrics.horizontalAdvance(text) for text in labels]
         
-        # Draw ticks and CDP values
-        for i, (pos, cdp) in enumerate(zip(tick_positions, sample_points if low_to_high else reversed(sample_points))):
-            # Draw tick
-            painter.drawLine(pos, 60, pos, 65)
+        for half, low_to_high in enumerate((True, False)):
+            painter.save()
+            painter.translate(0, half * height)
             
-            # Draw CDP value
-            cdp_text = str(cdp)
-            text_width = painter.fontMetrics().horizontalAdvance(cdp_text)
-            painter.drawText(pos - text_width//2, 80, cdp_text)
-        
-        # Add CDP direction label
-        direction_text = "CDP values increase →" if low_to_high else "← CDP values decrease"
-        painter.drawText(150, 95, direction_text)
+            # Draw seismic section representation (axis-aligned, no antialiasing needed)
+            painter.setPen(Qt.black)
+            painter.setBrush(Qt.lightGray)
+            painter.drawRect(rect_start, 20, rect_width, 40)
+            
+            # Add Trace labels at top
+            for baseline, text in self._header_texts:
+                painter.drawStaticText(baseline - QPointF(0, header_ascent), text)
+            
+            # Draw tick marks in one batch
+            painter.drawLines(self.DIAGRAM_TICK_LINES)
+            
+            # Draw direction arrow
+            painter.setPen(QPen(QColor(0, 120, 215), 2))
+            painter.setBrush(QColor(0, 120, 215))
+            painter.drawLine(arrow_start, 40, arrow_end, 40)
+            
+            # Arrow head, the only slanted shape, is the only one antialiased
+            if low_to_high:
+                arrow_head = QPolygon([QPoint(arrow_end, 40), QPoint(arrow_end - 10, 35), QPoint(arrow_end - 10, 45)])
+            else:
+                arrow_head = QPolygon([QPoint(arrow_start, 40), QPoint(arrow_start + 10, 35), QPoint(arrow_start + 10, 45)])
+            painter.setRenderHint(QPainter.Antialiasing, True)
+            painter.drawPolygon(arrow_head)
+            painter.setRenderHint(QPainter.Antialiasing, False)
+            
+            # Draw CDP values under the ticks
+            painter.setPen(Qt.black)
+            painter.setFont(font)
+            order = range(5) if low_to_high else range(4, -1, -1)
+            for pos, i in zip(self.DIAGRAM_TICK_POSITIONS, order):
+                painter.drawText(pos - label_widths[i]//2, 80, labels[i])
+            
+            # Add CDP direction label
+            direction_text = "CDP values increase →" if low_to_high else "← CDP values decrease"
+            painter.drawText(150, 95, direction_text)
+            
+            painter.restore()
         
         painter.end()
-        diagram.setPixmap(pixmap)
-        return diagram
+        
+        # Split the atlas in device pixels, keeping the HiDPI ratio on each half
+        ratio = atlas.devicePixelRatio()
+        device_height = atlas.height() // 2
+        halves = []
+        for half in range(2):
+            pixmap = atlas.copy(0, half * device_height, atlas.width(), device_height)
+            pixmap.setDevicePixelRatio(ratio)
+            halves.append(pixmap)
+        return tuple(halves)
     
     def get_coordinates(self):
         """Return the selected coordinates based on direction choice"""
-        if self.direction1_radio.radio.isChecked():
-            # Natural direction (Low to high CDP)
-            return (self.min_cdp, self.max_cdp)
-        else:
-            # Reverse direction (High to low CDP)
-            return (self.max_cdp, self.min_cdp)
\ No newline at end of file
+        # Before the dialog is shown the default (low to high) option applies
+        if not self._built:
+            return self._coord_pairs[self.LOW_TO_HIGH]
+        return self._coord_pairs[self.direction_group.checkedId()]
\ No newline at end of file
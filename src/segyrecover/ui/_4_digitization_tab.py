@@ -2,8 +2,7 @@
 
 import os
 import numpy as np
-import cv2
-from PySide6.QtCore import Qt, Signal, QPointF
+from PySide6.QtCore import Qt, Signal, QPointF, QObject, QThread
 from PySide6.QtGui import QPixmap, QPen, QPainter, QColor, QPolygonF
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
@@ -13,12 +12,14 @@ from PySide6.QtWidgets import (
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qtagg import NavigationToolbar2QT as NavigationToolbar
 from matplotlib.figure import Figure
+from matplotlib import colormaps
 
 
 from ..utils.console_utils import (
     section_header, success_message, error_message, 
     warning_message, info_message, progress_message
 )
+from ..utils.image_utils import to_uint8
 from ._4_1_digitization_logic import DigitizationProcessor
 
 class SimpleNavigationToolbar(NavigationToolbar):
@@ -33,6 +34,96 @@ class SimpleNavigationToolbar(NavigationToolbar):
         # Configure the toolbar to show text labels
         self.setToolButtonStyle(Qt.ToolButtonTextBesideIcon)
 
+class _ConsoleRelay(QObject):
+    """Console stand-in that forwards appends to the real console.
+    
+    Signals emitted from a worker thread are queued to the console's (GUI)
+    thread; from the GUI thread they are delivered directly.
+    """
+    html = Signal(str)
+    plain = Signal(str)
+    
+    def __init__(self, console):
+        super().__init__()
+        self.html.connect(console.appendHtml)
+        self.plain.connect(console.appendPlainText)
+    
+    def appendHtml(self, text):
+        self.html.emit(text)
+    
+    def appendPlainText(self, text):
+        self.plain.emit(text)
+
+
+class _ProgressRelay(QObject):
+    """Progress bar stand-in that forwards calls to the real status bar.
+    
+    Updates are only forwarded when the percentage changes, so tight loops
+    in a worker thread don't flood the GUI thread's event queue. The cancel
+    flag is kept here, so a new start() clears it without waiting for the
+    GUI thread; an abort stays set until the next run is prepared.
+    """
+    started = Signal(str, int)
+    updated = Signal(int)
+    finished = Signal()
+    
+    def __init__(self, progress_bar):
+        super().__init__()
+        self.progress_bar = progress_bar
+        self._maximum = 1
+        self._last_pct = -1
+        self._canceled = False
+        self._aborted = False
+        progress_bar.cancel_button.clicked.connect(self.cancel)
+        self.started.connect(progress_bar.start)
+        self.updated.connect(progress_bar.update)
+        self.finished.connect(progress_bar.finish)
+    
+    def start(self, title, maximum):
+        self._maximum = max(maximum, 1)
+        self._last_pct = -1
+        self._canceled = False
+        self.started.emit(title, maximum)
+    
+    def update(self, value):
+        pct = int(value * 100 / self._maximum)
+        if pct != self._last_pct:
+            self._last_pct = pct
+            self.updated.emit(value)
+    
+    def finish(self):
+        self.finished.emit()
+    
+    def wasCanceled(self):
+        return self._canceled or self._aborted
+    
+    def cancel(self):
+        self._canceled = True
+    
+    def abort(self):
+        self._aborted = True
+    
+    def clear_abort(self):
+        self._aborted = False
+
+
+class DigitizationWorker(QThread):
+    """Worker thread that runs the digitization steps 1-4."""
+    step_completed = Signal(int, object)  # step_index, step_results
+    finished = Signal(bool)  # success
+    error = Signal(str)
+    
+    def __init__(self, processor):
+        super().__init__()
+        self.processor = processor
+    
+    def run(self):
+        try:
+            self.finished.emit(self.processor.run_processing_steps(self.step_completed.emit))
+        except Exception as e:
+            self.error.emit(f"Digitization failed: {str(e)}")
+
+
 class DigitizationTab(QWidget):
     """Tab for digitizing the seismic section."""
     
@@ -40,6 +131,9 @@ class DigitizationTab(QWidget):
     digitizationCompleted = Signal(str, object)  # segy_path, filtered_data
     proceedRequested = Signal()
     
+    # Image panels show 8-bit data with a fixed range, so imshow skips autoscaling
+    IMAGE_KW = dict(cmap=colormaps['gray'], vmin=0, vmax=255, interpolation='nearest')
+    
     def __init__(self, console, progress_bar, work_dir, parent=None):
         super().__init__(parent)
         self.setObjectName("digitization_tab")
@@ -47,8 +141,13 @@ class DigitizationTab(QWidget):
         self.progress = progress_bar
         self.work_dir = work_dir
         
-        # Create the digitization processor for handling the logic
-        self.digitization_processor = DigitizationProcessor(console, progress_bar, work_dir)
+        # Create the digitization processor for handling the logic. It writes
+        # through relays so its steps can run in a worker thread
+        self._console_relay = _ConsoleRelay(console)
+        self._progress_relay = _ProgressRelay(progress_bar)
+        self.digitization_processor = DigitizationProcessor(
+            self._console_relay, self._progress_relay, work_dir)
+        self.worker = None
         
         # Visualization state for storing intermediate and final images/data
         self.visualization_data = {
@@ -65,11 +164,25 @@ class DigitizationTab(QWidget):
         # Create tabbed visualization system
         self.tab_canvases = {}
         self.tab_figures = {}
+        self.tab_layouts = {}
+        self.tab_toolbars = {}
+        self.tab_ids = []
+        
+        # Tabs whose figure changed while hidden; rendered when next shown
+        self.stale_tabs = set()
         
         self._setup_ui()
     
     def reset(self):
         """Reset the digitization tab state completely when starting a new line."""
+        # Stop a running digitization before its data is cleared. The abort
+        # survives the next progress start, so the worker stops at the next
+        # cancel check or step boundary; the wait blocks the interface until
+        # then. Signals the worker already queued are dropped by the slot guards
+        if self.worker is not None:
+            self._progress_relay.abort()
+            self._cleanup_worker()
+        
         # Reset the processor
         self.digitization_processor.reset()
         
@@ -86,7 +199,7 @@ class DigitizationTab(QWidget):
             ax.text(0.5, 0.5, "Load new data to begin", 
                     ha='center', va='center', fontsize=12, color='gray')
             ax.axis('off')
-            self.tab_canvases[tab_id].draw()
+            self._request_draw(tab_id)
             
         # Reset navigation and action buttons
         self.start_button.setEnabled(False)
@@ -221,18 +334,46 @@ class DigitizationTab(QWidget):
             canvas = FigureCanvas(fig)
             canvas.setMinimumHeight(300)
             
-            toolbar = SimpleNavigationToolbar(canvas, self)
-            
             self.tab_figures[config['id']] = fig
             self.tab_canvases[config['id']] = canvas
+            self.tab_layouts[config['id']] = tab_layout
+            self.tab_ids.append(config['id'])
             
             tab_layout.addWidget(canvas)
-            tab_layout.addWidget(toolbar)
             
             self.tab_widget.addTab(tab_content, config['title'])
         
+        # Toolbars are created, and pending redraws done, when a tab is shown
+        self.tab_widget.currentChanged.connect(self._on_visualization_tab_changed)
+        self._ensure_tab_toolbar(self.tab_widget.currentIndex())
+        
         self._update_visualization_tab('original', self.visualization_data.get('image_a'))
     
+    def _on_visualization_tab_changed(self, index):
+        """Prepare a visualization tab that has just been shown."""
+        self._ensure_tab_toolbar(index)
+        if 0 <= index < len(self.tab_ids) and self.tab_ids[index] in self.stale_tabs:
+            self.stale_tabs.discard(self.tab_ids[index])
+            self.tab_canvases[self.tab_ids[index]].draw_idle()
+    
+    def _request_draw(self, tab_id):
+        """Render a visualization canvas if its tab is visible, otherwise when it is shown."""
+        if self.tab_ids.index(tab_id) == self.tab_widget.currentIndex():
+            self.stale_tabs.discard(tab_id)
+            self.tab_canvases[tab_id].draw_idle()
+        else:
+            self.stale_tabs.add(tab_id)
+    
+    def _ensure_tab_toolbar(self, index):
+        """Create the navigation toolbar of a visualization tab on its first visit."""
+        if not 0 <= index < len(self.tab_ids):
+            return
+        tab_id = self.tab_ids[index]
+        if tab_id not in self.tab_toolbars:
+            toolbar = SimpleNavigationToolbar(self.tab_canvases[tab_id], self)
+            self.tab_layouts[tab_id].addWidget(toolbar)
+            self.tab_toolbars[tab_id] = toolbar
+    
     def _update_visualization_tab(self, tab_id, data):
         """Update the specified visualization tab with the given data."""
         if tab_id in self.tab_figures and data is not None:
@@ -245,25 +386,32 @@ class DigitizationTab(QWidget):
             
             # Different visualization methods based on tab type
             if tab_id in ['original', 'timelines', 'processed']:
-                ax.imshow(data, cmap='gray')
+                # Keep the 8-bit image so the baseline view can reuse it
+                data = to_uint8(data)
+                self.visualization_data[tab_id] = data
+                ax.imshow(data, **self.IMAGE_KW)
                 ax.set_title(f"{self.tab_widget.tabText(self.tab_widget.indexOf(self.tab_canvases[tab_id].parent().parent()))}")
                 ax.axis('off')
             
             elif tab_id == 'debug_baselines':
                 if 'processed' in self.visualization_data and self.visualization_data['processed'] is not None:
-                    ax.imshow(self.visualization_data['processed'], cmap='gray')
+                    ax.imshow(self.visualization_data['processed'], **self.IMAGE_KW)
                 else:
-                    ax.imshow(data, cmap='gray')
+                    ax.imshow(to_uint8(data), **self.IMAGE_KW)
                 
                 ax.set_title("Baselines Detection")
                 
-                if self.digitization_processor.final_baselines is not None:
-                    for baseline in self.digitization_processor.final_baselines:
-                        ax.axvline(x=baseline, color='red', linewidth=1)
+                # All baselines in a single LineCollection rather than one Line2D each
+                final_baselines = self.digitization_processor.final_baselines
+                if final_baselines is not None and len(final_baselines) > 0:
+                    ax.vlines(final_baselines, 0, data.shape[0] - 1, colors='red', linewidth=1)
                 
                 self._apply_zoom_to_center(ax, data.shape)
             
             elif tab_id == 'filtered_data':
+                # Single precision is plenty on screen and halves the bytes
+                # matplotlib resamples on every redraw
+                data = np.asarray(data, dtype=np.float32)
                 vmin, vmax = np.percentile(data, [5, 95])
                 im = ax.imshow(data, cmap='gray', aspect='auto', interpolation='none', vmin=vmin, vmax=vmax)
                 
@@ -282,7 +430,7 @@ class DigitizationTab(QWidget):
             else:
                 fig.tight_layout()
                 
-            self.tab_canvases[tab_id].draw()
+            self._request_draw(tab_id)
             
             # Switch to the relevant tab if not the original
             if tab_id not in ['original']:  
@@ -336,8 +484,38 @@ class DigitizationTab(QWidget):
         # Disable start button to prevent multiple runs
         self.start_button.setEnabled(False)
         
-        # Run the digitization process with step callbacks for UI updates
-        success = self.digitization_processor.run_digitization(self._step_completed_callback)
+        # Run steps 1-4 in a worker thread so the interface stays responsive;
+        # step results update the visualizations as they arrive
+        self._progress_relay.clear_abort()
+        self.worker = DigitizationWorker(self.digitization_processor)
+        self.worker.setParent(self)  # Set parent to tab for proper cleanup
+        self.worker.step_completed.connect(self._worker_step_completed)
+        self.worker.finished.connect(self._processing_finished)
+        self.worker.error.connect(self._processing_failed)
+        self.worker.start()
+    
+    def _is_current_worker(self):
+        """Return whether the signal being handled comes from the running worker.
+        
+        Signals queued by a worker that reset() already stopped still arrive
+        afterwards and must not touch the cleared tab.
+        """
+        return self.worker is not None and self.sender() is self.worker
+    
+    def _worker_step_completed(self, step_index, step_results):
+        """Show a step result from the running worker."""
+        if self._is_current_worker():
+            self._step_completed_callback(step_index, step_results)
+    
+    def _processing_finished(self, success):
+        """Create the SEGY file on the GUI thread once steps 1-4 are done."""
+        if not self._is_current_worker():
+            return
+        self._cleanup_worker()
+        
+        # Step 5 may ask for coordinates through a dialog
+        if success:
+            success = self.digitization_processor.finish_digitization(self._step_completed_callback)
         
         if success:
             self._add_success_overlay()  # Show success message on filtered data tab
@@ -348,9 +526,25 @@ class DigitizationTab(QWidget):
                 self.digitization_processor.segy_path, 
                 self.digitization_processor.filtered_data
             )
-          # Re-enable start button for optional re-run
+        # Re-enable start button for optional re-run
         self.start_button.setEnabled(True)
     
+    def _processing_failed(self, message):
+        """Report an unexpected error from the worker thread."""
+        if not self._is_current_worker():
+            return
+        self._cleanup_worker()
+        self.progress.finish()
+        error_message(self.console, message)
+        self.start_button.setEnabled(True)
+    
+    def _cleanup_worker(self):
+        """Wait for the worker thread to end and release it."""
+        if self.worker is not None:
+            self.worker.wait()
+            self.worker.deleteLater()
+            self.worker = None
+    
     def _step_completed_callback(self, step_index, step_results):
         """Callback for when a processing step is completed. Updates visualizations."""
         # Update visualizations based on the step
@@ -373,7 +567,7 @@ class DigitizationTab(QWidget):
                     transform=ax.transAxes,
                     bbox=dict(boxstyle="round,pad=0.5", facecolor='#d1fae5', edgecolor='#10b981', alpha=0.8))
             
-            self.tab_canvases['filtered_data'].draw()
+            self._request_draw('filtered_data')
     
     def update_with_data(self, image_path, binary_rectified_image, parameters):
         """Update with data from previous tabs and enable digitization if ready."""
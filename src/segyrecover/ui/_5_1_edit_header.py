@@ -11,6 +11,7 @@ from PySide6.QtWidgets import (
 import seisio
 
 from ..utils.console_utils import info_message, error_message, success_message
+from ..utils.window_utils import window_geometry
 
 
 class SEGYHeaderEditorDialog(QDialog):
@@ -25,14 +26,7 @@ class SEGYHeaderEditorDialog(QDialog):
         self.output_file = segy_path  # By default, output is same as input
         
         # Fix window sizing and positioning
-        screen = QApplication.primaryScreen().geometry()
-        screen_width = min(screen.width(), 1920)
-        screen_height = min(screen.height(), 1080)
-        window_width = int(screen_width * 0.7)  # Wider for better text editing
-        window_height = int(screen_height * 0.7)
-        pos_x = (screen_width - window_width) // 2
-        pos_y = (screen_height - window_height) // 2
-        self.setGeometry(pos_x, pos_y, window_width, window_height)
+        self.setGeometry(*window_geometry(0.7, 0.7))  # Wider for better text editing
         
         # Read the SEGY file to get the current header
         try:
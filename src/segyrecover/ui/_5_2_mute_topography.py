@@ -12,11 +12,11 @@ from PySide6.QtWidgets import (
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qtagg import NavigationToolbar2QT as NavigationToolbar
 from matplotlib.figure import Figure
-import matplotlib.pyplot as plt
 import seisio
 import seisplot
 
 from ..utils.console_utils import info_message, success_message, error_message
+from ..utils.window_utils import window_geometry
 
 from scipy.interpolate import CubicSpline
 
@@ -30,12 +30,7 @@ class MuteTopographyDialog(QDialog):
         self.setModal(True)
         
         # Setup window size and positioning
-        screen = QApplication.primaryScreen().geometry()
-        screen_width = min(screen.width(), 1920)
-        screen_height = min(screen.height(), 1080)   
-        window_width = int(screen_width * 0.8)
-        window_height = int(screen_height * 0.8)
-        self.setGeometry(100, 100, window_width, window_height)
+        self.setGeometry(*window_geometry(0.8, 0.8, pos=(100, 100)))
         
         # Initialize data
         self.segy_path = segy_path
@@ -48,6 +43,13 @@ class MuteTopographyDialog(QDialog):
         self.plot_type = "image"  # Default plot type (variable density)
         self.is_previewing = False  # Flag to track if we're showing the preview
         
+        # Pick overlay artists, recreated with each full redraw of the section.
+        # They are animated and blitted over the cached rendered section
+        self._points_scatter = None
+        self._surface_line = None
+        self._taper_fill = None
+        self._background = None
+        
         # Load SEGY data
         info_message(self.console, f"Loading SEGY data from {os.path.basename(self.segy_path)}")
 
@@ -88,6 +90,7 @@ class MuteTopographyDialog(QDialog):
         
         # Connect mouse click event
         self.canvas.mpl_connect('button_press_event', self.on_click)
+        self.canvas.mpl_connect('draw_event', self._on_canvas_draw)
         
         # Add canvas to layout
         layout.addWidget(self.canvas, 1)  # 1 = stretch factor
@@ -172,8 +175,18 @@ class MuteTopographyDialog(QDialog):
                 ax=self.ax
                 )
             
+            # Picks are drawn by overlay artists updated in place, so adding
+            # or moving a point does not re-render the section; the view stays
+            # on the section instead of following the surface curve
+            self.ax.autoscale(False)
+            self._points_scatter = self.ax.scatter(
+                [], [], s=64, edgecolors='black', zorder=10, animated=True)
+            self._surface_line, = self.ax.plot(
+                [], [], '-', color='white', linewidth=2, alpha=0.8, zorder=9, animated=True)
+            self._taper_fill = None
             self.draw_picked_points()
             
+            self._background = None
             self.canvas.draw()
             self.update_buttons()  # Update buttons after drawing
             
@@ -181,67 +194,86 @@ class MuteTopographyDialog(QDialog):
             error_message(self.console, f"Error displaying SEGY data: {str(e)}")
     
     def draw_picked_points(self):
-        """Draw picked points and interpolated surface on the plot."""
-        if not self.picked_points:
-            return
+        """Update the picked points and interpolated surface overlay."""
+        if self._taper_fill is not None:
+            self._taper_fill.remove()
+            self._taper_fill = None
+        
+        # All markers live in one scatter: first point green, last red, others
+        # yellow (a single point is yellow)
+        n_points = len(self.picked_points)
+        offsets = np.array(self.picked_points, dtype=float).reshape(-1, 2)
+        colors = ['yellow'] * n_points
+        if n_points >= 2:
+            colors[0], colors[-1] = 'green', 'red'
+        self._points_scatter.set_offsets(offsets)
+        self._points_scatter.set_facecolor(colors)
         
-        # Extract trace and sample indices
-        trace_indices = [p[0] for p in self.picked_points]
-        sample_indices = [p[1] for p in self.picked_points]
+        # Draw interpolated surface if we have at least 2 points
+        if n_points < 2:
+            self._surface_line.set_data([], [])
+            return
         
-        # Draw points with different colors for first and last point
-        if len(self.picked_points) == 1:
-            self.ax.plot(trace_indices[0], sample_indices[0], 'o', color='yellow', markersize=8, 
-                         markeredgecolor='black', zorder=10)
+        # Sort points by trace number
+        sorted_points = sorted(self.picked_points, key=lambda p: p[0])
+        sorted_trace_indices = [p[0] for p in sorted_points]
+        sorted_sample_indices = [p[1] for p in sorted_points]
+        all_traces = np.arange(self.segy_data.shape[0])
+        if len(sorted_points) > 2:
+            # Use cubic spline for smooth curve
+            cs = CubicSpline(sorted_trace_indices, sorted_sample_indices, extrapolate=True)
+            interp_surface = cs(all_traces)
         else:
-            # Draw first point in green
-            self.ax.plot(trace_indices[0], sample_indices[0], 'o', color='green', markersize=8, 
-                         markeredgecolor='black', zorder=10)
-            
-            # Draw last point in red
-            self.ax.plot(trace_indices[-1], sample_indices[-1], 'o', color='red', markersize=8, 
-                         markeredgecolor='black', zorder=10)
-            
-            # Draw middle points in yellow
-            if len(self.picked_points) > 2:
-                self.ax.plot(trace_indices[1:-1], sample_indices[1:-1], 'o', color='yellow', markersize=8, 
-                             markeredgecolor='black', zorder=10)
+            # Fallback to linear interpolation for 2 points
+            interp_surface = np.interp(
+                all_traces,
+                sorted_trace_indices,
+                sorted_sample_indices,
+                left=sorted_sample_indices[0],
+                right=sorted_sample_indices[-1]
+            )
         
-        # Draw interpolated surface if we have at least 2 points
-        if len(self.picked_points) >= 2:
-            # Sort points by trace number
-            sorted_points = sorted(self.picked_points, key=lambda p: p[0])
-            sorted_trace_indices = [p[0] for p in sorted_points]
-            sorted_sample_indices = [p[1] for p in sorted_points]
-            all_traces = np.arange(self.segy_data.shape[0])
-            if len(sorted_points) > 2:
-                # Use cubic spline for smooth curve
-                cs = CubicSpline(sorted_trace_indices, sorted_sample_indices, extrapolate=True)
-                interp_surface = cs(all_traces)
+        # Draw interpolated surface line
+        self._surface_line.set_data(all_traces, interp_surface)
+        
+        # Show taper zone with semi-transparent area
+        if self.taper_length > 0:
+            taper_surface = interp_surface + self.taper_length
+            self._taper_fill = self.ax.fill_between(
+                all_traces, 
+                interp_surface, 
+                taper_surface, 
+                color='blue', 
+                alpha=0.3, 
+                label='Taper Zone',
+                animated=True
+            )
+    
+    def _redraw_picks(self):
+        """Redraw only the pick overlay after the points or taper changed."""
+        if self._points_scatter is not None:
+            self.draw_picked_points()
+            if self._background is None:
+                self.canvas.draw_idle()
             else:
-                # Fallback to linear interpolation for 2 points
-                interp_surface = np.interp(
-                    all_traces,
-                    sorted_trace_indices,
-                    sorted_sample_indices,
-                    left=sorted_sample_indices[0],
-                    right=sorted_sample_indices[-1]
-                )
-            
-            # Draw interpolated surface line
-            self.ax.plot(all_traces, interp_surface, '-', color='white', linewidth=2, alpha=0.8, zorder=9)
-            
-            # Show taper zone with semi-transparent area
-            if self.taper_length > 0:
-                taper_surface = interp_surface + self.taper_length
-                self.ax.fill_between(
-                    all_traces, 
-                    interp_surface, 
-                    taper_surface, 
-                    color='blue', 
-                    alpha=0.3, 
-                    label='Taper Zone'
-                )
+                # Repaint only the overlay over the cached section
+                self.canvas.restore_region(self._background)
+                self._draw_overlay_artists()
+                self.canvas.blit(self.ax.bbox)
+        self.update_buttons()
+    
+    def _on_canvas_draw(self, event):
+        """Cache the rendered section and draw the overlay on top of it."""
+        if self._points_scatter is None:
+            return
+        self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._draw_overlay_artists()
+    
+    def _draw_overlay_artists(self):
+        """Render the animated taper zone, surface line and pick markers."""
+        for artist in (self._taper_fill, self._surface_line, self._points_scatter):
+            if artist is not None:
+                self.ax.draw_artist(artist)
     
     def on_click(self, event):
         """Handle mouse clicks on the plot."""
@@ -263,8 +295,7 @@ class MuteTopographyDialog(QDialog):
                 closest_idx = self.find_closest_point(trace_idx, sample_idx)
                 if closest_idx is not None:
                     self.picked_points.pop(closest_idx)
-                    self.display_segy_data()
-                    self.update_buttons()
+                    self._redraw_picks()
             return
         
         # Left-click to add a point
@@ -274,26 +305,24 @@ class MuteTopographyDialog(QDialog):
                 if t == trace_idx:
                     # Update point at this trace
                     self.picked_points[i] = (trace_idx, sample_idx)
-                    self.display_segy_data()
-                    self.update_buttons()
+                    self._redraw_picks()
                     return
             
             # Add new point
             self.picked_points.append((trace_idx, sample_idx))
-            self.display_segy_data()
-            self.update_buttons()
+            self._redraw_picks()
 
     def find_closest_point(self, trace_idx, sample_idx):
         """Find index of the closest picked point to the given coordinates."""
         if not self.picked_points:
             return None
         
-        # Calculate squared distances
-        distances = [(i, (p[0] - trace_idx)**2 + (p[1] - sample_idx)**2) 
-                     for i, p in enumerate(self.picked_points)]
+        # Calculate squared distances to all points at once
+        distances = ((np.array(self.picked_points) - (trace_idx, sample_idx)) ** 2).sum(axis=1)
         
         # Find minimum
-        closest_idx, min_dist = min(distances, key=lambda x: x[1])
+        closest_idx = int(distances.argmin())
+        min_dist = distances[closest_idx]
         
         # Check if point is close enough (within 20 pixels)
         if min_dist > 400:  # 20^2 = 400
@@ -305,7 +334,7 @@ class MuteTopographyDialog(QDialog):
     def on_taper_changed(self, value):
         """Handle changes to taper length."""
         self.taper_length = value
-        self.display_segy_data()  # Redraw to show taper zone
+        self._redraw_picks()  # Redraw to show taper zone
     
     def reset_points(self):
         """Clear all picked points."""
@@ -343,13 +372,14 @@ class MuteTopographyDialog(QDialog):
         
         info_message(self.console, "Applying muting with defined surface...")
         
-        # Sort points by trace number
-        sorted_points = sorted(self.picked_points, key=lambda p: p[0])
-        info_message(self.console, f"Using {len(sorted_points)} points to define muting surface")
+        # Sort points by trace number as one (N, 2) array
+        points = np.array(self.picked_points)
+        points = points[np.argsort(points[:, 0], kind='stable')]
+        info_message(self.console, f"Using {len(points)} points to define muting surface")
         
         # Extract trace and sample indices
-        trace_indices = [p[0] for p in sorted_points]
-        sample_indices = [p[1] for p in sorted_points]
+        trace_indices = points[:, 0]
+        sample_indices = points[:, 1]
         
         # Interpolate to get a continuous surface for all traces
         all_traces = np.arange(self.segy_data.shape[0])
@@ -365,26 +395,23 @@ class MuteTopographyDialog(QDialog):
                 right=sample_indices[-1]  # Extend last point to right edge
             )
         
-        muting_mask = np.ones_like(self.segy_data)        
-        
-        for trace_idx in range(self.segy_data.shape[0]):
-            # Get the sample index where the muting surface crosses this trace
-            surface_sample = int(interp_surface[trace_idx])
-            
-            if surface_sample <= 0:
-                # Skip if muting surface is at or above the first sample
-                continue                
-            
-            # Mute all samples above the surface (samples with lower indices = shallower time)
-            muting_mask[trace_idx, :surface_sample] = 0
-            
-            # Apply taper below the surface
-            taper_end = min(surface_sample + self.taper_length, self.segy_data.shape[1])
-            if taper_end > surface_sample:
-                taper_samples = taper_end - surface_sample
-                # Create taper from 0 to 1 (0 at surface, gradually increasing to 1)
-                taper = np.linspace(0, 1, taper_samples)
-                muting_mask[trace_idx, surface_sample:taper_end] = taper
+        # Sample index where the muting surface crosses each trace, and each
+        # sample's offset below it
+        n_samples = self.segy_data.shape[1]
+        surface_sample = np.trunc(interp_surface).astype(np.int64)
+        offset = np.arange(n_samples) - surface_sample[:, np.newaxis]
+        
+        # Taper length below the surface: 0 to 1, gradually increasing from the
+        # surface; none where the surface is at or above the first sample
+        taper_samples = np.minimum(surface_sample + self.taper_length, n_samples) - surface_sample
+        taper_samples[surface_sample <= 0] = 0
+        taper_samples = np.maximum(taper_samples, 0)[:, np.newaxis]
+        taper = offset / np.maximum(taper_samples - 1, 1)
+        
+        # Mute all samples above the surface (samples with lower indices = shallower
+        # time), taper just below it and keep the rest
+        muting_mask = np.where(offset < 0, 0.0, np.where(offset < taper_samples, taper, 1.0))
+        muting_mask = muting_mask.astype(self.segy_data.dtype, copy=False)
         
         # Apply mask to create muted data
         self.muted_data = self.segy_data * muting_mask
@@ -18,6 +18,7 @@ from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qtagg import NavigationToolbar2QT as NavigationToolbar
 
 from ..utils.console_utils import success_message, error_message, info_message
+from ..utils.window_utils import window_geometry
 
 class SimpleNavigationToolbar(NavigationToolbar):
     """Simplified navigation toolbar with only Home, Pan and Zoom tools."""
@@ -39,12 +40,7 @@ class AGCRMSDialog(QDialog):
         self.setObjectName("agc_rms_dialog")
 
 
-        screen = QApplication.primaryScreen().geometry()
-        screen_width = min(screen.width(), 1920)
-        screen_height = min(screen.height(), 1080)   
-        window_width = int(screen_width * 0.8)
-        window_height = int(screen_height * 0.8)
-        self.setGeometry(100, 100, window_width, window_height)
+        self.setGeometry(*window_geometry(0.8, 0.8, pos=(100, 100)))
         
         self.segy_path = segy_path
         self.console = console
@@ -181,14 +177,14 @@ class AGCRMSDialog(QDialog):
     
     def _apply_agc_rms(self, data, gate_samples, desired_rms=1.0):
         """Apply AGC RMS to all traces in the data array."""
-        data_processed = data.copy()
-        for i in range(data_processed.shape[0]):
-            trace = data_processed[i]
-            trace_power = trace ** 2
-            smooth_power = uniform_filter1d(trace_power, size=gate_samples, mode='reflect')
-            rms = np.sqrt(np.maximum(smooth_power, 1e-10))  # Prevent division by zero
-            data_processed[i] = trace / rms * desired_rms
-        return data_processed
+        # Smooth the power of every trace along its samples in one filter call
+        smooth_power = uniform_filter1d(np.square(data), size=gate_samples, axis=1, mode='reflect')
+        
+        # Turn the RMS into a gain in place (desired_rms folded in), so each
+        # sample costs one multiply instead of a divide and a multiply
+        gain = np.sqrt(np.maximum(smooth_power, 1e-10, out=smooth_power), out=smooth_power)  # Prevent division by zero
+        np.divide(desired_rms, gain, out=gain)
+        return (data * gain).astype(data.dtype, copy=False)
 
     def _get_output_file_path(self, gate_ms):
         """Determine output file path and handle user confirmation if needed."""
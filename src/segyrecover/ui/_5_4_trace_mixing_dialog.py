@@ -16,6 +16,7 @@ from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qtagg import NavigationToolbar2QT as NavigationToolbar
 
 from ..utils.console_utils import success_message, error_message, info_message
+from ..utils.window_utils import window_geometry
 
 class MixingWorker(QThread):
     """Worker thread for trace mixing operations."""
@@ -53,10 +54,23 @@ class MixingWorker(QThread):
             return 2*n_traces - trace_idx - 2
         return trace_idx
     
+    def _window_indices(self, n_traces, window_size):
+        """Return mirrored trace indices for every window position.
+        
+        Entry i + j is the trace used at window offset j for output trace i,
+        with the same mirroring as _handle_boundaries.
+        """
+        half_window = window_size // 2
+        trace_idx = np.arange(-half_window, n_traces - half_window + window_size - 1)
+        trace_idx = np.abs(trace_idx)
+        beyond = trace_idx >= n_traces
+        trace_idx[beyond] = 2*n_traces - trace_idx[beyond] - 2
+        return trace_idx
+    
     def _weighted_trace_mix(self, data, window_size, weights=None):
         """Apply weighted average trace mixing using vectorized operations."""
-        # Create a copy of the data to avoid modifying the original
-        result = data.copy()
+        # Every trace is overwritten, so the output needs no copy of the input
+        result = np.empty_like(data)
         n_traces = data.shape[0]
         n_samples = data.shape[1]
         
@@ -69,8 +83,8 @@ class MixingWorker(QThread):
         # Normalize weights
         weights = np.array(weights) / np.sum(weights)
         
-        # Half window size for indexing
-        half_window = window_size // 2
+        # Mirrored trace index for every window position
+        window_idx = self._window_indices(n_traces, window_size)
         
         # Process in smaller chunks to report progress
         chunk_size = max(1, n_traces // 100)
@@ -78,17 +92,13 @@ class MixingWorker(QThread):
         for chunk_start in range(0, n_traces, chunk_size):
             chunk_end = min(chunk_start + chunk_size, n_traces)
             
-            # Apply mixing for this chunk of traces
-            for i in range(chunk_start, chunk_end):
-                mixed_trace = np.zeros(n_samples)
-                
-                # Sum weighted traces in the window
-                for j in range(window_size):
-                    trace_idx = self._handle_boundaries(i - half_window + j, n_traces)
-                    mixed_trace += data[trace_idx] * weights[j]
-                
-                # Apply the result
-                result[i] = mixed_trace
+            # Sum weighted traces in the window for the whole chunk at once
+            mixed = np.zeros((chunk_end - chunk_start, n_samples))
+            for j in range(window_size):
+                mixed += data[window_idx[chunk_start + j:chunk_end + j]] * weights[j]
+            
+            # Apply the result
+            result[chunk_start:chunk_end] = mixed
             
             # Report progress
             self.progress.emit(int(chunk_end * 100 / n_traces))
@@ -97,13 +107,13 @@ class MixingWorker(QThread):
     
     def _median_mix(self, data, window_size):
         """Apply median trace mixing using vectorized operations where possible."""
-        # Create a copy of the data to avoid modifying the original
-        result = data.copy()
+        # Every trace is overwritten, so the output needs no copy of the input
+        result = np.empty_like(data)
         n_traces = data.shape[0]
-        n_samples = data.shape[1]
         
-        # Half window size for indexing
-        half_window = window_size // 2
+        # Mirrored trace index for every window position
+        window_idx = self._window_indices(n_traces, window_size)
+        offsets = np.arange(window_size)
         
         # Process in smaller chunks to report progress
         chunk_size = max(1, n_traces // 100)
@@ -111,18 +121,10 @@ class MixingWorker(QThread):
         for chunk_start in range(0, n_traces, chunk_size):
             chunk_end = min(chunk_start + chunk_size, n_traces)
             
-            # Apply mixing for this chunk of traces
-            for i in range(chunk_start, chunk_end):
-                # Pre-allocate window traces array
-                window_traces = np.zeros((window_size, n_samples))
-                
-                # Gather traces in the window
-                for j in range(window_size):
-                    trace_idx = self._handle_boundaries(i - half_window + j, n_traces)
-                    window_traces[j] = data[trace_idx]
-                
-                # Compute median trace (already vectorized in numpy)
-                result[i] = np.median(window_traces, axis=0)
+            # Gather the (traces, window, samples) stack of the chunk in one
+            # indexing pass and take the median over the window
+            positions = np.arange(chunk_start, chunk_end)[:, np.newaxis] + offsets
+            result[chunk_start:chunk_end] = np.median(data[window_idx[positions]], axis=1)
             
             # Report progress
             self.progress.emit(int(chunk_end * 100 / n_traces))
@@ -232,12 +234,7 @@ class TraceMixingDialog(QDialog):
         self.setObjectName("trace_mixing_dialog")
         
         # Setup window size and positioning
-        screen = QApplication.primaryScreen().geometry()
-        screen_width = min(screen.width(), 1920)
-        screen_height = min(screen.height(), 1080)   
-        window_width = int(screen_width * 0.8)
-        window_height = int(screen_height * 0.8)
-        self.setGeometry(100, 100, window_width, window_height)
+        self.setGeometry(*window_geometry(0.8, 0.8, pos=(100, 100)))
         
         self.segy_path = segy_path
         self.console = console
@@ -569,7 +566,10 @@ class TraceMixingDialog(QDialog):
                 weights = None
             else:
                 weights, window_size = self._validate_weights(self.weights_input.text())
-            data = self.seismic_data.copy()
+            # The worker only reads the traces, so it gets a read-only view
+            # instead of a copy; in-place writes would fail loudly
+            data = self.seismic_data.view()
+            data.setflags(write=False)
             self.progress_bar.setValue(0)
             self.setEnabled(False)
             self.apply_button.setEnabled(False)  # Disable apply button while running
@@ -1,6 +1,8 @@
 """Results tab for SEGYRecover application."""
 
 import os
+import math
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import (
@@ -9,15 +11,10 @@ from PySide6.QtWidgets import (
 )
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qtagg import NavigationToolbar2QT as NavigationToolbar
-import matplotlib.pyplot as plt
+from matplotlib import colormaps
+from matplotlib.colors import Normalize
 from matplotlib.figure import Figure
-import seisio
-import seisplot
-
-from ._5_1_edit_header import SEGYHeaderEditorDialog
-from ._5_2_mute_topography import MuteTopographyDialog
-from ._5_3_agc_rms_dialog import AGCRMSDialog
-from ._5_4_trace_mixing_dialog import TraceMixingDialog
+from matplotlib.ticker import FormatStrFormatter
 from ..utils.console_utils import section_header, success_message, error_message, info_message
 
 class SimpleNavigationToolbar(NavigationToolbar):
@@ -38,12 +35,16 @@ class ResultsTab(QWidget):
     # Signals
     newLineRequested = Signal()
     
+    # Most traces read and drawn for the section display; wider files are decimated
+    MAX_DISPLAY_TRACES = 2000
+    
     def __init__(self, console, work_dir, parent=None):
         super().__init__(parent)
         self.setObjectName("results_tab")
         self.console = console
         self.work_dir = work_dir
         self.segy_data = None
+        self.dt = None
         self.plot_type = "image"  # Default plot type
         
         # Create canvases for both plots
@@ -213,50 +214,106 @@ class ResultsTab(QWidget):
         self.agc_rms_button.setEnabled(True)
         self.trace_mixing_button.setEnabled(True)
         
-        # Display SEGY data
-        self._display_segy(segy_path)
+        # Display SEGY data and amplitude spectrum
+        self._display_section_and_spectrum(segy_path, filtered_data, dt)
+    
+    def _display_section_and_spectrum(self, segy_path, filtered_data, dt, data=None):
+        """Display the SEGY section and the amplitude spectrum.
+        
+        Reading and colormapping the section and computing the spectrum are
+        independent, so they run in two threads (NumPy and file reads release
+        the GIL); only the drawing happens here on the GUI thread.
+        """
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            section = pool.submit(self._prepare_segy, segy_path, data)
+            spectrum = pool.submit(self._compute_spectrum, filtered_data, dt)
+            self._draw_segy(*section.result())
+            self._display_spectrum(filtered_data, dt, spectrum)
+    
+    def _display_segy(self, segy_path, data=None):
+        """Display SEGY section, decimated to at most MAX_DISPLAY_TRACES traces.
         
-        # Display amplitude spectrum
-        self._display_spectrum(filtered_data, dt)
+        ``data`` can pass traces (ntraces, nsamples) already read from
+        ``segy_path``; otherwise only the displayed traces are read from disk.
+        """
+        self._draw_segy(*self._prepare_segy(segy_path, data))
     
-    def _display_segy(self, segy_path):
-        """Display SEGY section."""
-
-        # Clear existing figure
-        self.segy_ax.clear()
+    def _prepare_segy(self, segy_path, data=None):
+        """Read the displayed traces and return (rgba, trace_numbers, nsamples).
+        
+        Touches no widgets, so it can run outside the GUI thread.
+        """
+        import seisio
         
-        # Use seisio and seisplot to display the SEGY data
-        sio = seisio.input(segy_path)
-        dataset = sio.read_all_traces()
-        self.segy_data = dataset["data"]
-        
-        seisplot.plot(
-            self.segy_data, 
-            perc=100, 
-            haxis="tracf", 
-            hlabel="Trace no.", 
-            vlabel="Time (ms)",
-            ax=self.segy_ax,
+        # Read the SEGY data with seisio
+        if data is None:
+            sio = seisio.input(segy_path)
+            ntraces = sio.nt
+        else:
+            ntraces = len(data)
+        step = max(1, math.ceil(ntraces / self.MAX_DISPLAY_TRACES))
+        trace_numbers = np.arange(0, ntraces, step)
+        
+        if data is not None:
+            display_data = data[::step]
+        elif step == 1:
+            display_data = sio.read_all_traces()["data"]
+        else:
+            # Seek to every step-th trace instead of loading the whole file
+            display_data = sio.read_multibatch_of_traces(
+                start=0, count=len(trace_numbers), stride=step, block=1)["data"]
+        
+        # Clip symmetrically at the largest amplitude (seisplot's perc=100
+        # default). The colormap is applied once here to an RGBA uint8 image,
+        # so redraws only resample colors instead of re-normalizing amplitudes
+        clip = max(float(display_data.max()), -float(display_data.min())) or 1.0
+        rgba = colormaps['seismic'](Normalize(vmin=-clip, vmax=clip)(display_data.T), bytes=True)
+        return rgba, trace_numbers, display_data.shape[1]
+    
+    def _draw_segy(self, rgba, trace_numbers, nsamples):
+        """Draw the prepared section as one image, with time increasing downward."""
+        self.segy_ax.clear()
+        dt = self.dt or 1
+        self.segy_ax.imshow(
+            rgba,
+            interpolation='bilinear',
+            aspect='auto',
+            extent=[trace_numbers[0], trace_numbers[-1], (nsamples - 1) * dt, 0],
         )
+        self.segy_ax.set_xlabel("Trace no.", fontsize=12)
+        self.segy_ax.set_ylabel("Time (ms)", fontsize=12)
+        self.segy_ax.xaxis.set_major_formatter(FormatStrFormatter('%d'))
         
         self.segy_canvas.draw_idle()  
-            
     
-    def _display_spectrum(self, filtered_data, dt):
-        """Display amplitude spectrum."""
+    @staticmethod
+    def _compute_spectrum(filtered_data, dt):
+        """Return (freqs, normalized mean amplitude) of the traces' spectra."""
+        fs = 1 / (dt / 1000)  # Convert dt from ms to s
+        
+        # One real FFT over all traces; only non-negative frequencies are computed.
+        # Single precision is plenty for a normalised display spectrum
+        fs_filtered = np.fft.rfft(np.asarray(filtered_data, dtype=np.float32), axis=0)
+        freqs = np.fft.rfftfreq(filtered_data.shape[0], 1/fs)
+        
+        # Magnitudes go into one preallocated real buffer; normalise in place
+        amplitude = np.abs(fs_filtered, out=np.empty(fs_filtered.shape, dtype=fs_filtered.real.dtype))
+        fsa_filtered = amplitude.mean(axis=1)
+        fsa_filtered /= fsa_filtered.max()
+        return freqs, fsa_filtered
+    
+    def _display_spectrum(self, filtered_data, dt, spectrum=None):
+        """Display amplitude spectrum.
+        
+        ``spectrum`` can pass a future already computing it in another thread.
+        """
         try:
-            self.spectrum_ax.clear()
+            if spectrum is not None:
+                freqs, fsa_filtered = spectrum.result()
+            else:
+                freqs, fsa_filtered = self._compute_spectrum(filtered_data, dt)
             
-            # Calculate and plot spectrum
-            fs = 1 / (dt / 1000)  # Convert dt from ms to s
-            fs_filtered = np.zeros(filtered_data.shape, dtype=complex)
-            
-            for i in range(filtered_data.shape[1]):
-                fs_filtered[:, i] = np.fft.fft(filtered_data[:, i])
-            
-            freqs = np.fft.fftfreq(filtered_data.shape[0], 1/fs)
-            fsa_filtered = np.mean(np.abs(fs_filtered), axis=1)
-            fsa_filtered = fsa_filtered/np.max(fsa_filtered)
+            self.spectrum_ax.clear()
             
             # Plot positive frequencies
             pos_freq_mask = freqs >= 1
@@ -273,26 +330,39 @@ class ResultsTab(QWidget):
             self.spectrum_canvas.draw_idle()  
             
         except Exception as e:
-            self.console.append(f"Error displaying amplitude spectrum: {str(e)}")
+            self.console.appendPlainText(f"Error displaying amplitude spectrum: {str(e)}")
             self.spectrum_ax.clear()
             self.spectrum_ax.text(0.5, 0.5, "Error creating amplitude spectrum", 
                           ha='center', va='center', fontsize=12, color='red')
             self.spectrum_canvas.draw()
 
+    @staticmethod
+    def _exec_disposable(dialog):
+        """Run a processing dialog modally and return (result, output_file).
+        
+        The output file is read before the dialog is scheduled for deletion,
+        so the dialog and its figures are freed instead of being kept as
+        children of the tab for the rest of the session.
+        """
+        result = dialog.exec()
+        output_file = getattr(dialog, "output_file", None)
+        dialog.deleteLater()
+        return result, output_file
+
     def edit_segy_header(self):
         """Open dialog to edit SEGY header."""
 
         section_header(self.console, "SEGY HEADER EDITOR")
         info_message(self.console, "Opening SEGY Header Editor dialog...")
 
+        from ._5_1_edit_header import SEGYHeaderEditorDialog
         dialog = SEGYHeaderEditorDialog(
             segy_path=self.segy_path,
             console=self.console,
             work_dir=self.work_dir,
             parent=self
         )
-        
-        result = dialog.exec()
+        result, output_file = self._exec_disposable(dialog)
         
         if result == QDialog.Accepted:
             info_message(self.console, "Reloading data from updated SEGY file...")
@@ -310,25 +380,25 @@ class ResultsTab(QWidget):
         section_header(self.console, "MUTE TOPOGRAPHY")
         info_message(self.console, "Opening Mute Topography dialog...")
 
+        from ._5_2_mute_topography import MuteTopographyDialog
         dialog = MuteTopographyDialog(
             segy_path=self.segy_path,
             console=self.console,
             work_dir=self.work_dir,
             parent=self
         )
-        
-        result = dialog.exec()
+        result, output_file = self._exec_disposable(dialog)
         
         if result == QDialog.Accepted:
             info_message(self.console, "Reloading data from updated SEGY file after muting topography...")
             try:
+                import seisio
                 sio = seisio.input(self.segy_path)
                 dataset = sio.read_all_traces()
                 updated_data = dataset["data"]
                 self.filtered_data = updated_data
                 self.segy_data = updated_data
-                self._display_segy(self.segy_path)
-                self._display_spectrum(updated_data.T, self.dt)
+                self._display_section_and_spectrum(self.segy_path, updated_data.T, self.dt, updated_data)
                 success_message(self.console, "Muted SEGY data loaded successfully.")
             except Exception as e:
                 error_message(self.console, f"Error reloading SEGY file after muting: {str(e)}")
@@ -340,27 +410,26 @@ class ResultsTab(QWidget):
         section_header(self.console, "AGC RMS")
         info_message(self.console, "Opening AGC RMS dialog...")
 
+        from ._5_3_agc_rms_dialog import AGCRMSDialog
         dialog = AGCRMSDialog(
             segy_path=self.segy_path,
             console=self.console,
             work_dir=self.work_dir,
             parent=self
         )
-        
-        result = dialog.exec()
+        result, output_file = self._exec_disposable(dialog)
         
         if result == QDialog.Accepted:
             try:
-                output_file = dialog.output_file
                 if output_file != self.segy_path:
                     self.segy_path = output_file
+                import seisio
                 sio = seisio.input(self.segy_path)
                 dataset = sio.read_all_traces()
                 updated_data = dataset["data"]
                 self.filtered_data = updated_data
                 self.segy_data = updated_data
-                self._display_segy(self.segy_path)
-                self._display_spectrum(updated_data.T, self.dt)
+                self._display_section_and_spectrum(self.segy_path, updated_data.T, self.dt, updated_data)
             except Exception as e:
                 error_message(self.console, f"Error reloading SEGY file after AGC RMS: {str(e)}")
         else:
@@ -371,27 +440,26 @@ class ResultsTab(QWidget):
         section_header(self.console, "TRACE MIXING")
         info_message(self.console, "Opening Trace Mixing dialog...")
 
+        from ._5_4_trace_mixing_dialog import TraceMixingDialog
         dialog = TraceMixingDialog(
             segy_path=self.segy_path,
             console=self.console,
             work_dir=self.work_dir,
             parent=self
         )
-        
-        result = dialog.exec()
+        result, output_file = self._exec_disposable(dialog)
         
         if result == QDialog.Accepted:
             try:
-                output_file = dialog.output_file
                 if output_file != self.segy_path:
                     self.segy_path = output_file
+                import seisio
                 sio = seisio.input(self.segy_path)
                 dataset = sio.read_all_traces()
                 updated_data = dataset["data"]
                 self.filtered_data = updated_data
                 self.segy_data = updated_data
-                self._display_segy(self.segy_path)
-                self._display_spectrum(updated_data.T, self.dt)
+                self._display_section_and_spectrum(self.segy_path, updated_data.T, self.dt, updated_data)
                 success_message(self.console, "Trace mixing processed data loaded successfully.")
             except Exception as e:
                 error_message(self.console, f"Error reloading SEGY file after trace mixing: {str(e)}")
@@ -1,13 +1,18 @@
 import os
-from PySide6.QtGui import QFont
+from PySide6.QtGui import QFont, QTextDocument
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (QRadioButton, QButtonGroup, QFileDialog,
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QApplication,
-    QPushButton, QGroupBox, QScrollArea, QWidget, QDialog, QDialogButtonBox,
+    QPushButton, QGroupBox, QTextBrowser, QWidget, QDialog, QDialogButtonBox,
     QFrame
 )
 
 from .. import __version__
+from ..utils.window_utils import window_geometry
+
+# Home directory and the Documents data location offered on first run
+_HOME = os.path.expanduser("~")
+_DOCUMENTS_LOCATION = os.path.join(_HOME, "Documents", "SEGYRecover")
 
 
 class AboutDialog(QDialog):
@@ -18,14 +23,7 @@ class AboutDialog(QDialog):
         self.setWindowTitle("About SEGYRecover")
         
         # Fix window sizing and positioning
-        screen = QApplication.primaryScreen().geometry()
-        screen_width = min(screen.width(), 1920)
-        screen_height = min(screen.height(), 1080)
-        window_width = int(screen_width * 0.3)
-        window_height = int(screen_height * 0.4)  # Smaller height
-        pos_x = (screen_width - window_width) // 2
-        pos_y = (screen_height - window_height) // 2
-        self.setGeometry(pos_x, pos_y, window_width, window_height)
+        self.setGeometry(*window_geometry(0.3, 0.4))  # Smaller height
         
         layout = QVBoxLayout(self)
         layout.setSpacing(15)
@@ -83,22 +81,128 @@ class AboutDialog(QDialog):
         layout.addWidget(buttons)
 
 
+# Help guide content, parsed once into a shared QTextDocument (see HelpDialog)
+_HELP_HTML = (
+    "<h3>Introduction</h3>"
+    "<p><b>SEGYRecover</b> is a comprehensive tool designed to digitize seismic images into SEGY format. "
+    "This guide will help you use the application effectively.</p>"
+
+    "<h3>Visualization Controls</h3>"
+    "<p>The application provides a set of tools to navigate and interact with the seismic image:</p>"
+    "<h4 style='margin-top: 10px; margin-bottom: 6px;'>Navigation Toolbar</h4>"
+    "<ul style='margin-top: 0px;'>"
+    "<li>🏠 <b>Home:</b> Reset view to original display</li>"
+    "<li>✋ <b>Pan:</b> Left click and drag to move around</li>"
+    "<li>🔍 <b>Zoom:</b> Left click and drag to zoom into a rectangular region</li>"
+    "<li>💾 <b>Save:</b> Save the figure</li>"
+    "</ul>"
+
+    "<h3>SEGYRecover Workflow</h3>"
+    "<p>The application follows a step-by-step process through a series of tabs to digitize and rectify seismic images:</p>"
+
+    "<h4 style='margin-top: 15px; margin-bottom: 6px;'>Welcome Tab</h4>"
+    "<ul style='margin-top: 0px;'>"
+    "<li>View basic information about SEGYRecover</li>"
+    "<li>Click the \"Start New Line\" button to begin the digitization process</li>"
+    "</ul>"
+
+    "<h4 style='margin-top: 15px; margin-bottom: 6px;'>1. Load Image Tab</h4>"
+    "<ul style='margin-top: 0px;'>"
+    "<li>Click \"Load Image\" to select an image (TIF, JPEG, PNG)</li>"
+    "<li>Images should be in binary format (black and white pixels only)</li>"
+    "<li>The corresponding geometry file in the GEOMETRY folder will be automatically loaded and displayed</li>"
+    "<li>Click \"Next\" to move to the Parameters tab</li>"
+    "</ul>"
+
+    "<h4 style='margin-top: 15px; margin-bottom: 6px;'>2. Parameters Tab</h4>"
+    "<ul style='margin-top: 0px;'>"
+    "<li><b>ROI Points</b>: Set trace number and TWT values for the 3 corner points</li>"
+    "<li><b>Acquisition Parameters</b>:"
+    "<ul>"
+    "<li>Sample Rate (DT): Time interval in milliseconds</li>"
+    "<li>Frequency Band (F1-F4): Filter corners in Hz</li>"
+    "</ul>"
+    "</li>"
+    "<li><b>Detection Parameters</b>:"
+    "<ul>"
+    "<li>TLT: Thickness in pixels of vertical trace lines</li>"
+    "<li>HLT: Thickness in pixels of horizontal time lines</li>"
+    "<li>HE: Erosion size for horizontal features</li>"
+    "<li><b>Advanced parameters:</b></li>"
+    "<li>BDB: Beginning of baseline detection range in pixels from the top</li>"
+    "<li>BDE: End of baseline detection range in pixels from the top</li>"
+    "<li>BFT: Baseline filter threshold</li>"
+    "</ul>"
+    "</li>"
+    "<li>Click \"Save Parameters\" to save settings, then \"Next\" to continue</li>"
+    "</ul>"
+
+    "<h4 style='margin-top: 15px; margin-bottom: 6px;'>3. ROI Selection Tab</h4>"
+    "<ul style='margin-top: 0px;'>"
+    "<li>Select 3 corner points on the image using the buttons provided:"
+    "<ol>"
+    "<li>Top-left corner (P1)</li>"
+    "<li>Top-right corner (P2)</li>"
+    "<li>Bottom-left corner (P3)</li>"
+    "</ol>"
+    "</li>"
+    "<li>Use the navigation toolbar to zoom for accurate point selection</li>"
+    "<li>The fourth corner will be calculated automatically</li>"
+    "<li>The selected region will be rectified and displayed in the right panel</li>"
+    "<li>Click \"Next\" to move to the Digitization tab</li>"
+    "</ul>"
+
+    "<h4 style='margin-top: 15px; margin-bottom: 6px;'>4. Digitization Tab</h4>"
+    "<ul style='margin-top: 0px;'>"
+    "<li>View the processing steps visually represented at the top of the tab</li>"
+    "<li>Click \"Start Digitization\" to begin processing</li>"
+    "<li>The process will proceed through these steps automatically:"
+    "<ol>"
+    "<li>Timeline Removal</li>"
+    "<li>Baseline Detection</li>"
+    "<li>Amplitude Extraction</li>"
+    "<li>Resampling & Filtering</li>"
+    "<li>SEGY Creation</li>"
+    "</ol>"
+    "</li>"
+    "<li>Progress is shown in visualization tabs that update during processing</li>"
+    "<li>When complete, click \"See Results\" to move to the Results tab</li>"
+    "</ul>"
+
+    "<h4 style='margin-top: 15px; margin-bottom: 6px;'>5. Results Tab</h4>"
+    "<ul style='margin-top: 0px;'>"
+    "<li>Displays the digitized SEGY section in the left panel</li>"
+    "<li>Shows the average amplitude spectrum in the right panel</li>"
+    "<li>Change display type using the dropdown (Variable Density/Wiggle)</li>"
+    "<li>View file information including size and dimensions</li>"
+    "<li>Click \"Start New Line\" to process another seismic image</li>"
+    "</ul>"
+
+    "<h3>File Structure</h3>"
+    "<p>SEGYRecover organizes data in the following folders:</p>"
+    "<ul>"
+    "<li><b>IMAGES/</b>: Store input seismic images</li>"
+    "<li><b>GEOMETRY/</b>: Store .geometry files with trace coordinates</li>"
+    "<li><b>ROI/</b>: Store region of interest points</li>"
+    "<li><b>PARAMETERS/</b>: Store processing parameters</li>"
+    "<li><b>SEGY/</b>: Store output SEGY files</li>"
+    "</ul>"
+)
+
+
 class HelpDialog(QDialog):
     """Help dialog with information about the application."""
     
+    # Parsed help document shared by all instances
+    _document = None
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("How to Use SEGYRecover")    
         
         # Fix window sizing and positioning
-        screen = QApplication.primaryScreen().geometry()
-        screen_width = min(screen.width(), 1920)
-        screen_height = min(screen.height(), 1080)
-        window_width = int(screen_width * 0.4)  # Slightly wider for better readability
-        window_height = int(screen_height * 0.75)  # Not too tall
-        pos_x = (screen_width - window_width) // 2
-        pos_y = (screen_height - window_height) // 2
-        self.setGeometry(pos_x, pos_y, window_width, window_height)
+        # Slightly wider for better readability, but not too tall
+        self.setGeometry(*window_geometry(0.4, 0.75))
         
         # Main layout
         main_layout = QVBoxLayout(self)
@@ -123,184 +227,12 @@ class HelpDialog(QDialog):
         main_layout.addWidget(header_container)
         main_layout.addWidget(separator)
         
-        # Create scroll area with custom styling
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setFrameShape(QFrame.NoFrame)
-        
-        # Content widget with styled sections
-        content_widget = QWidget()
-        content_layout = QVBoxLayout(content_widget)
-        content_layout.setSpacing(15)
-        content_layout.setContentsMargins(5, 10, 15, 10)  # Adjusted for scrollbar
-        
-        # Introduction section
-        intro_frame = self._create_section_frame()
-        intro_layout = QVBoxLayout(intro_frame)
-        
-        intro_title = QLabel("Introduction")
-        intro_title.setFont(QFont("Arial", 14, QFont.Bold))
-        intro_layout.addWidget(intro_title)
-        
-        intro_text = QLabel(
-            "<p><b>SEGYRecover</b> is a comprehensive tool designed to digitize seismic images into SEGY format. "
-            "This guide will help you use the application effectively.</p>"
-        )
-        intro_text.setTextFormat(Qt.RichText)
-        intro_text.setWordWrap(True)
-        intro_layout.addWidget(intro_text)
-        
-        content_layout.addWidget(intro_frame)
-        
-        # Navigation section
-        nav_frame = self._create_section_frame()
-        nav_layout = QVBoxLayout(nav_frame)
-        
-        nav_title = QLabel("Visualization Controls")
-        nav_title.setFont(QFont("Arial", 14, QFont.Bold))
-        nav_layout.addWidget(nav_title)
-        
-        nav_text = QLabel(
-            "<p>The application provides a set of tools to navigate and interact with the seismic image:</p>"
-            "<h4 style='margin-top: 10px; margin-bottom: 6px;'>Navigation Toolbar</h4>"
-            "<ul style='margin-top: 0px;'>"
-            "<li>🏠 <b>Home:</b> Reset view to original display</li>"
-            "<li>✋ <b>Pan:</b> Left click and drag to move around</li>"
-            "<li>🔍 <b>Zoom:</b> Left click and drag to zoom into a rectangular region</li>"
-            "<li>💾 <b>Save:</b> Save the figure</li>"
-            "</ul>"
-        )
-        nav_text.setTextFormat(Qt.RichText)
-        nav_text.setWordWrap(True)
-        nav_layout.addWidget(nav_text)
-        
-        content_layout.addWidget(nav_frame)
-        
-        # Workflow section
-        workflow_frame = self._create_section_frame()
-        workflow_layout = QVBoxLayout(workflow_frame)
-        
-        workflow_title = QLabel("SEGYRecover Workflow")
-        workflow_title.setFont(QFont("Arial", 14, QFont.Bold))
-        workflow_layout.addWidget(workflow_title)
-        
-        workflow_text = QLabel(
-            "<p>The application follows a step-by-step process through a series of tabs to digitize and rectify seismic images:</p>"
-            
-            "<h4 style='margin-top: 15px; margin-bottom: 6px;'>Welcome Tab</h4>"
-            "<ul style='margin-top: 0px;'>"
-            "<li>View basic information about SEGYRecover</li>"
-            "<li>Click the \"Start New Line\" button to begin the digitization process</li>"
-            "</ul>"
-            
-            "<h4 style='margin-top: 15px; margin-bottom: 6px;'>1. Load Image Tab</h4>"
-            "<ul style='margin-top: 0px;'>"
-            "<li>Click \"Load Image\" to select an image (TIF, JPEG, PNG)</li>"
-            "<li>Images should be in binary format (black and white pixels only)</li>"
-            "<li>The corresponding geometry file in the GEOMETRY folder will be automatically loaded and displayed</li>"
-            "<li>Click \"Next\" to move to the Parameters tab</li>"
-            "</ul>"
-            
-            "<h4 style='margin-top: 15px; margin-bottom: 6px;'>2. Parameters Tab</h4>"
-            "<ul style='margin-top: 0px;'>"
-            "<li><b>ROI Points</b>: Set trace number and TWT values for the 3 corner points</li>"
-            "<li><b>Acquisition Parameters</b>:"
-            "<ul>"
-            "<li>Sample Rate (DT): Time interval in milliseconds</li>"
-            "<li>Frequency Band (F1-F4): Filter corners in Hz</li>"
-            "</ul>"
-            "</li>"
-            "<li><b>Detection Parameters</b>:"
-            "<ul>"
-            "<li>TLT: Thickness in pixels of vertical trace lines</li>"
-            "<li>HLT: Thickness in pixels of horizontal time lines</li>"
-            "<li>HE: Erosion size for horizontal features</li>"
-            "<li><b>Advanced parameters:</b></li>"
-            "<li>BDB: Beginning of baseline detection range in pixels from the top</li>"
-            "<li>BDE: End of baseline detection range in pixels from the top</li>"
-            "<li>BFT: Baseline filter threshold</li>"
-            "</ul>"
-            "</li>"
-            "<li>Click \"Save Parameters\" to save settings, then \"Next\" to continue</li>"
-            "</ul>"
-            
-            "<h4 style='margin-top: 15px; margin-bottom: 6px;'>3. ROI Selection Tab</h4>"
-            "<ul style='margin-top: 0px;'>"
-            "<li>Select 3 corner points on the image using the buttons provided:"
-            "<ol>"
-            "<li>Top-left corner (P1)</li>"
-            "<li>Top-right corner (P2)</li>"
-            "<li>Bottom-left corner (P3)</li>"
-            "</ol>"
-            "</li>"
-            "<li>Use the navigation toolbar to zoom for accurate point selection</li>"
-            "<li>The fourth corner will be calculated automatically</li>"
-            "<li>The selected region will be rectified and displayed in the right panel</li>"
-            "<li>Click \"Next\" to move to the Digitization tab</li>"
-            "</ul>"
-            
-            "<h4 style='margin-top: 15px; margin-bottom: 6px;'>4. Digitization Tab</h4>"
-            "<ul style='margin-top: 0px;'>"
-            "<li>View the processing steps visually represented at the top of the tab</li>"
-            "<li>Click \"Start Digitization\" to begin processing</li>"
-            "<li>The process will proceed through these steps automatically:"
-            "<ol>"
-            "<li>Timeline Removal</li>"
-            "<li>Baseline Detection</li>"
-            "<li>Amplitude Extraction</li>"
-            "<li>Resampling & Filtering</li>"
-            "<li>SEGY Creation</li>"
-            "</ol>"
-            "</li>"
-            "<li>Progress is shown in visualization tabs that update during processing</li>"
-            "<li>When complete, click \"See Results\" to move to the Results tab</li>"
-            "</ul>"
-            
-            "<h4 style='margin-top: 15px; margin-bottom: 6px;'>5. Results Tab</h4>"
-            "<ul style='margin-top: 0px;'>"
-            "<li>Displays the digitized SEGY section in the left panel</li>"
-            "<li>Shows the average amplitude spectrum in the right panel</li>"
-            "<li>Change display type using the dropdown (Variable Density/Wiggle)</li>"
-            "<li>View file information including size and dimensions</li>"
-            "<li>Click \"Start New Line\" to process another seismic image</li>"
-            "</ul>"
-        )
-        workflow_text.setTextFormat(Qt.RichText)
-        workflow_text.setWordWrap(True)
-        workflow_layout.addWidget(workflow_text)
-        
-        content_layout.addWidget(workflow_frame)
-        
-        # File Structure section
-        file_frame = self._create_section_frame()
-        file_layout = QVBoxLayout(file_frame)
-        
-        file_title = QLabel("File Structure")
-        file_title.setFont(QFont("Arial", 14, QFont.Bold))
-        file_layout.addWidget(file_title)
-        
-        file_text = QLabel(
-            "<p>SEGYRecover organizes data in the following folders:</p>"
-            "<ul>"
-            "<li><b>IMAGES/</b>: Store input seismic images</li>"
-            "<li><b>GEOMETRY/</b>: Store .geometry files with trace coordinates</li>"
-            "<li><b>ROI/</b>: Store region of interest points</li>"
-            "<li><b>PARAMETERS/</b>: Store processing parameters</li>"
-            "<li><b>SEGY/</b>: Store output SEGY files</li>"
-            "</ul>"
-        )
-        file_text.setTextFormat(Qt.RichText)
-        file_text.setWordWrap(True)
-        file_layout.addWidget(file_text)
-        
-        content_layout.addWidget(file_frame)
-        
-        # Add spacer at the bottom
-        content_layout.addStretch()
-        
-        # Set the content widget in the scroll area
-        scroll_area.setWidget(content_widget)
-        main_layout.addWidget(scroll_area, 1)  # 1 = stretch factor
+        # Help content in a text browser, which scrolls natively and caches its layout
+        browser = QTextBrowser()
+        browser.setFrameShape(QFrame.NoFrame)
+        browser.setOpenExternalLinks(True)
+        browser.setDocument(self._shared_document().clone(browser))
+        main_layout.addWidget(browser, 1)  # 1 = stretch factor
         
         # Button section
         button_container = QWidget()
@@ -316,10 +248,13 @@ class HelpDialog(QDialog):
         
         main_layout.addWidget(button_container)
     
-    def _create_section_frame(self, bg_color="#ffffff"):
-        """Create a styled frame for a help section."""
-        frame = QFrame()
-        return frame
+    @classmethod
+    def _shared_document(cls):
+        """Return the help document, parsing the HTML only on first use."""
+        if cls._document is None:
+            cls._document = QTextDocument()
+            cls._document.setHtml(_HELP_HTML)
+        return cls._document
 
 
 class FirstRunDialog(QDialog):
@@ -327,18 +262,12 @@ class FirstRunDialog(QDialog):
     
     def __init__(self, parent=None, default_location=None):
         super().__init__(parent)
+        self.default_location = default_location
         self.selected_location = default_location
         self.custom_location = None
         
         self.setWindowTitle("Welcome to SEGYRecover")
-        screen = QApplication.primaryScreen().geometry()
-        screen_width = min(screen.width(), 1920)
-        screen_height = min(screen.height(), 1080)
-        window_width = int(screen_width * 0.3)
-        window_height = int(screen_height * 0.45)  # Slightly taller for better spacing
-        pos_x = (screen_width - window_width) // 2
-        pos_y = (screen_height - window_height) // 2
-        self.setGeometry(pos_x, pos_y, window_width, window_height)
+        self.setGeometry(*window_geometry(0.3, 0.45))  # Slightly taller for better spacing
         self.setup_ui()
     
     def setup_ui(self):
@@ -378,13 +307,12 @@ class FirstRunDialog(QDialog):
         
         # Default location option (from appdirs)
         self.default_radio = QRadioButton("Default location (system-managed)", self)
-        self.default_radio.setToolTip(f"Store in: {self.selected_location}")
+        self.default_radio.setToolTip(f"Store in: {self.default_location}")
         self.location_btn_group.addButton(self.default_radio, 1)
         location_layout.addWidget(self.default_radio)
         
         # Documents folder option
-        documents_path = os.path.join(os.path.expanduser("~"), "Documents", "SEGYRecover")
-        self.documents_radio = QRadioButton(f"Documents folder: {documents_path}", self)
+        self.documents_radio = QRadioButton(f"Documents folder: {_DOCUMENTS_LOCATION}", self)
         self.location_btn_group.addButton(self.documents_radio, 2)
         location_layout.addWidget(self.documents_radio)
         
@@ -443,31 +371,45 @@ class FirstRunDialog(QDialog):
         
         # Set default selection
         self.default_radio.setChecked(True)
-        self.location_btn_group.buttonClicked.connect(self.update_selection)
+        self.default_radio.clicked.connect(self._use_default_location)
+        self.documents_radio.clicked.connect(self._use_documents_location)
+        self.custom_radio.clicked.connect(self._use_custom_location)
     
     def browse_location(self):
         """Open file dialog to select custom location."""
-        directory = QFileDialog.getExistingDirectory(
+        # Opened with open() so the event loop keeps running while browsing
+        dialog = QFileDialog(
             self, 
             "Select Directory for SEGYRecover Data",
-            os.path.expanduser("~")
+            _HOME
         )
-        
+        dialog.setFileMode(QFileDialog.Directory)
+        dialog.setOptions(QFileDialog.ShowDirsOnly | QFileDialog.DontUseNativeDialog)
+        dialog.setAttribute(Qt.WA_DeleteOnClose)
+        dialog.fileSelected.connect(self._set_custom_location)
+        dialog.open()
+    
+    def _set_custom_location(self, directory):
+        """Use a SEGYRecover folder inside the chosen directory."""
         if directory:
             self.custom_location = os.path.join(directory, "SEGYRecover")
             self.path_label.setText(f"Selected: {self.custom_location}")
             self.custom_radio.setChecked(True)
-            self.update_selection(self.custom_radio)
+            self._use_custom_location()
+    
+    def _use_default_location(self):
+        """Select the system-managed default location."""
+        self.selected_location = self.default_location
+        self.path_label.setText("Using system default location")
+    
+    def _use_documents_location(self):
+        """Select the SEGYRecover folder in the user's Documents."""
+        self.selected_location = _DOCUMENTS_LOCATION
+        self.path_label.setText(f"Selected: {self.selected_location}")
     
-    def update_selection(self, button):
-        """Update the selected location based on radio button choice."""
-        if button == self.default_radio:
-            self.selected_location = self.selected_location
-            self.path_label.setText("Using system default location")
-        elif button == self.documents_radio:
-            self.selected_location = os.path.join(os.path.expanduser("~"), "Documents", "SEGYRecover")
-            self.path_label.setText(f"Selected: {self.selected_location}")
-        elif button == self.custom_radio and self.custom_location:
+    def _use_custom_location(self):
+        """Select the browsed custom location, once one has been chosen."""
+        if self.custom_location:
             self.selected_location = self.custom_location
             self.path_label.setText(f"Selected: {self.custom_location}")
     
@@ -1,22 +1,18 @@
 """Main window for SEGYRecover application."""
-import matplotlib
-matplotlib.use('QtAgg')
 import os
+import sys
 import json
-import subprocess
+import time
+import logging
+import collections
 from PySide6.QtGui import QFont, QAction
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer, QFileSystemWatcher
 from PySide6.QtWidgets import (
     QApplication, QStatusBar, QProgressBar, QVBoxLayout, QLabel, 
-    QPushButton, QMessageBox, QWidget, QTextEdit, QStyle, QDialog, 
+    QPushButton, QMessageBox, QWidget, QPlainTextEdit, QStyle, QDialog, 
     QFileDialog, QMainWindow, QSplitter, QHBoxLayout
 )
 
-import appdirs
-
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-import matplotlib.pyplot as plt
-
 from .help_dialogs import HelpDialog, FirstRunDialog, AboutDialog
 from ..utils.resource_utils import copy_tutorial_files
 from ..utils.console_utils import (
@@ -33,6 +29,61 @@ from ._3_roi_selection_tab import ROISelectionTab
 from ._4_digitization_tab import DigitizationTab
 from ._5_results_tab import ResultsTab
 
+def _user_dirs(app_name):
+    """Return the (data, config) directories for the application."""
+    import appdirs
+    return appdirs.user_data_dir(app_name), appdirs.user_config_dir(app_name)
+
+logger = logging.getLogger(__name__)
+
+# Command that opens a directory in the platform's file manager
+_OPENER = ('start',) if os.name == 'nt' else (('open',) if sys.platform == 'darwin' else ('xdg-open',))
+
+class _Icons:
+    """Standard icons, looked up from the style once and reused."""
+    cache = {}
+
+    @classmethod
+    def get(cls, style, key):
+        icon = cls.cache.get(key)
+        if icon is None:
+            icon = cls.cache[key] = style.standardIcon(key)
+        return icon
+
+class _ConsoleLogHandler(logging.Handler):
+    """Logging handler that writes records to the console in batches.
+    
+    Records are queued and flushed on the GUI thread with a short timer, so
+    a burst of messages costs a single console update.
+    """
+    
+    FLUSH_INTERVAL_MS = 16
+    
+    def __init__(self, console):
+        super().__init__()
+        self.console = console
+        self._pending = collections.deque(maxlen=2000)
+        self._flush_scheduled = False
+        self.setFormatter(logging.Formatter("%(message)s"))
+    
+    def emit(self, record):
+        try:
+            self._pending.append(self.format(record))
+        except Exception:
+            self.handleError(record)
+            return
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            QTimer.singleShot(self.FLUSH_INTERVAL_MS, self._flush)
+    
+    def _flush(self):
+        self._flush_scheduled = False
+        if not self._pending:
+            return
+        lines = list(self._pending)
+        self._pending.clear()
+        self.console.appendPlainText("\n".join(lines))
+
 class ProgressStatusBar(QStatusBar):
     """Status bar with integrated progress bar."""
 
@@ -51,7 +102,7 @@ class ProgressStatusBar(QStatusBar):
         # Create cancel button
         self.cancel_button = QPushButton()
         self.cancel_button.setObjectName("cancel_button")
-        self.cancel_button.setIcon(self.style().standardIcon(QStyle.SP_DialogCancelButton))
+        self.cancel_button.setIcon(_Icons.get(self.style(), QStyle.SP_DialogCancelButton))
         self.cancel_button.setVisible(False)
         self.cancel_button.clicked.connect(self.cancel)
         
@@ -61,8 +112,14 @@ class ProgressStatusBar(QStatusBar):
         
         self._canceled = False
         
+        # Last percentage and time events were processed, to throttle redraws
+        self._last_pct = -1
+        self._last_ts = 0.0
+        
     def start(self, title, maximum):
         self._canceled = False
+        self._last_pct = 0
+        self._last_ts = time.monotonic()
         self.showMessage(title)
         self.progress_bar.setMaximum(maximum)
         self.progress_bar.setValue(0)
@@ -74,7 +131,15 @@ class ProgressStatusBar(QStatusBar):
         if message:
             self.showMessage(message)
         self.progress_bar.setValue(value)
-        QApplication.processEvents()
+        
+        # Only process events when the percentage changes or about every 33 ms
+        # (~30 FPS), so tight loops are not dominated by repaints
+        pct = int(value * 100 / max(self.progress_bar.maximum(), 1))
+        now = time.monotonic()
+        if pct != self._last_pct or now - self._last_ts > 0.033:
+            self._last_pct = pct
+            self._last_ts = now
+            QApplication.processEvents()
         
     def finish(self):
         self.clearMessage()
@@ -92,6 +157,9 @@ class ProgressStatusBar(QStatusBar):
 class SegyRecover(QMainWindow):
     """Main application widget for SEGYRecover."""
     
+    # Parsed config.json, shared by all windows until the file changes on disk
+    _config_cache = None
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setObjectName("main_window")
@@ -101,15 +169,21 @@ class SegyRecover(QMainWindow):
         
         # Get appropriate directories for user data and config
         self.app_name = "SEGYRecover"
-        self.user_data_dir = appdirs.user_data_dir(self.app_name)
-        self.user_config_dir = appdirs.user_config_dir(self.app_name)
+        self.user_data_dir, self.user_config_dir = _user_dirs(self.app_name)
         
         # Ensure config directory exists
-        os.makedirs(self.user_config_dir, exist_ok=True)
+        if not os.path.isdir(self.user_config_dir):
+            os.makedirs(self.user_config_dir, exist_ok=True)
         self.config_path = os.path.join(self.user_config_dir, 'config.json')
         
         self.load_config()
         
+        # Drop the cached config whenever config.json is modified
+        self._config_watcher = QFileSystemWatcher(self)
+        if os.path.exists(self.config_path):
+            self._config_watcher.addPath(self.config_path)
+        self._config_watcher.fileChanged.connect(self._config_file_changed)
+        
         # Initialize state variables
         self.image_path = None
         self.img_array = None
@@ -118,8 +192,8 @@ class SegyRecover(QMainWindow):
         self.binary_rectified_image = None
         self.parameters = {}
         self.image_canvas = None  # Initialize this here for the initialize call below
-        
-        self.create_required_folders()
+        self._help_dialog = None
+        self._about_dialog = None
 
         # Initialize the central widget with a horizontal layout
         self.central_widget = QWidget()
@@ -152,10 +226,14 @@ class SegyRecover(QMainWindow):
         content_layout.addWidget(self.tab_container, 1)  # 1 = stretch factor
         
         # Create and add console
-        self.console = QTextEdit()
+        # A plain text console with a block limit keeps long sessions from
+        # growing the document (and each append) without bound
+        self.console = QPlainTextEdit()
         self.console.setObjectName("console")  
+        self.console.setMaximumBlockCount(5000)
+        self.console.setUndoRedoEnabled(False)
         self.console.setReadOnly(True)
-        self.console.setLineWrapMode(QTextEdit.WidgetWidth) 
+        self.console.setLineWrapMode(QPlainTextEdit.WidgetWidth) 
         content_layout.addWidget(self.console)
         
         # Add content container to main layout
@@ -165,6 +243,10 @@ class SegyRecover(QMainWindow):
         self.progress = ProgressStatusBar()
         self.setStatusBar(self.progress)
 
+        # Send this window's log messages to the console
+        logger.addHandler(_ConsoleLogHandler(self.console))
+        logger.setLevel(logging.INFO)
+
         # Enable auto-scroll for the console
         self.console.textChanged.connect(lambda: self.console.verticalScrollBar().setValue(self.console.verticalScrollBar().maximum()))
 
@@ -175,8 +257,15 @@ class SegyRecover(QMainWindow):
         
 
         
-        # Create matplotlib figure for the image canvas
-        figure = plt.figure()
+        # Create matplotlib figure for the image canvas. A plain Figure is
+        # owned by its canvas and never registered with pyplot; the backend is
+        # still pinned to QtAgg because seisplot goes through pyplot internally,
+        # which must not resolve to a different GUI backend
+        import matplotlib
+        matplotlib.use('QtAgg')
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+        figure = Figure()
         self.image_canvas = FigureCanvas(figure)
         
 
@@ -334,14 +423,14 @@ class SegyRecover(QMainWindow):
         
         # Set directory action
         set_dir_action = QAction("Set Data Directory", self)
-        set_dir_action.setIcon(self.style().standardIcon(QStyle.SP_DirIcon))
+        set_dir_action.setIcon(_Icons.get(self.style(), QStyle.SP_DirIcon))
         set_dir_action.setShortcut("Ctrl+D")
         set_dir_action.triggered.connect(self.set_base_directory)
         file_menu.addAction(set_dir_action)
         
         # Open directory action
         open_dir_action = QAction("Open Data Directory", self)
-        open_dir_action.setIcon(self.style().standardIcon(QStyle.SP_DirOpenIcon))
+        open_dir_action.setIcon(_Icons.get(self.style(), QStyle.SP_DirOpenIcon))
         open_dir_action.setShortcut("Ctrl+O")
         open_dir_action.triggered.connect(self.open_work_directory)
         file_menu.addAction(open_dir_action)
@@ -351,28 +440,27 @@ class SegyRecover(QMainWindow):
         
         # How To action
         how_to_action = QAction("HOW TO", self)
-        how_to_action.setIcon(self.style().standardIcon(QStyle.SP_MessageBoxQuestion))
+        how_to_action.setIcon(_Icons.get(self.style(), QStyle.SP_MessageBoxQuestion))
         how_to_action.setShortcut("F1")
         how_to_action.triggered.connect(self.how_to)
         help_menu.addAction(how_to_action)
 
         help_menu.addSeparator()
         about_action = QAction("About", self)
-        about_action.setIcon(self.style().standardIcon(QStyle.SP_MessageBoxInformation))
+        about_action.setIcon(_Icons.get(self.style(), QStyle.SP_MessageBoxInformation))
         about_action.triggered.connect(self.show_about_dialog)
         help_menu.addAction(about_action)
 
     def open_work_directory(self):
         """Open the current work directory in the file explorer."""
+        import subprocess
         try:
             if os.path.exists(self.work_dir):
                 if os.name == 'nt':  # Windows
                     os.startfile(self.work_dir)
-                elif os.name == 'posix':  # macOS and Linux
-                    if os.uname().sysname == 'Darwin':  # macOS
-                        subprocess.run(['open', self.work_dir])
-                    else:  # Linux
-                        subprocess.run(['xdg-open', self.work_dir])
+                else:
+                    # Don't wait for the file manager to start
+                    subprocess.Popen([*_OPENER, self.work_dir])
                 info_message(self.console, f"Opened data directory: {self.work_dir}")
             else:
                 QMessageBox.warning(self, "Directory Not Found", 
@@ -399,26 +487,30 @@ class SegyRecover(QMainWindow):
             else:
                 # Use default if dialog was canceled
                 base_dir = default_base_dir
+            dialog.deleteLater()
                 
             # Create a new config file
             config = {'base_dir': base_dir}
         else:
-            # Load existing config
-            try:
-                with open(self.config_path, 'r') as f:
-                    config = json.load(f)
-                    base_dir = config.get('base_dir', default_base_dir)
-            except Exception as e:
-                base_dir = default_base_dir
-                config = {'base_dir': base_dir}
-                print(f"Error loading config: {e}")
+            # Load existing config, reusing the parsed copy when available
+            config = SegyRecover._config_cache
+            if config is None:
+                try:
+                    with open(self.config_path, 'r') as f:
+                        config = json.load(f)
+                    SegyRecover._config_cache = config
+                except Exception as e:
+                    config = {'base_dir': default_base_dir}
+                    print(f"Error loading config: {e}")
+            base_dir = config.get('base_dir', default_base_dir)
             
         # Set work_dir to base_dir
         self.base_dir = base_dir
         self.work_dir = base_dir
         
         # Create base directory if it doesn't exist
-        os.makedirs(self.base_dir, exist_ok=True)
+        if not os.path.isdir(self.base_dir):
+            os.makedirs(self.base_dir, exist_ok=True)
         
         self.create_required_folders()
         
@@ -438,16 +530,38 @@ class SegyRecover(QMainWindow):
         config = {
             'base_dir': self.base_dir
         }
+        payload = json.dumps(config)
         try:
+            # Skip the write when the file already holds this configuration
+            try:
+                with open(self.config_path, 'r') as f:
+                    if f.read() == payload:
+                        SegyRecover._config_cache = config
+                        return
+            except OSError:
+                pass
+            
             # Ensure the config directory exists
-            os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
-            with open(self.config_path, 'w') as f:
-                json.dump(config, f)
+            config_dir = os.path.dirname(self.config_path)
+            if not os.path.isdir(config_dir):
+                os.makedirs(config_dir, exist_ok=True)
+            
+            # Write to a temporary file and swap it in, so a crash mid-write
+            # never leaves a truncated config behind
+            tmp_path = self.config_path + '.tmp'
+            with open(tmp_path, 'w', buffering=8192) as f:
+                f.write(payload)
+            os.replace(tmp_path, self.config_path)
+            SegyRecover._config_cache = config
         except Exception as e:
-            if hasattr(self, 'console'):
-                self.console.append(f"Error saving configuration: {str(e)}")
-            else:
-                print(f"Error saving configuration: {str(e)}")
+            logger.error(f"Error saving configuration: {str(e)}")
+             
+    def _config_file_changed(self, path):
+        """Invalidate the cached config after config.json changes on disk."""
+        SegyRecover._config_cache = None
+        # Replacing the file drops it from the watcher, so watch it again
+        if os.path.exists(path) and path not in self._config_watcher.files():
+            self._config_watcher.addPath(path)
              
     def set_base_directory(self):
         """Let the user choose the base directory for data storage."""
@@ -464,7 +578,7 @@ class SegyRecover(QMainWindow):
             self.save_config()
             
             # Update UI with path
-            self.console.append(f"Data directory changed to: {self.work_dir}")
+            logger.info(f"Data directory changed to: {self.work_dir}")
             
             # Create required folders in new directory
             self.create_required_folders()
@@ -495,29 +609,40 @@ class SegyRecover(QMainWindow):
                 
                 if os.path.exists(src_folder):
                     # Create target folder if it doesn't exist
-                    os.makedirs(dst_folder, exist_ok=True)
+                    if not os.path.isdir(dst_folder):
+                        os.makedirs(dst_folder, exist_ok=True)
                     
-                    # Move all files from source to target
-                    for item in os.listdir(src_folder):
-                        src_item = os.path.join(src_folder, item)
-                        dst_item = os.path.join(dst_folder, item)
-                        if os.path.isfile(src_item):
-                            shutil.move(src_item, dst_item)
+                    # Move all files from source to target; scandir gives the
+                    # file type without an extra stat, and a rename is tried
+                    # first so files on the same filesystem are not copied
+                    with os.scandir(src_folder) as it:
+                        entries = [entry for entry in it if entry.is_file()]
+                    for entry in entries:
+                        dst_item = os.path.join(dst_folder, entry.name)
+                        try:
+                            os.replace(entry.path, dst_item)
+                        except OSError:
+                            shutil.move(entry.path, dst_item)
             
-            self.console.append("Data moved successfully to new location")
+            logger.info("Data moved successfully to new location")
         except Exception as e:
-            self.console.append(f"Error moving data: {str(e)}")
+            logger.error(f"Error moving data: {str(e)}")
             QMessageBox.warning(self, "Move Error", f"Error moving data: {str(e)}")
 
     def how_to(self):
         """Show help dialog with information about the application."""
-        help_dialog = HelpDialog(self)
-        help_dialog.show()
+        # Build the dialog once and reuse it on later requests
+        if self._help_dialog is None:
+            self._help_dialog = HelpDialog(self)
+        self._help_dialog.show()
+        self._help_dialog.raise_()
 
     def show_about_dialog(self):
         """Show the About dialog."""
-        about_dialog = AboutDialog(self)
-        about_dialog.show()
+        if self._about_dialog is None:
+            self._about_dialog = AboutDialog(self)
+        self._about_dialog.show()
+        self._about_dialog.raise_()
 
     def restart_process(self):
         """Restart the application by closing windows and resetting state."""
@@ -551,17 +676,19 @@ class SegyRecover(QMainWindow):
         # Main folders needed for the application
         required_folders = ['IMAGES', 'GEOMETRY', 'SEGY', 'ROI', 'PARAMETERS', 'LOG']
         
+        # List the work directory once and only create the missing folders
+        existing = set(os.listdir(self.work_dir)) if os.path.isdir(self.work_dir) else set()
+        
         # Create each folder in the script directory
         for folder in required_folders:
+            if folder in existing:
+                continue
             folder_path = os.path.join(self.work_dir, folder)
             try:
                 os.makedirs(folder_path, exist_ok=True)
-                self.console.append(f"Folder created: {folder_path}") if hasattr(self, 'console') else None
+                logger.info(f"Folder created: {folder_path}")
             except Exception as e:
-                if hasattr(self, 'console'):
-                    self.console.append(f"Error creating folder {folder_path}: {str(e)}")
-                else:
-                    print(f"Error creating folder {folder_path}: {str(e)}")
+                logger.error(f"Error creating folder {folder_path}: {str(e)}")
 
     def closeEvent(self, event):
         """Handle application close event."""
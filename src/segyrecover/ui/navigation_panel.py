@@ -4,7 +4,7 @@ from PySide6.QtCore import Qt, Signal, QSize
 from PySide6.QtGui import QIcon, QFont
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QPushButton, QLabel, 
-    QFrame, QSizePolicy, QStyle
+    QFrame, QSizePolicy, QStyle, QButtonGroup
 )
 
 class NavButton(QPushButton):
@@ -28,9 +28,6 @@ class NavButton(QPushButton):
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.setMinimumHeight(36)  # Ensure minimum touchable height
         
-        # Set text alignment and word wrapping for better display
-        self.setStyleSheet("text-align: left; padding: 4px 8px;")
-        
 class NavigationPanel(QWidget):
     """Side navigation panel with workflow steps."""
     
@@ -76,8 +73,10 @@ class NavigationPanel(QWidget):
         nav_layout.setContentsMargins(4, 8, 4, 8)  # Reduced margins
         nav_layout.setSpacing(2)  # Reduced spacing
         
-        # Create navigation buttons
+        # Create navigation buttons; the group keeps exactly one checked
         self.nav_buttons = {}
+        self.nav_group = QButtonGroup(self)
+        self.nav_group.setExclusive(True)
         
         # Define the navigation items with display names and internal identifiers
         nav_items = [
@@ -95,6 +94,7 @@ class NavigationPanel(QWidget):
             btn.setObjectName(f"nav_{identifier}")
             btn.clicked.connect(lambda checked, id=identifier: self._handle_navigation(id))
             nav_layout.addWidget(btn)
+            self.nav_group.addButton(btn)
             self.nav_buttons[identifier] = btn
         
         # Add spacer at the bottom
@@ -124,8 +124,8 @@ class NavigationPanel(QWidget):
     
     def set_active(self, identifier):
         """Set the active navigation button."""
-        for button_id, button in self.nav_buttons.items():
-            button.setChecked(button_id == identifier)
+        if identifier in self.nav_buttons:
+            self.nav_buttons[identifier].setChecked(True)
 
     def enable_tab(self, identifier, enabled=True):
         """Enable or disable a specific tab button."""
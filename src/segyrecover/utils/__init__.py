@@ -8,3 +8,7 @@ from .console_utils import (
 )
 
 from .resource_utils import copy_tutorial_files
+from .window_utils import screen_size, window_geometry, centered_geometry, device_pixel_ratio, hidpi_pixmap
+from .cache_utils import cache_path, load_geometry
+from .plot_utils import select_label_indices
+from .image_utils import to_uint8
@@ -0,0 +1,47 @@
+"""Parsed-file cache for SEGYRecover, kept in the work directory's CACHE folder."""
+import os
+import hashlib
+
+import numpy as np
+
+from .console_utils import info_message
+
+def cache_path(work_dir, source_path, extension):
+    """Return the cache file for source_path and whether it is newer than the source."""
+    key = hashlib.md5(os.path.abspath(source_path).encode()).hexdigest()
+    path = os.path.join(work_dir, "CACHE", key + extension)
+    try:
+        is_fresh = os.stat(path).st_mtime >= os.stat(source_path).st_mtime
+    except OSError:
+        is_fresh = False
+    return path, is_fresh
+
+def write_cache(path, write, console=None):
+    """Call write(path); a failed write only costs the speed-up."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        write(path)
+    except Exception as e:
+        if console is not None:
+            info_message(console, f"Could not write cache file: {str(e)}")
+
+def load_geometry(work_dir, geometry_file, console=None):
+    """
+    Return the CDP labels, X and Y columns of a geometry file as arrays.
+
+    The text is parsed once and cached as .npz, so loading the image and
+    assigning coordinates to the SEGY traces share a single parse.
+    """
+    path, is_fresh = cache_path(work_dir, geometry_file, ".npz")
+    if is_fresh:
+        try:
+            with np.load(path) as cached:
+                return cached["cdp"], cached["x"], cached["y"]
+        except Exception:
+            pass
+
+    data = np.loadtxt(geometry_file, dtype=[('cdp', 'U16'), ('x', 'f8'), ('y', 'f8')],
+                      usecols=(0, 1, 2), ndmin=1)
+    cdp, x, y = data['cdp'], data['x'], data['y']
+    write_cache(path, lambda p: np.savez(p, cdp=cdp, x=x, y=y), console)
+    return cdp, x, y
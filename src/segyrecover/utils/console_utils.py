@@ -52,56 +52,57 @@ def timestamp():
 def section_header(console, title):
     """Print a section header with formatting (bold title).
 
-    Uses HTML formatting for QTextEdit.
+    Uses HTML formatting; each message is appended to the QPlainTextEdit
+    console as its own block so the console's block limit applies.
     """
-    message = f'<br><br><b><span style="font-size:11pt;">{title.upper()}</span></b><br><br>'
-    console.insertHtml(message)
+    message = f'<br><b><span style="font-size:11pt;">{title.upper()}</span></b><br><br>'
+    console.appendHtml(message)
     _write_to_log(f"\n\n{title.upper()} ")
 
 def success_message(console, message):
     """Print a success message."""
-    formatted = f'<br><span style="color:green;">&#10003; {message}</span><br>'
-    console.insertHtml(formatted)
+    formatted = f'<span style="color:green;">&#10003; {message}</span><br>'
+    console.appendHtml(formatted)
     _write_to_log(f"\n✓{message}")
 
 def error_message(console, message):
     """Print an error message."""
-    formatted = f'<br><span style="color:red;"><b>&#10060; ERROR:</b> {message}</span><br>'
-    console.insertHtml(formatted)
+    formatted = f'<span style="color:red;"><b>&#10060; ERROR:</b> {message}</span><br>'
+    console.appendHtml(formatted)
     _write_to_log(f"\n❌ERROR: {message}")
 
 def warning_message(console, message):
     """Print a warning message."""
-    formatted = f'<br><span style="color:orange;"><b>&#9888; WARNING:</b> {message}</span><br>'
-    console.insertHtml(formatted)
+    formatted = f'<span style="color:orange;"><b>&#9888; WARNING:</b> {message}</span><br>'
+    console.appendHtml(formatted)
     _write_to_log(f"\n⚠️WARNING: {message}")
 
 def info_message(console, message):
     """Print an info message."""
-    formatted = f'<br>{message}<br>'
-    console.insertHtml(formatted)
+    formatted = f'{message}<br>'
+    console.appendHtml(formatted)
     _write_to_log(f"\n{message}")
 
 def progress_message(console, step, total, message):
     """Print a progress message with step count."""
     if total:
-        formatted = f'<br><span style="color:blue;">[{step}/{total}] {message}</span><br>'
+        formatted = f'<span style="color:blue;">[{step}/{total}] {message}</span><br>'
     else:
-        formatted = f'<br>{message}<br>'
-    console.insertHtml(formatted)
+        formatted = f'{message}<br>'
+    console.appendHtml(formatted)
     _write_to_log(f"\n[{step}/{total}] {message}" if total else f"\n{message}")
 
 def summary_statistics(console, stats_dict):
     """Print summary statistics."""
-    header = f'<br><b><span style="font-size:11pt;">SUMMARY STATISTICS</span></b><br>'
-    console.insertHtml(header)
+    header = f'<b><span style="font-size:11pt;">SUMMARY STATISTICS</span></b><br>'
+    console.appendHtml(header)
     _write_to_log("\nSUMMARY STATISTICS ")
 
     for key, value in stats_dict.items():
-        item = f'<br>&nbsp;&nbsp;&bull; <b>{key}:</b> {value}<br>'
-        console.insertHtml(item)
+        item = f'&nbsp;&nbsp;&bull; <b>{key}:</b> {value}<br>'
+        console.appendHtml(item)
         _write_to_log(f"  • {key}: {value}")
 
-    console.insertHtml("<br>")
+    console.appendPlainText("")
     _write_to_log("")
 
@@ -0,0 +1,10 @@
+"""Image helpers for SEGYRecover."""
+
+import numpy as np
+
+def to_uint8(image):
+    """Return the image as 8-bit grayscale, scaling only non-uint8 data."""
+    if image.dtype == np.uint8:
+        return image
+    low, high = float(image.min()), float(image.max())
+    return ((image - low) * (255.0 / max(high - low, 1e-9))).astype(np.uint8)
@@ -0,0 +1,36 @@
+"""Plot helpers shared by the location views of SEGYRecover."""
+
+def select_label_indices(x, y, threshold, keep_ends=False):
+    """Return indices of points to label, each farther than threshold from earlier labels.
+    
+    Labelled points are bucketed on a grid of threshold-sized cells, so each
+    point is only compared against labels in its 3x3 cell neighbourhood.
+    With keep_ends the first and last points are always labelled and seed
+    the grid before the points in between are checked.
+    """
+    if len(x) == 0:
+        return []
+    
+    cells = {}
+    selected = []
+    
+    def label(i):
+        px, py = x[i], y[i]
+        cells.setdefault((int(px // threshold), int(py // threshold)), []).append((px, py))
+        selected.append(i)
+    
+    if keep_ends:
+        for i in sorted({0, len(x) - 1}):
+            label(i)
+        candidates = range(1, len(x) - 1)
+    else:
+        candidates = range(len(x))
+    
+    for i in candidates:
+        px, py = x[i], y[i]
+        cx, cy = int(px // threshold), int(py // threshold)
+        if all((px - qx) ** 2 + (py - qy) ** 2 > threshold ** 2
+               for dx in (-1, 0, 1) for dy in (-1, 0, 1)
+               for qx, qy in cells.get((cx + dx, cy + dy), ())):
+            label(i)
+    return sorted(selected)
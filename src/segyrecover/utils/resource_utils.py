@@ -29,12 +29,12 @@ def copy_tutorial_files(base_dir):
                     # Create destination folder if it doesn't exist
                     os.makedirs(dst_folder, exist_ok=True)
                     
-                    # Copy files from source folder to destination folder
-                    for file in os.listdir(src_folder):
-                        src_path = os.path.join(src_folder, file)
-                        dst_path = os.path.join(dst_folder, file)
-                        if os.path.isfile(src_path):
-                            shutil.copy2(src_path, dst_path)
+                    # Copy files from source folder to destination folder;
+                    # scandir entries carry the file type, avoiding a stat per file
+                    with os.scandir(src_folder) as it:
+                        entries = [entry for entry in it if entry.is_file()]
+                    for entry in entries:
+                        shutil.copy2(entry.path, os.path.join(dst_folder, entry.name))
             print(f"Tutorial files copied successfully from {tutorial_dir}")
         else:
             print(f"Tutorial directory not found: {tutorial_dir}")
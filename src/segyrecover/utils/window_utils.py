@@ -0,0 +1,57 @@
+"""Window sizing and screen utilities for SEGYRecover."""
+import functools
+
+from PySide6.QtGui import QPixmap
+from PySide6.QtWidgets import QApplication
+
+# Largest screen area windows are sized against
+MAX_SCREEN_WIDTH = 1920
+MAX_SCREEN_HEIGHT = 1080
+
+@functools.lru_cache(maxsize=1)
+def screen_size():
+    """
+    Return the primary screen size, capped at 1920x1080.
+
+    The value is looked up once per session and shared by every window.
+    """
+    screen = QApplication.primaryScreen().geometry()
+    return min(screen.width(), MAX_SCREEN_WIDTH), min(screen.height(), MAX_SCREEN_HEIGHT)
+
+def window_geometry(width_frac, height_frac, pos=None):
+    """
+    Return (x, y, width, height) for a window sized as a fraction of the screen.
+
+    Args:
+        width_frac (float): Window width as a fraction of the screen width
+        height_frac (float): Window height as a fraction of the screen height
+        pos (tuple, optional): Fixed (x, y) position; the window is centered if omitted
+    """
+    screen_width, screen_height = screen_size()
+    window_width = int(screen_width * width_frac)
+    window_height = int(screen_height * height_frac)
+    if pos is None:
+        return centered_geometry(window_width, window_height)
+    return pos[0], pos[1], window_width, window_height
+
+def centered_geometry(width, height):
+    """Return (x, y, width, height) for a window of fixed size centered on the screen."""
+    screen_width, screen_height = screen_size()
+    return (screen_width - width) // 2, (screen_height - height) // 2, width, height
+
+@functools.lru_cache(maxsize=1)
+def device_pixel_ratio():
+    """Return the primary screen's device pixel ratio (e.g. 1.5 at 150% scaling)."""
+    return QApplication.primaryScreen().devicePixelRatio()
+
+def hidpi_pixmap(width, height):
+    """
+    Return a pixmap of the given logical size backed by device pixels.
+
+    Painting uses logical coordinates as usual; the pixmap is simply rendered
+    at the screen's resolution so diagrams stay sharp on HiDPI displays.
+    """
+    ratio = device_pixel_ratio()
+    pixmap = QPixmap(round(width * ratio), round(height * ratio))
+    pixmap.setDevicePixelRatio(ratio)
+    return pixmap